@@ -0,0 +1,70 @@
+"""
+Compares HistGradientBoostingStrategy against RandomForestStrategy.
+
+Reports fit time, single-row and batch predict latency, and pickled artifact size.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_hist_gradient_boosting --rows 100000
+    python -m benchmarks.bench_hist_gradient_boosting --data src/Data/Housing.csv
+"""
+import argparse
+import json
+import pickle
+import time
+
+import pandas as pd
+from src.data_splitter import SimpleTrainTestSplit
+from src.model_building import HistGradientBoostingStrategy, RandomForestStrategy
+from src.model_evaluator import ModelEvaluator, RegressionModelEvaluationStrategy
+from src.synthetic_data import generate_housing_data
+
+
+def benchmark(strategy, X_train, X_test, y_train, y_test, repeats=20) -> dict:
+    start = time.perf_counter()
+    pipeline = strategy.build_and_train_model(X_train, y_train)
+    fit_time = time.perf_counter() - start
+
+    single_row = X_test.iloc[:1]
+    pipeline.predict(single_row)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        pipeline.predict(single_row)
+    single_row_latency = (time.perf_counter() - start) / repeats
+
+    start = time.perf_counter()
+    pipeline.predict(X_test)
+    batch_time = time.perf_counter() - start
+
+    metrics = ModelEvaluator(RegressionModelEvaluationStrategy()).evaluate(pipeline, X_test, y_test)
+    return {
+        "strategy": type(strategy).__name__,
+        "fit_time_s": fit_time,
+        "single_row_latency_ms": 1000 * single_row_latency,
+        "batch_latency_us_per_row": 1e6 * batch_time / len(X_test),
+        "artifact_size_mb": len(pickle.dumps(pipeline, protocol=pickle.HIGHEST_PROTOCOL)) / 1e6,
+        **metrics,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000, help="Synthetic rows when --data is not given.")
+    parser.add_argument("--data", help="CSV with the Housing schema to benchmark on instead.")
+    parser.add_argument("--output", help="Optional JSON file for the results.")
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.data) if args.data else generate_housing_data(args.rows)
+    X_train, X_test, y_train, y_test = SimpleTrainTestSplit().split_data(df, "price")
+
+    results = [
+        benchmark(strategy, X_train, X_test, y_train, y_test)
+        for strategy in (RandomForestStrategy(), HistGradientBoostingStrategy())
+    ]
+    print(pd.DataFrame(results).to_string(index=False))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
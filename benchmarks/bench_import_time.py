@@ -0,0 +1,112 @@
+"""
+Import-time budget check for the CLI entry points and hot modules.
+
+Every target is imported in a fresh interpreter with `python -X importtime`; its cumulative
+import time is compared with a budget, and modules that must stay lazy (plotting, mlflow,
+the ZenML steps) must not have been loaded. The script exits with status 1 when a budget or a
+laziness rule is broken, so it can gate CI. A target that fails to import (a missing
+dependency included) or a command that exits with a nonzero status is a failure too.
+`run_deployement.py --stop-service` queries the active stack's model deployer, so it needs
+an initialized ZenML stack with the MLflow deployer.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_import_time [--scale 2.0]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+import pandas as pd
+
+# target -> (budget in ms, modules that must not be imported as a side effect)
+BUDGETS = {
+    "run_deployement": (150, ["zenml", "mlflow", "pandas", "sklearn", "matplotlib", "seaborn"]),
+    "run_pipeline": (150, ["zenml", "mlflow", "pandas", "sklearn", "matplotlib", "seaborn"]),
+    "src.pipelines.training_pipeline": (3000, ["mlflow", "matplotlib", "seaborn", "sklearn", "src.steps.model_building_step"]),
+    "src.pipelines.deployment_pipeline": (3000, ["mlflow", "matplotlib", "seaborn", "sklearn", "src.steps.predictor"]),
+    "src.outlier_detection": (1000, ["matplotlib", "seaborn", "scipy"]),
+    "src.payload_codec": (1000, ["sklearn", "mlflow"]),
+    "src.model_signature": (1000, ["sklearn"]),
+    "src.prediction_server": (1500, ["fastapi", "uvicorn", "sklearn", "mlflow"]),
+}
+
+# (command line, budget in ms) measured as wall time of the whole process; --stop-service
+# imports ZenML and the MLflow integration and queries the deployer, but no pipeline or step
+COMMANDS = [
+    ([sys.executable, "run_deployement.py", "--help"], 500),
+    ([sys.executable, "run_deployement.py", "--stop-service"], 5000),
+    ([sys.executable, "run_pipeline.py", "--help"], 500),
+]
+
+_PROBE = "import sys; import {target}; print(','.join(m for m in {forbidden!r} if m in sys.modules))"
+
+
+def measure_import(target: str, forbidden: list) -> dict:
+    """Imports target in a fresh interpreter; returns its cumulative import time and leaked modules."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(target=target, forbidden=forbidden)],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [os.getcwd(), os.environ.get("PYTHONPATH")]))},
+    )
+    if result.returncode != 0:
+        last_line = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "failed"
+        return {"status": "failed", "detail": last_line}
+
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if line.startswith("import time:") and line.rsplit("|", 1)[-1].strip() == target:
+            cumulative_us = int(line.split("|")[1])
+    leaked = [m for m in result.stdout.strip().split(",") if m]
+    return {"status": "ok", "import_ms": (cumulative_us or 0) / 1000, "leaked": leaked}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier applied to every budget (slow machines).")
+    args = parser.parse_args()
+
+    rows, failed = [], False
+    for target, (budget_ms, forbidden) in BUDGETS.items():
+        measurement = measure_import(target, forbidden)
+        budget_ms *= args.scale
+        if measurement["status"] == "failed":
+            failed = True
+            rows.append({"target": target, "ms": None, "budget_ms": budget_ms, "result": "FAIL", "detail": measurement["detail"]})
+            continue
+        over = measurement["import_ms"] > budget_ms
+        leaked = measurement["leaked"]
+        failed |= over or bool(leaked)
+        result = "FAIL" if over or leaked else "ok"
+        detail = f"eagerly imports {', '.join(leaked)}" if leaked else ""
+        rows.append({"target": target, "ms": measurement["import_ms"], "budget_ms": budget_ms, "result": result, "detail": detail})
+
+    for command, budget_ms in COMMANDS:
+        budget_ms *= args.scale
+        start = time.perf_counter()
+        completed = subprocess.run(command, capture_output=True)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        over = elapsed_ms > budget_ms
+        failed |= over or bool(completed.returncode)
+        stderr = completed.stderr.decode().strip()
+        detail = f"exit status {completed.returncode}: {stderr.splitlines()[-1] if stderr else ''}" if completed.returncode else ""
+        rows.append(
+            {
+                "target": " ".join(command[1:]),
+                "ms": elapsed_ms,
+                "budget_ms": budget_ms,
+                "result": "FAIL" if over or completed.returncode else "ok",
+                "detail": detail,
+            }
+        )
+
+    with pd.option_context("display.max_colwidth", 80, "display.width", 200):
+        print(pd.DataFrame(rows).to_string(index=False))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
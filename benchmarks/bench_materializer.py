@@ -0,0 +1,120 @@
+"""
+Compares DataFrameMaterializer with ZenML's default pandas materializer.
+
+A synthetic Housing-schema frame (1M rows by default) is saved and loaded by ZenML's
+PandasMaterializer (gzip Parquet) and by src.materializers.dataframe_materializer, uncompressed
+(memory-mapped, the local artifact store default) and zlib-compressed (the remote store
+default). Reported per variant: save time, artifact size, load time, load followed by a full
+scan of every column (a memory-mapped load defers the reads to first access), and the peak
+RSS increase of load + scan. Loaded frames are checked against the original.
+
+Both materializers write to a temporary directory through a plain local-file store, as the
+local artifact store does, so no ZenML stack is needed (ZenML itself must be installed).
+
+Usage (from the repository root):
+    python -m benchmarks.bench_materializer --rows 1000000
+"""
+import argparse
+import builtins
+import gc
+import os
+import shutil
+import tempfile
+import time
+
+import pandas as pd
+from src.materializers.dataframe_materializer import COMPRESSION_ENV, DataFrameMaterializer
+from src.step_profiler import RSSMonitor
+from src.synthetic_data import generate_housing_data
+
+
+class LocalFiles:
+    """The subset of the artifact store interface the materializers use, on local paths."""
+
+    def open(self, path: str, mode: str = "r"):
+        return builtins.open(path, mode)
+
+    def exists(self, path: str) -> bool:
+        return os.path.exists(path)
+
+
+def default_materializer():
+    try:
+        from zenml.integrations.pandas.materializers.pandas_materializer import PandasMaterializer
+    except ImportError:
+        from zenml.materializers.pandas_materializer import PandasMaterializer
+    return PandasMaterializer
+
+
+def directory_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def scan(df: pd.DataFrame):
+    """Touches every value, as the next step would."""
+    for column in df.columns:
+        if df[column].dtype.kind in "biuf":
+            df[column].sum()
+        else:
+            df[column].value_counts()
+
+
+def benchmark(name: str, materializer_class, df: pd.DataFrame, compression: str = None, repeats: int = 3) -> dict:
+    if compression:
+        os.environ[COMPRESSION_ENV] = compression
+    else:
+        os.environ.pop(COMPRESSION_ENV, None)
+    uri = tempfile.mkdtemp(prefix="bench_materializer_")
+    try:
+        materializer = materializer_class(uri, artifact_store=LocalFiles())
+        start = time.perf_counter()
+        materializer.save(df)
+        save_s = time.perf_counter() - start
+
+        load_times, load_scan_times = [], []
+        for _ in range(repeats):
+            gc.collect()
+            start = time.perf_counter()
+            loaded = materializer.load(pd.DataFrame)
+            load_times.append(time.perf_counter() - start)
+            scan(loaded)
+            load_scan_times.append(time.perf_counter() - start)
+            del loaded
+
+        gc.collect()
+        with RSSMonitor() as rss:
+            rss_before = rss.peak
+            loaded = materializer.load(pd.DataFrame)
+            scan(loaded)
+        pd.testing.assert_frame_equal(loaded, df, check_index_type=False, check_column_type=False)
+        return {
+            "materializer": name,
+            "save_s": save_s,
+            "size_mb": directory_size(uri) / 1e6,
+            "load_s": min(load_times),
+            "load_and_scan_s": min(load_scan_times),
+            "load_and_scan_rss_mb": (rss.peak - rss_before) / 1e6,
+        }
+    finally:
+        shutil.rmtree(uri, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    df = generate_housing_data(args.rows)
+    results = [
+        benchmark("PandasMaterializer (gzip Parquet)", default_materializer(), df, repeats=args.repeats),
+        benchmark("DataFrameMaterializer (mmap)", DataFrameMaterializer, df, "none", args.repeats),
+        benchmark("DataFrameMaterializer (zlib)", DataFrameMaterializer, df, "zlib", args.repeats),
+    ]
+    os.environ.pop(COMPRESSION_ENV, None)
+    print(f"{args.rows:,} rows, {df.memory_usage(deep=True).sum() / 1e6:.0f} MB in memory")
+    print(pd.DataFrame(results).to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Verifies that out-of-core training stays within its memory limit on a larger-than-limit CSV.
+
+A synthetic Housing-schema CSV is written chunk by chunk (so generating it is bounded too) with
+a fraction of 'area' values missing, sized by --rows; its parsed in-memory size is estimated
+from a sample and reported against --memory-limit-mb (it should be several times larger).
+src.out_of_core.OutOfCoreTrainer then runs ingestion, outlier filtering, splitting, missing
+value imputation, feature engineering, training and evaluation over the stream, while the peak
+resident set size is tracked. The peak increase over the RSS before training (interpreter and
+libraries excluded) must stay within the limit; the exit status is 1 otherwise.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_out_of_core --rows 10000000 --memory-limit-mb 256
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from src.out_of_core import OutOfCoreTrainer, estimate_chunksize
+from src.step_profiler import RSSMonitor, _rss_bytes
+from src.synthetic_data import generate_housing_data
+
+MISSING_VALUES = {"strategy": "mean"}
+FEATURE_ENGINEERING = [{"strategy": "log", "features": ["area"]}]
+
+
+def write_dataset(path: str, n_rows: int, missing_rate: float, chunk_rows: int = 500_000):
+    rng = np.random.default_rng(0)
+    written = 0
+    while written < n_rows:
+        df = generate_housing_data(min(chunk_rows, n_rows - written), random_state=written)
+        df["area"] = df["area"].astype(np.float64).mask(rng.random(len(df)) < missing_rate)
+        df.to_csv(path, mode="a" if written else "w", header=not written, index=False)
+        written += len(df)
+
+
+def parsed_size_mb(path: str, n_rows: int, sample_rows: int = 100_000) -> float:
+    """In-memory size of the whole file as one DataFrame, extrapolated from a sample."""
+    sample = pd.read_csv(path, nrows=sample_rows)
+    return sample.memory_usage(deep=True).sum() / len(sample) * n_rows / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--memory-limit-mb", type=float, default=256)
+    parser.add_argument("--missing-rate", type=float, default=0.01)
+    parser.add_argument("--epochs", type=int, default=1)
+    parser.add_argument("--data", help="CSV to (re)use instead of a temporary file")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated CSV")
+    args = parser.parse_args()
+
+    path = args.data or os.path.join(tempfile.mkdtemp(prefix="bench_out_of_core_"), "housing.csv")
+    try:
+        if not os.path.exists(path):
+            start = time.perf_counter()
+            write_dataset(path, args.rows, args.missing_rate)
+            print(f"Wrote {args.rows:,} rows to {path} in {time.perf_counter() - start:.0f}s")
+        n_rows = args.rows if not args.data else sum(1 for _ in open(path)) - 1
+        dataset_mb = parsed_size_mb(path, n_rows)
+        chunksize = estimate_chunksize(path, args.memory_limit_mb)
+        print(
+            f"{n_rows:,} rows: {os.path.getsize(path) / 1e6:,.0f} MB on disk, {dataset_mb:,.0f} MB in memory, "
+            f"{dataset_mb / args.memory_limit_mb:.1f}x the {args.memory_limit_mb:.0f} MB limit "
+            f"(chunks of {chunksize:,} rows)"
+        )
+
+        gc.collect()
+        rss_before = _rss_bytes()
+        start = time.perf_counter()
+        with RSSMonitor() as rss:
+            trainer = OutOfCoreTrainer(
+                path,
+                memory_limit_mb=args.memory_limit_mb,
+                missing_values=MISSING_VALUES,
+                feature_engineering=FEATURE_ENGINEERING,
+                n_epochs=args.epochs,
+            ).fit()
+        elapsed = time.perf_counter() - start
+        peak_mb = (rss.peak - rss_before) / 1e6
+
+        passes = pd.DataFrame(trainer.passes_)
+        passes["rows_per_s"] = passes["rows"] / passes["seconds"]
+        print(passes.to_string(index=False, float_format=lambda v: f"{v:,.1f}"))
+        print(f"Metrics: {trainer.metrics_}")
+        print(f"Total {elapsed:.0f}s, {n_rows / elapsed:,.0f} rows/s per pipeline run")
+        within = peak_mb <= args.memory_limit_mb
+        print(f"Peak RSS increase {peak_mb:,.0f} MB: {'within' if within else 'OVER'} the {args.memory_limit_mb:.0f} MB limit")
+        if dataset_mb < 3 * args.memory_limit_mb:
+            print("Warning: the dataset is less than 3x the limit; raise --rows for a meaningful check.")
+        if not within:
+            sys.exit(1)
+    finally:
+        if not args.data and not args.keep and os.path.exists(path):
+            os.remove(path)
+            os.rmdir(os.path.dirname(path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Microbenchmark of compiled pipelines against sklearn's Pipeline.predict.
+
+Trains the linear pipeline built by model_building_step (mean / most-frequent imputation,
+one-hot encoding, LinearRegression) and a scaled Ridge pipeline, compiles both with
+src.pipeline_compiler, checks them against pipeline.predict and times single-row and batch scoring.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_pipeline_compiler --rows 50000
+"""
+import argparse
+import timeit
+
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LinearRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder
+from src.model_building import RidgeStrategy
+from src.pipeline_compiler import compile_pipeline
+from src.synthetic_data import generate_housing_data
+
+
+def model_building_step_pipeline(X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+    """Same pipeline as the default path of model_building_step."""
+    categorical_cols = X_train.select_dtypes(include=["object", "category"]).columns
+    numerical_cols = X_train.select_dtypes(exclude=["object", "category"]).columns
+    preprocessor = ColumnTransformer(
+        transformers=[
+            ("num", SimpleImputer(strategy="mean"), numerical_cols),
+            (
+                "cat",
+                Pipeline(
+                    steps=[
+                        ("imputer", SimpleImputer(strategy="most_frequent")),
+                        ("onehot", OneHotEncoder(handle_unknown="ignore")),
+                    ]
+                ),
+                categorical_cols,
+            ),
+        ]
+    )
+    return Pipeline(steps=[("preprocessor", preprocessor), ("model", LinearRegression())]).fit(X_train, y_train)
+
+
+def time_call(function, number: int) -> float:
+    """Best-of-5 time per call in microseconds."""
+    return 1e6 * min(timeit.repeat(function, number=number, repeat=5)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50_000, help="Synthetic training rows.")
+    parser.add_argument("--batch", type=int, default=10_000, help="Rows per batch-scoring call.")
+    args = parser.parse_args()
+
+    df = generate_housing_data(args.rows)
+    X, y = df.drop(columns=["price"]), df["price"]
+    batch = X.iloc[: args.batch]
+    single_frame = X.iloc[[0]]
+    single_record = single_frame.iloc[0].to_dict()
+
+    results = []
+    for name, pipeline in (
+        ("model_building_step (LinearRegression)", model_building_step_pipeline(X, y)),
+        ("build_preprocessor + Ridge", RidgeStrategy().build_and_train_model(X, y)),
+    ):
+        compiled = compile_pipeline(pipeline, X_validation=batch)
+        sklearn_row = time_call(lambda: pipeline.predict(single_frame), 50)
+        compiled_row = time_call(lambda: compiled.predict_row(single_record), 5000)
+        sklearn_batch = time_call(lambda: pipeline.predict(batch), 3)
+        compiled_batch = time_call(lambda: compiled.predict(batch), 3)
+        results.append(
+            {
+                "pipeline": name,
+                "sklearn_single_row_us": sklearn_row,
+                "compiled_single_row_us": compiled_row,
+                "single_row_speedup": sklearn_row / compiled_row,
+                "sklearn_batch_us_per_row": sklearn_batch / len(batch),
+                "compiled_batch_us_per_row": compiled_batch / len(batch),
+                "batch_speedup": sklearn_batch / compiled_batch,
+            }
+        )
+    print(pd.DataFrame(results).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+Inference load generator and latency benchmark.
+
+Request rows are drawn from a HousingSynthesizer fitted on the training data (or on synthetic
+data when the CSV is missing). The target is driven either open-loop at a fixed request rate
+(--qps, Poisson arrivals) or closed-loop with a fixed number of concurrent callers
+(--concurrency). The target is one of:
+  * an HTTP endpoint: an MLflow scoring server (--protocol mlflow) or src.prediction_server
+    (--protocol binary; its /metrics server-side batch sizes are recorded too);
+  * a model loaded in-process (--model-uri), optionally behind a MicroBatcher (--micro-batch).
+
+Latency percentiles, throughput, errors and batch sizes are printed and written as JSON
+(--output), tagged with --label, so that model versions and server settings can be compared.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_serving_load --url http://127.0.0.1:8000/predict --protocol binary --qps 500
+    python -m benchmarks.bench_serving_load --model-uri model.joblib --concurrency 32 --micro-batch
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+from urllib.parse import urlsplit, urlunsplit
+
+import numpy as np
+import pandas as pd
+from src.synthetic_data import HousingSynthesizer, generate_housing_data
+
+
+def request_rows(data_path: str, target_column: str, n_rows: int, random_state: int) -> pd.DataFrame:
+    """Synthesizes request rows with the distribution of the training data."""
+    df = pd.read_csv(data_path) if os.path.isfile(data_path) else generate_housing_data(5_000, random_state)
+    features = df.drop(columns=[target_column], errors="ignore")
+    return HousingSynthesizer().fit(features).sample(n_rows, random_state)
+
+
+def metrics_url(url: str) -> str:
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, "/metrics", "", ""))
+
+
+async def fetch_server_metrics(url: str) -> dict:
+    import aiohttp
+
+    try:
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
+            async with session.get(metrics_url(url)) as response:
+                return await response.json() if response.status == 200 else None
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+        return None
+
+
+class InProcessTarget:
+    def __init__(self, model_uri: str, micro_batch: bool, max_batch_size: int, max_wait_ms: float):
+        from src.model_store import load_model
+        from src.prediction_server import MicroBatcher
+
+        self.model = load_model(model_uri)
+        self.batcher = MicroBatcher(self.model.predict, max_batch_size, max_wait_ms) if micro_batch else None
+
+    async def predict(self, frame: pd.DataFrame) -> np.ndarray:
+        if self.batcher is not None:
+            return await self.batcher.predict(frame)
+        return await asyncio.to_thread(self.model.predict, frame)
+
+    def server_metrics(self) -> dict:
+        if self.batcher is None:
+            return None
+        return {"batch_size": self.batcher.batch_sizes.snapshot(), "model_latency_ms": self.batcher.model_latency_ms.snapshot()}
+
+    async def close(self):
+        if self.batcher is not None:
+            await self.batcher.stop()
+
+
+class HTTPTarget:
+    def __init__(self, url: str, protocol: str, max_concurrency: int, rows_per_request: int, timeout_s: float):
+        from src.inference_client import AsyncInferenceClient
+
+        self.url = url
+        # No retries and no splitting: every call is exactly one measured request
+        self.client = AsyncInferenceClient(
+            url,
+            protocol=protocol,
+            max_concurrency=max_concurrency,
+            max_batch_rows=rows_per_request,
+            min_batch_rows=rows_per_request,
+            retries=0,
+            timeout_s=timeout_s,
+        )
+
+    async def predict(self, frame: pd.DataFrame) -> np.ndarray:
+        return await self.client.predict(frame)
+
+    def server_metrics(self) -> dict:
+        return None
+
+    async def close(self):
+        await self.client.close()
+
+
+async def run_load(target, requests: list, qps: float, concurrency: int, duration_s: float, random_state: int) -> dict:
+    latencies, errors = [], {}
+    n_sent = 0
+    deadline = time.perf_counter() + duration_s
+
+    async def call(frame: pd.DataFrame):
+        start = time.perf_counter()
+        try:
+            await target.predict(frame)
+            latencies.append(time.perf_counter() - start)
+        except Exception as e:
+            errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+
+    start = time.perf_counter()
+    if qps:
+        # Open loop: arrivals do not wait for responses, so queueing shows up in the latencies
+        rng = np.random.default_rng(random_state)
+        tasks, next_arrival = [], start
+        while next_arrival < deadline:
+            await asyncio.sleep(max(0.0, next_arrival - time.perf_counter()))
+            tasks.append(asyncio.create_task(call(requests[n_sent % len(requests)])))
+            n_sent += 1
+            next_arrival += rng.exponential(1 / qps)
+        await asyncio.gather(*tasks)
+    else:
+        # Closed loop: each caller sends its next request as soon as the previous one returns
+        async def caller(offset: int):
+            nonlocal n_sent
+            i = offset
+            while time.perf_counter() < deadline:
+                n_sent += 1
+                await call(requests[i % len(requests)])
+                i += concurrency
+
+        await asyncio.gather(*(caller(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies_ms = np.asarray(latencies) * 1000
+    percentiles = {f"p{q}": float(np.percentile(latencies_ms, q)) if len(latencies_ms) else None for q in (50, 90, 99, 99.9)}
+    rows_per_request = len(requests[0])
+    return {
+        "requests_sent": n_sent,
+        "requests_ok": len(latencies),
+        "errors": errors,
+        "error_rate": (n_sent - len(latencies)) / n_sent if n_sent else 0.0,
+        "elapsed_s": elapsed,
+        "throughput_rps": len(latencies) / elapsed,
+        "throughput_rows_per_s": len(latencies) * rows_per_request / elapsed,
+        "latency_ms": {
+            **percentiles,
+            "mean": float(latencies_ms.mean()) if len(latencies_ms) else None,
+            "max": float(latencies_ms.max()) if len(latencies_ms) else None,
+        },
+    }
+
+
+async def main_async(args) -> dict:
+    rows = request_rows(args.data, args.target_column, args.rows_per_request * args.distinct_requests, args.seed)
+    requests = [rows.iloc[i:i + args.rows_per_request].reset_index(drop=True) for i in range(0, len(rows), args.rows_per_request)]
+
+    if args.url:
+        target = HTTPTarget(args.url, args.protocol, max(args.concurrency, 256 if args.qps else 1),
+                            args.rows_per_request, args.timeout_s)
+    else:
+        target = InProcessTarget(args.model_uri, args.micro_batch, args.max_batch_size, args.max_wait_ms)
+
+    try:
+        if args.warmup_s:
+            await run_load(target, requests, args.qps, args.concurrency, args.warmup_s, args.seed)
+        server_before = await fetch_server_metrics(args.url) if args.url else None
+        results = await run_load(target, requests, args.qps, args.concurrency, args.duration_s, args.seed)
+        server_metrics = await fetch_server_metrics(args.url) if args.url else target.server_metrics()
+    finally:
+        await target.close()
+
+    return {
+        "label": args.label,
+        "target": args.url or args.model_uri,
+        "mode": {"qps": args.qps} if args.qps else {"concurrency": args.concurrency},
+        "rows_per_request": args.rows_per_request,
+        "duration_s": args.duration_s,
+        **results,
+        "server_metrics_before": server_before,
+        "server_metrics": server_metrics,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="Prediction endpoint URL.")
+    target.add_argument("--model-uri", help="Model scored in-process (file, MLflow URI or 'deployed').")
+    parser.add_argument("--protocol", choices=["mlflow", "binary"], default="mlflow")
+    parser.add_argument("--qps", type=float, default=0.0, help="Open-loop request rate; 0 uses --concurrency.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Closed-loop concurrent callers.")
+    parser.add_argument("--duration-s", type=float, default=30.0)
+    parser.add_argument("--warmup-s", type=float, default=3.0)
+    parser.add_argument("--rows-per-request", type=int, default=1)
+    parser.add_argument("--distinct-requests", type=int, default=10_000, help="Distinct synthetic requests cycled through.")
+    parser.add_argument("--micro-batch", action="store_true", help="In-process: score through a MicroBatcher.")
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    parser.add_argument("--timeout-s", type=float, default=10.0)
+    parser.add_argument("--data", default=os.path.join("src", "Data", "Housing.csv"), help="Training data to fit the request distribution on.")
+    parser.add_argument("--target-column", default="price")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--label", default="", help="Free-form tag stored with the results, e.g. the model version.")
+    parser.add_argument("--output", help="JSON file receiving the results.")
+    args = parser.parse_args()
+
+    results = asyncio.run(main_async(args))
+    summary = {key: results[key] for key in ("requests_ok", "error_rate", "throughput_rps", "throughput_rows_per_s")}
+    print(pd.Series({**summary, **{f"latency_{k}_ms": v for k, v in results["latency_ms"].items()}}).to_string())
+    if results["server_metrics"] and "batch_size" in results["server_metrics"]:
+        batch_sizes = results["server_metrics"]["batch_size"]
+        print(f"server batch size: mean {batch_sizes['mean']:.1f}, p50 {batch_sizes['p50']:.0f}, p99 {batch_sizes['p99']:.0f}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,409 @@
+"""
+Scaling benchmark of every strategy class on synthetic Housing-schema data.
+
+For each row count (1k to 10M by default) a synthetic frame is generated with
+src.synthetic_data.generate_housing_data, optionally widened with extra numeric columns and
+with missing values injected, and every strategy is timed on it: the ingestors (on CSV, zip,
+JSON files written beforehand), DropMissingValues and every FillMissingValues method, the
+feature engineering strategies, both outlier detectors, every splitter, every model strategy
+of src.model_building.MODEL_STRATEGIES and the regression evaluator.
+
+Time is the best of --repeats runs (a single run once a run takes more than 2s). Memory is
+measured in a separate run: the tracemalloc peak (Python and numpy allocations) and the peak
+RSS increase (also covers Arrow-backed strings and native buffers). Slow model strategies have a
+default row cap (see Case.max_rows; --no-caps lifts it). A case that raises is reported as an
+error and the run continues.
+
+The report shows time and memory per case and row count, and the scaling exponent of each case
+(slope of log time against log rows; 1.0 is linear). --save-baseline stores the results;
+later runs given --baseline flag every case whose time or memory grew by more than --tolerance
+and exit with status 1, so the suite can gate CI.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_strategies --rows 1000,10000,100000 --save-baseline benchmarks/strategies_baseline.json
+    python -m benchmarks.bench_strategies --rows 1000,10000,100000 --baseline benchmarks/strategies_baseline.json
+    python -m benchmarks.bench_strategies --only "fill_|outlier" --extra-columns 50 --plot scaling.png
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from functools import cached_property
+from typing import Any, Callable, List
+
+import numpy as np
+import pandas as pd
+from src.step_profiler import RSSMonitor
+from src.synthetic_data import generate_housing_data
+
+DEFAULT_ROWS = "1000,10000,100000,1000000,10000000"
+TARGET = "price"
+# A time or memory increase below these floors is noise, whatever the ratio
+MIN_TIME_DELTA_S = 0.01
+MIN_MEMORY_DELTA_MB = 2.0
+
+
+class Workload:
+    """Inputs of the strategies at one row count, built lazily and shared by the cases."""
+
+    def __init__(self, n_rows: int, extra_columns: int, missing_rate: float, seed: int, workdir: str):
+        self.n_rows = n_rows
+        self.extra_columns = extra_columns
+        self.missing_rate = missing_rate
+        self.seed = seed
+        self.workdir = workdir
+
+    @cached_property
+    def df(self) -> pd.DataFrame:
+        df = generate_housing_data(self.n_rows, self.seed)
+        rng = np.random.default_rng(self.seed + 1)
+        for i in range(self.extra_columns):
+            df[f"extra_{i}"] = rng.normal(size=self.n_rows)
+        return df
+
+    @cached_property
+    def df_missing(self) -> pd.DataFrame:
+        """df with missing_rate of the values of a few numeric and categorical columns blanked."""
+        df = self.df.copy()
+        rng = np.random.default_rng(self.seed + 2)
+        for column in ["area", "bedrooms", "parking", "furnishingstatus", "basement"]:
+            df.loc[rng.random(self.n_rows) < self.missing_rate, column] = np.nan
+        return df
+
+    @cached_property
+    def numeric_columns(self) -> pd.Index:
+        return self.df.select_dtypes(include=["number"]).columns
+
+    @cached_property
+    def split(self):
+        from src.data_splitter import SimpleTrainTestSplit
+
+        return SimpleTrainTestSplit().split_data(self.df, TARGET)
+
+    @cached_property
+    def X_train_encoded(self) -> pd.DataFrame:
+        """All-numeric training features, for LinearRegressionStrategy (scaler + model only)."""
+        return pd.get_dummies(self.split[0], dtype=np.float64)
+
+    @cached_property
+    def evaluation_model(self):
+        from src.model_building import RidgeStrategy
+
+        X_train, _, y_train, _ = self.split
+        return RidgeStrategy().build_and_train_model(X_train.iloc[:50_000], y_train.iloc[:50_000])
+
+    def file(self, extension: str) -> str:
+        """Writes df once in the given format and returns the path."""
+        path = os.path.join(self.workdir, f"housing_{self.n_rows}.{extension}")
+        if not os.path.exists(path):
+            if extension == "csv":
+                self.df.to_csv(path, index=False)
+            elif extension == "json":
+                self.df.to_json(path, orient="records")
+            elif extension == "zip":
+                with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+                    archive.write(self.file("csv"), arcname="Housing.csv")
+        return path
+
+
+class Case:
+    def __init__(self, name: str, group: str, prepare: Callable[[Workload], Callable[[], Any]], max_rows: int = None):
+        """
+        Parameters:
+        name (str): Unique case name, the key of baseline entries.
+        group (str): Strategy family, used to group the report and the plots.
+        prepare (callable): Builds the timed zero-argument call from a Workload (untimed).
+        max_rows (int): Largest row count run by default; larger ones are skipped.
+        """
+        self.name = name
+        self.group = group
+        self.prepare = prepare
+        self.max_rows = max_rows
+
+
+def _ingest(ingestor_factory: Callable, extension: str):
+    def prepare(w: Workload):
+        path = w.file(extension)
+
+        def run():
+            result = ingestor_factory().ingest(path)
+            if isinstance(result, str):
+                # The one-shot ingestors report errors as strings
+                raise RuntimeError(result)
+            if not isinstance(result, pd.DataFrame):
+                # Chunked ingestion: consume the stream
+                return sum(len(chunk) for chunk in result)
+            return result
+
+        return run
+
+    return prepare
+
+
+def build_cases() -> List[Case]:
+    from src.data_splitter import (
+        GroupResamplingSplit,
+        HashTrainTestSplit,
+        RandomUndersamplingSplit,
+        SimpleTrainTestSplit,
+        StratifiedTrainTestSplit,
+        TimeSeriesSplitStrategy,
+    )
+    from src.feature_engineering import LogTransformation, MinMaxScaling, OneHotEncoding, StandardScaling
+    from src.handle_missing_values import DropMissingValues, FillMissingValues
+    from src.ingest_data import ChunkedCSVDataIngestor, CSVDataIngestor, JSONDataIngestor, ZipDataIngestor
+    from src.model_building import MODEL_STRATEGIES
+    from src.model_evaluator import ModelEvaluator, RegressionModelEvaluationStrategy
+    from src.outlier_detection import IQROutlierDetection, OutlierDetector, ZScoreOutlierDetection
+
+    cases = [
+        Case("ingest_csv", "ingestion", _ingest(CSVDataIngestor, "csv")),
+        Case("ingest_csv_chunked", "ingestion", _ingest(ChunkedCSVDataIngestor, "csv")),
+        Case("ingest_zip", "ingestion", _ingest(ZipDataIngestor, "zip")),
+        Case("ingest_json", "ingestion", _ingest(JSONDataIngestor, "json")),
+        Case("drop_missing", "missing_values", lambda w: lambda: DropMissingValues().handle(w.df_missing)),
+    ]
+    for method, fill_value in [("mean", None), ("median", None), ("mode", None), ("constant", 0)]:
+        cases.append(Case(
+            f"fill_{method}", "missing_values",
+            lambda w, m=method, v=fill_value: lambda: FillMissingValues(method=m, fill_value=v).handle(w.df_missing),
+        ))
+
+    features = {
+        "log_transform": lambda: LogTransformation(features=["price", "area"]),
+        "standard_scaling": lambda: StandardScaling(features=["area", "bedrooms", "bathrooms", "stories"]),
+        "minmax_scaling": lambda: MinMaxScaling(features=["area", "bedrooms", "bathrooms", "stories"]),
+        "onehot_encoding": lambda: OneHotEncoding(features=["furnishingstatus", "mainroad"]),
+    }
+    for name, make in features.items():
+        cases.append(Case(name, "feature_engineering", lambda w, make=make: lambda: make().apply_transformation(w.df)))
+
+    for name, make in {"outlier_zscore": ZScoreOutlierDetection, "outlier_iqr": IQROutlierDetection}.items():
+        cases.append(Case(
+            name, "outliers",
+            lambda w, make=make: lambda: OutlierDetector(make()).handle_outliers(w.df, w.numeric_columns),
+        ))
+
+    # Class-based splitters need a discrete target: they split on furnishingstatus
+    splitters = {
+        "split_simple": (SimpleTrainTestSplit, TARGET),
+        "split_stratified": (StratifiedTrainTestSplit, "furnishingstatus"),
+        "split_time_series": (TimeSeriesSplitStrategy, TARGET),
+        "split_random_undersampling": (RandomUndersamplingSplit, "furnishingstatus"),
+        "split_hash": (HashTrainTestSplit, TARGET),
+        "split_group_resampling": (lambda: GroupResamplingSplit(n_bins=10), TARGET),
+    }
+    for name, (make, target) in splitters.items():
+        cases.append(Case(name, "splitters", lambda w, make=make, target=target: lambda: make().split_data(w.df, target)))
+
+    # Default caps keep the default 10M-row run to hours rather than days
+    model_caps = {"random_forest": 100_000, "gradient_boosting": 100_000, "random_forest_halving": 10_000}
+    for name, strategy_class in MODEL_STRATEGIES.items():
+        if name == "linear_regression":
+            prepare = lambda w, s=strategy_class: lambda: s().build_and_train_model(w.X_train_encoded, w.split[2])
+        else:
+            prepare = lambda w, s=strategy_class: lambda: s().build_and_train_model(w.split[0], w.split[2])
+        cases.append(Case(f"model_{name}", "models", prepare, max_rows=model_caps.get(name)))
+
+    cases.append(Case(
+        "evaluate_regression", "evaluation",
+        lambda w: lambda: ModelEvaluator(RegressionModelEvaluationStrategy()).evaluate(w.evaluation_model, w.split[1], w.split[3]),
+    ))
+    return cases
+
+
+def measure(run: Callable[[], Any], repeats: int, measure_memory: bool) -> dict:
+    times = []
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+        if times[-1] > 2.0:
+            break
+    result = {"time_s": min(times), "runs": len(times)}
+
+    if measure_memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            with RSSMonitor() as rss:
+                rss_before = rss.peak
+                run()
+            result["alloc_peak_mb"] = tracemalloc.get_traced_memory()[1] / 1e6
+        finally:
+            tracemalloc.stop()
+        result["rss_peak_increase_mb"] = (rss.peak - rss_before) / 1e6
+    return result
+
+
+def scaling_exponent(rows: List[int], values: List[float]) -> float:
+    """Least-squares slope of log(value) on log(rows), ignoring sub-millisecond timings."""
+    points = [(np.log(r), np.log(v)) for r, v in zip(rows, values) if v is not None and v > 1e-3]
+    if len(points) < 2:
+        return None
+    x, y = np.array(points).T
+    return float(np.polyfit(x, y, 1)[0])
+
+
+def run_suite(cases: List[Case], rows: List[int], args) -> List[dict]:
+    results = []
+    for n_rows in rows:
+        workdir = tempfile.mkdtemp(prefix="bench_strategies_")
+        workload = Workload(n_rows, args.extra_columns, args.missing_rate, args.seed, workdir)
+        try:
+            for case in cases:
+                record = {"case": case.name, "group": case.group, "rows": n_rows}
+                if case.max_rows and n_rows > case.max_rows and not args.no_caps:
+                    results.append({**record, "status": "skipped"})
+                    continue
+                try:
+                    run = case.prepare(workload)
+                    record.update(measure(run, args.repeats, not args.no_memory), status="ok")
+                except Exception as e:
+                    record.update(status="error", error=f"{type(e).__name__}: {e}"[:300])
+                print(
+                    f"{case.name:<28} {n_rows:>10,} rows  "
+                    + (f"{record['time_s']:9.4f}s" if record["status"] == "ok" else record["status"]),
+                    file=sys.stderr,
+                )
+                results.append(record)
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+            del workload
+            gc.collect()
+    return results
+
+
+def summarize(results: List[dict]) -> pd.DataFrame:
+    frame = pd.DataFrame([r for r in results if r["status"] == "ok"])
+    if frame.empty:
+        return frame
+    rows = sorted(frame["rows"].unique())
+    times = frame.pivot(index="case", columns="rows", values="time_s").reindex(columns=rows)
+    exponents = {
+        case: scaling_exponent(rows, [None if pd.isna(v) else v for v in times.loc[case]]) for case in times.index
+    }
+    summary = times.rename(columns=lambda r: f"time_s@{r:,}")
+    if "alloc_peak_mb" in frame:
+        memory = frame.pivot(index="case", columns="rows", values="alloc_peak_mb").reindex(columns=rows)
+        summary = summary.join(memory.rename(columns=lambda r: f"alloc_mb@{r:,}"))
+    summary["time_exponent"] = pd.Series(exponents)
+    order = list(dict.fromkeys(frame["case"]))
+    return summary.reindex(order)
+
+
+def compare_to_baseline(results: List[dict], baseline: dict, tolerance: float) -> List[dict]:
+    """Returns one entry per case and row count whose time or memory regressed."""
+    previous = {(r["case"], r["rows"]): r for r in baseline["results"] if r["status"] == "ok"}
+    regressions = []
+    for record in results:
+        before = previous.get((record["case"], record["rows"]))
+        if before is None:
+            continue
+        if record["status"] != "ok":
+            regressions.append({"case": record["case"], "rows": record["rows"], "metric": "status", "now": record["status"]})
+            continue
+        for metric, floor in [("time_s", MIN_TIME_DELTA_S), ("alloc_peak_mb", MIN_MEMORY_DELTA_MB)]:
+            if metric not in record or metric not in before:
+                continue
+            old, new = before[metric], record[metric]
+            if new > old * (1 + tolerance) and new - old > floor:
+                regressions.append({
+                    "case": record["case"], "rows": record["rows"], "metric": metric,
+                    "baseline": old, "now": new, "ratio": new / old if old else float("inf"),
+                })
+    return regressions
+
+
+def plot(results: List[dict], path: str):
+    # Plotting libraries are slow to import and only needed here
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    frame = pd.DataFrame([r for r in results if r["status"] == "ok"])
+    groups = list(dict.fromkeys(frame["group"]))
+    metrics = [m for m in ("time_s", "alloc_peak_mb") if m in frame]
+    fig, axes = plt.subplots(len(groups), len(metrics), figsize=(6 * len(metrics), 3.5 * len(groups)), squeeze=False)
+    for i, group in enumerate(groups):
+        for j, metric in enumerate(metrics):
+            ax = axes[i][j]
+            for case, points in frame[frame["group"] == group].groupby("case", sort=False):
+                ax.plot(points["rows"], points[metric], marker="o", label=case)
+            ax.set(xscale="log", yscale="log", xlabel="rows", ylabel=metric, title=group)
+            ax.legend(fontsize="small")
+    fig.tight_layout()
+    fig.savefig(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", default=DEFAULT_ROWS, help="Comma-separated row counts.")
+    parser.add_argument("--extra-columns", type=int, default=0, help="Extra numeric columns widening the frame.")
+    parser.add_argument("--missing-rate", type=float, default=0.05, help="Fraction of values blanked for the missing-value strategies.")
+    parser.add_argument("--only", help="Regular expression selecting case names or groups.")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="Skip the memory run.")
+    parser.add_argument("--no-caps", action="store_true", help="Run slow model strategies at every row count.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline", help="Baseline JSON to compare with.")
+    parser.add_argument("--save-baseline", help="Write the results as a baseline JSON.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative increase before flagging a regression.")
+    parser.add_argument("--output", help="JSON file receiving the results.")
+    parser.add_argument("--plot", help="PNG file receiving the scaling curves.")
+    args = parser.parse_args()
+    # The strategies log every call
+    logging.getLogger().setLevel(logging.WARNING)
+
+    rows = [int(float(r)) for r in args.rows.split(",")]
+    cases = build_cases()
+    if args.only:
+        cases = [c for c in cases if re.search(args.only, c.name) or re.search(args.only, c.group)]
+
+    config = {"extra_columns": args.extra_columns, "missing_rate": args.missing_rate, "seed": args.seed}
+    results = run_suite(cases, rows, args)
+    report = {"config": config, "results": results}
+
+    pd.set_option("display.width", 250)
+    print(summarize(results).to_string(float_format=lambda v: f"{v:.4g}"))
+    errors = [r for r in results if r["status"] == "error"]
+    for record in errors:
+        print(f"ERROR {record['case']} @ {record['rows']:,} rows: {record['error']}")
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("config") != config:
+            print(f"warning: baseline config {baseline.get('config')} differs from {config}")
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        report["regressions"] = regressions
+        for r in regressions:
+            detail = f"{r['baseline']:.4g} -> {r['now']:.4g} (x{r['ratio']:.2f})" if "ratio" in r else r["now"]
+            print(f"REGRESSION {r['case']} @ {r['rows']:,} rows, {r['metric']}: {detail}")
+        if not regressions:
+            print(f"No regression against {args.baseline} (tolerance {args.tolerance:.0%}).")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.plot:
+        plot(results, args.plot)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
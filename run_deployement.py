@@ -1,13 +1,4 @@
 import click
-from src.pipelines.deployment_pipeline import (
-    continuous_deployment_pipeline,
-    inference_pipeline,
-)
-from rich import print
-from zenml.integrations.mlflow.mlflow_utils import get_tracking_uri
-from zenml.integrations.mlflow.model_deployers.mlflow_model_deployer import (
-    MLFlowModelDeployer,
-)
 
 
 @click.command()
@@ -19,9 +10,16 @@ from zenml.integrations.mlflow.model_deployers.mlflow_model_deployer import (
 )
 def run_main(stop_service: bool):
     """Run the prices predictor deployment pipeline"""
+    # Only what each branch needs is imported: --stop-service never loads the pipelines
+    # or the steps, and --help loads nothing
     model_name = "prices_predictor"
 
     if stop_service:
+        # Stopped through the deployer, so ZenML records the service as stopped
+        from zenml.integrations.mlflow.model_deployers.mlflow_model_deployer import (
+            MLFlowModelDeployer,
+        )
+
         # Get the MLflow model deployer stack component
         model_deployer = MLFlowModelDeployer.get_active_model_deployer()
 
@@ -37,6 +35,16 @@ def run_main(stop_service: bool):
             existing_services[0].stop(timeout=10)
         return
 
+    from rich import print
+    from src.pipelines.deployment_pipeline import (
+        continuous_deployment_pipeline,
+        inference_pipeline,
+    )
+    from zenml.integrations.mlflow.mlflow_utils import get_tracking_uri
+    from zenml.integrations.mlflow.model_deployers.mlflow_model_deployer import (
+        MLFlowModelDeployer,
+    )
+
     # Run the continuous deployment pipeline
     continuous_deployment_pipeline()
 
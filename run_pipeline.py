@@ -1,15 +1,50 @@
 import click
-from src.pipelines.training_pipeline import ml_pipeline
-from zenml.integrations.mlflow.mlflow_utils import get_tracking_uri
 
 
 @click.command()
-def main():
+@click.option(
+    "--local",
+    is_flag=True,
+    default=False,
+    help="Run the steps in-process with the local runner (parallel branches, no orchestrator)",
+)
+@click.option(
+    "--out-of-core",
+    "out_of_core_file",
+    default=None,
+    help="Train on this CSV chunk by chunk, for datasets larger than memory",
+)
+@click.option(
+    "--memory-limit-mb",
+    default=512.0,
+    help="Memory the data may take at once with --out-of-core",
+)
+def main(local: bool, out_of_core_file: str, memory_limit_mb: float):
     """
     Run the ML pipeline and start the MLflow UI for experiment tracking.
     """
+    # Heavy imports are deferred so that --help returns immediately
+    from src.pipelines.training_pipeline import ml_pipeline
+    from zenml.integrations.mlflow.mlflow_utils import get_tracking_uri
+
+    pipeline, params = ml_pipeline, {}
+    if out_of_core_file:
+        from src.pipelines.out_of_core_pipeline import out_of_core_pipeline
+
+        pipeline = out_of_core_pipeline
+        params = {"file_path": out_of_core_file, "memory_limit_mb": memory_limit_mb}
+
+    if local:
+        from src.pipelines.local_runner import LocalPipelineRunner
+
+        runner = LocalPipelineRunner()
+        runner.run(pipeline, **params)
+        for step_name, seconds in runner.timings_.items():
+            print(f"{step_name}: {seconds:.2f}s")
+        return
+
     # Run the pipeline
-    run = ml_pipeline()
+    run = pipeline(**params)
     # You can uncomment and customize the following lines if you want to retrieve and inspect the trained model:
     # trained_model = run["model_building_step"]  # Replace with actual step name if different
     # print(f"Trained Model Type: {type(trained_model)}")
@@ -0,0 +1,141 @@
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List
+
+import numpy as np
+import pandas as pd
+from src.ingest_data import ChunkedCSVDataIngestor
+from src.model_signature import ModelSignature
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# Model of the current worker process, loaded once by _init_worker
+_worker_model = None
+
+
+def _init_worker(model_uri: str):
+    global _worker_model
+    from src.model_store import load_model
+
+    _worker_model = load_model(model_uri)
+
+
+def _score_chunk(frame: pd.DataFrame) -> np.ndarray:
+    return np.asarray(_worker_model.predict(frame), dtype=np.float64)
+
+
+def iter_file_chunks(input_path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    """
+    Streams a .csv or .parquet file as DataFrames of at most chunksize rows.
+    """
+    if input_path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(input_path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from ChunkedCSVDataIngestor(chunksize).ingest(input_path)
+
+
+# Bulk batch scorer
+# -----------------
+# The input is read chunk by chunk and every chunk is validated against the model signature
+# in the parent process, then scored in a process pool whose workers load the model once. At
+# most 2 x n_workers chunks are in flight, so memory stays bounded whatever the file size, and
+# predictions are appended to a Parquet file in input order as soon as they are available.
+class BatchScorer:
+    def __init__(self, model_uri: str, signature: ModelSignature, chunksize: int = 100_000,
+                 n_workers: int = None, passthrough_columns: List[str] = None):
+        """
+        Parameters:
+        model_uri (str): Model to score with, see src.model_store.load_model.
+        signature (ModelSignature): Schema every input chunk is validated and coerced to.
+        chunksize (int): Rows per chunk.
+        n_workers (int): Scoring processes, defaults to os.cpu_count().
+        passthrough_columns (list): Input columns (e.g. a listing id) copied to the output.
+        """
+        self.model_uri = model_uri
+        self.signature = signature
+        self.chunksize = chunksize
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.passthrough_columns = list(passthrough_columns or [])
+
+    def _output_table(self, chunk: pd.DataFrame, offset: int, predictions: np.ndarray):
+        import pyarrow as pa
+
+        columns = {"row": np.arange(offset, offset + len(chunk), dtype=np.int64)}
+        for column in self.passthrough_columns:
+            columns[column] = chunk[column].to_numpy()
+        columns["prediction"] = predictions
+        return pa.Table.from_pydict(columns)
+
+    def score(self, input_path: str, output_path: str) -> dict:
+        """
+        Scores every row of input_path and writes row, passthrough columns and prediction
+        to output_path (Parquet).
+
+        Returns:
+        dict: Rows scored, chunks, elapsed seconds and throughput in rows per second.
+        """
+        import pyarrow.parquet as pq
+        from src.model_store import resolve_model_uri
+
+        # Resolve 'deployed' once here rather than in every worker
+        model_uri = resolve_model_uri(self.model_uri)
+        start = time.perf_counter()
+        n_rows = n_chunks = 0
+        writer = None
+        pending = deque()
+
+        def write_oldest():
+            nonlocal writer, n_rows
+            chunk, offset, future = pending.popleft()
+            table = self._output_table(chunk, offset, future.result())
+            if writer is None:
+                writer = pq.ParquetWriter(output_path, table.schema)
+            writer.write_table(table)
+            n_rows += len(chunk)
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.n_workers, initializer=_init_worker, initargs=(model_uri,)
+            ) as executor:
+                offset = 0
+                for chunk in iter_file_chunks(input_path, self.chunksize):
+                    features = self.signature.coerce(chunk)
+                    pending.append((chunk, offset, executor.submit(_score_chunk, features)))
+                    offset += len(chunk)
+                    n_chunks += 1
+                    while len(pending) >= 2 * self.n_workers:
+                        write_oldest()
+                while pending:
+                    write_oldest()
+        finally:
+            if writer is not None:
+                writer.close()
+
+        elapsed = time.perf_counter() - start
+        report = {
+            "rows": n_rows,
+            "chunks": n_chunks,
+            "seconds": elapsed,
+            "rows_per_s": n_rows / elapsed if elapsed > 0 else 0.0,
+        }
+        logging.info(
+            f"Scored {n_rows} rows in {n_chunks} chunks in {elapsed:.1f}s "
+            f"({report['rows_per_s']:.0f} rows/s) to {output_path}."
+        )
+        return report
+
+
+# Example usage
+if __name__ == "__main__":
+    # signature = ModelSignature.load("model_signature.json")
+    # scorer = BatchScorer("deployed", signature, chunksize=200_000, passthrough_columns=["listing_id"])
+    # scorer.score("listings.csv", "predictions.parquet")
+
+    pass
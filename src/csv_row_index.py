@@ -0,0 +1,149 @@
+import io
+import logging
+import os
+from typing import Iterable, Union
+
+import numpy as np
+import pandas as pd
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+INDEX_SUFFIX = ".rowidx.npz"
+_BLOCK_SIZE = 1 << 24
+
+
+# Byte-offset row index over a CSV file
+# -------------------------------------
+# The start offset of every data row is computed once (a vectorized newline scan) and stored in
+# a sidecar file next to the CSV together with the file size and modification time; the index is
+# rebuilt whenever those change. Fetching k rows is then k seeks and readlines plus a parse of
+# just those lines, instead of a parse of the whole file. Rows must not contain quoted newlines.
+class CSVRowIndex:
+    def __init__(self, csv_path: str, index_path: str = None):
+        """
+        Parameters:
+        csv_path (str): The CSV file (with a header line).
+        index_path (str): Sidecar file, defaults to csv_path + ".rowidx.npz".
+        """
+        self.csv_path = csv_path
+        self.index_path = index_path or csv_path + INDEX_SUFFIX
+        self.header, self.offsets = self._load_or_build()
+
+    def _file_state(self) -> np.ndarray:
+        stat = os.stat(self.csv_path)
+        return np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+    def _load_or_build(self):
+        state = self._file_state()
+        if os.path.isfile(self.index_path):
+            try:
+                with np.load(self.index_path) as index:
+                    if np.array_equal(index["state"], state):
+                        return index["header"].tobytes(), index["offsets"]
+            except (OSError, KeyError, ValueError) as e:
+                logging.warning(f"Ignoring unreadable row index {self.index_path}: {e}")
+        return self._build(state)
+
+    def _build(self, state: np.ndarray):
+        logging.info(f"Building the row index of {self.csv_path}.")
+        newlines, position = [], 0
+        with open(self.csv_path, "rb") as f:
+            while True:
+                block = f.read(_BLOCK_SIZE)
+                if not block:
+                    break
+                newlines.append(np.flatnonzero(np.frombuffer(block, dtype=np.uint8) == ord("\n")) + position)
+                position += len(block)
+            header = b""
+            if position:
+                f.seek(0)
+                header = f.readline()
+
+        # A row starts after every newline (the first one ends the header) before the end of file
+        starts = np.concatenate(newlines) + 1 if newlines else np.zeros(0, dtype=np.int64)
+        offsets = starts[starts < position].astype(np.int64)
+        # Skip empty trailing lines (e.g. "\r\n" or "\n" at the end of the file)
+        if len(offsets):
+            with open(self.csv_path, "rb") as f:
+                f.seek(int(offsets[-1]))
+                if not f.read().strip():
+                    offsets = offsets[:-1]
+
+        try:
+            np.savez(self.index_path, state=state, offsets=offsets, header=np.frombuffer(header, dtype=np.uint8))
+            # np.savez appends .npz when missing
+            if not self.index_path.endswith(".npz"):
+                os.replace(self.index_path + ".npz", self.index_path)
+        except OSError as e:
+            logging.warning(f"Could not write the row index {self.index_path}: {e}")
+        return header, offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def read_rows(self, rows: Iterable[int]) -> pd.DataFrame:
+        """
+        Reads the given row numbers (0-based, header excluded) by seeking to their offsets.
+        The returned frame is indexed by those row numbers.
+        """
+        rows = np.asarray(list(rows), dtype=np.int64)
+        lines = [self.header]
+        with open(self.csv_path, "rb") as f:
+            for offset in self.offsets[rows]:
+                f.seek(int(offset))
+                lines.append(f.readline().rstrip(b"\r\n") + b"\n")
+        df = pd.read_csv(io.BytesIO(b"".join(lines)))
+        df.index = rows
+        return df
+
+    def sample(self, n: int = 1, random_state: Union[int, np.random.Generator] = None) -> pd.DataFrame:
+        """
+        Returns n distinct random rows.
+        """
+        if n > len(self):
+            raise ValueError(f"Cannot sample {n} rows from {len(self)}.")
+        rng = np.random.default_rng(random_state)
+        return self.read_rows(np.sort(rng.choice(len(self), size=n, replace=False)))
+
+
+def reservoir_sample(chunks: Iterable[pd.DataFrame], n: int = 1,
+                     random_state: Union[int, np.random.Generator] = None) -> pd.DataFrame:
+    """
+    Draws n uniform random rows from a stream of frames in one pass and O(n) memory
+    (reservoir sampling, algorithm R), for sources that cannot be indexed.
+
+    Parameters:
+    chunks (iterable): DataFrames, e.g. from ChunkedCSVDataIngestor or a Parquet batch reader.
+    n (int): Rows to keep.
+    random_state: Seed or numpy Generator.
+
+    Returns:
+    pd.DataFrame: The sample (fewer rows when the stream is shorter than n).
+    """
+    rng = np.random.default_rng(random_state)
+    reservoir = None
+    seen = 0
+    for chunk in chunks:
+        if reservoir is None or len(reservoir) < n:
+            # Fill the reservoir first
+            take = n - (0 if reservoir is None else len(reservoir))
+            head = chunk.iloc[:take]
+            reservoir = head.copy() if reservoir is None else pd.concat([reservoir, head])
+            chunk = chunk.iloc[take:]
+            seen += len(head)
+        if not len(chunk):
+            continue
+        # Row t (0-based position in the stream) replaces slot j ~ U[0, t] when j < n
+        positions = seen + np.arange(len(chunk))
+        slots = np.floor(rng.random(len(chunk)) * (positions + 1)).astype(np.int64)
+        accepted = np.flatnonzero(slots < n)
+        if len(accepted):
+            # When a slot is hit several times within the chunk the last row wins. Slot order
+            # does not matter (slots are drawn uniformly), so replaced rows are appended.
+            unique_slots, last = np.unique(slots[accepted][::-1], return_index=True)
+            keep = np.ones(len(reservoir), dtype=bool)
+            keep[unique_slots] = False
+            reservoir = pd.concat([reservoir.iloc[keep], chunk.iloc[accepted[::-1][last]]])
+        seen += len(chunk)
+    return reservoir if reservoir is not None else pd.DataFrame()
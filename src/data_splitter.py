@@ -109,6 +109,147 @@ class RandomUndersamplingSplit(DataSplitter):
             random_state=self.random_state
         )
 
+# Deterministic Hash-Based Split Strategy
+class HashTrainTestSplit(DataSplitter):
+    """Concrete strategy for a deterministic split driven by a hash of a key column"""
+    _RESOLUTION = 2 ** 53
+
+    def __init__(self, test_size=0.2, key_column=None, salt="house_prices_key"):
+        """
+        Parameters:
+        test_size (float): Expected fraction of rows assigned to the test set.
+        key_column (str): Column whose values identify a row. When None the
+            DataFrame index is used, which is only stable if existing rows keep
+            their index when new rows are appended.
+        salt (str): 16-character hash key; changing it draws a new, equally
+            deterministic split.
+        """
+        if not 0 < test_size < 1:
+            raise ValueError("test_size must be between 0 and 1.")
+        if len(salt.encode("utf8")) != 16:
+            raise ValueError("salt must encode to exactly 16 bytes.")
+        self.test_size = test_size
+        self.key_column = key_column
+        self.salt = salt
+
+    def test_mask(self, df):
+        """
+        Returns a boolean array marking the rows that belong to the test set.
+
+        A row's side depends only on its own key, so appending rows never moves
+        existing rows between train and test, and duplicated keys always land
+        on the same side.
+        """
+        keys = df.index if self.key_column is None else df[self.key_column]
+        hashes = pd.util.hash_pandas_object(keys, index=False, hash_key=self.salt).to_numpy()
+        # hash_key only applies to text keys: mix the salt into the hashes of numeric keys too
+        salt = pd.util.hash_array(np.array([self.salt], dtype=object), hash_key=self.salt)[0]
+        hashes = pd.util.hash_array(hashes ^ salt)
+        # Keep the top 53 bits so the bucket maps exactly onto a float in [0, 1)
+        buckets = (hashes >> np.uint64(11)).astype(np.float64) / self._RESOLUTION
+        return buckets < self.test_size
+
+    def split_data(self, df, target_column):
+        """
+        Implement hash-based train-test split
+        """
+        is_test = self.test_mask(df)
+        X = df.drop(columns=[target_column])
+        y = df[target_column]
+
+        return X[~is_test], X[is_test], y[~is_test], y[is_test]
+
+# Multi-Class Group-Wise Resampling Split Strategy
+class GroupResamplingSplit(DataSplitter):
+    """Concrete strategy for resampling any number of classes or target bins"""
+    def __init__(self, test_size=0.2, random_state=42, method="under", target_ratio=1.0,
+                 group_column=None, n_bins=None):
+        """
+        Parameters:
+        test_size (float): Fraction of rows held out for the test set. The test
+            set keeps the natural group distribution; only the training rows
+            are resampled, so duplicated rows never leak into the test set.
+        random_state (int): Seed for the split and the resampling draws.
+        method (str): 'under' shrinks the larger groups, 'over' grows the
+            smaller groups by sampling with replacement.
+        target_ratio (float): Smallest-to-largest group size ratio to reach
+            after resampling; 1.0 balances all groups.
+        group_column (str): Column defining the groups, defaults to the target.
+        n_bins (int): When set, the group column is continuous and is cut into
+            this many quantile bins.
+        """
+        if method not in ("under", "over"):
+            raise ValueError(f"Unknown resampling method: {method}")
+        if not 0 < target_ratio <= 1:
+            raise ValueError("target_ratio must be in (0, 1].")
+        self.test_size = test_size
+        self.random_state = random_state
+        self.method = method
+        self.target_ratio = target_ratio
+        self.group_column = group_column
+        self.n_bins = n_bins
+
+    def _group_codes(self, df, target_column):
+        groups = df[self.group_column or target_column]
+        if self.n_bins:
+            bins = pd.qcut(groups, self.n_bins, labels=False, duplicates="drop")
+            # Missing values form a group of their own after the bins, as with factorize below
+            codes = np.array(bins.fillna(-1), dtype=np.int64)
+            codes[codes < 0] = codes.max() + 1
+            return codes
+        codes, _ = pd.factorize(groups, use_na_sentinel=False)
+        return codes
+
+    def _target_sizes(self, counts):
+        present = counts > 0
+        if self.method == "under":
+            cap = int(np.ceil(counts[present].min() / self.target_ratio))
+            return np.minimum(counts, cap)
+        floor = int(np.ceil(counts.max() * self.target_ratio))
+        return np.where(present, np.maximum(counts, floor), 0)
+
+    def resample_indices(self, codes, rng):
+        """
+        Returns positions into `codes` resampled group-wise in one vectorized pass.
+
+        Rows are expected in random order: each group keeps its first rows
+        when undersampled, and every original row is kept once before
+        extra rows are drawn with replacement when oversampled.
+        """
+        counts = np.bincount(codes)
+        sizes = self._target_sizes(counts)
+
+        order = np.argsort(codes, kind="stable")
+        group_starts = np.cumsum(counts) - counts
+
+        slot_group = np.repeat(np.arange(len(counts)), sizes)
+        slot_rank = np.arange(slot_group.size) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        group_counts = counts[slot_group]
+        drawn = (rng.random(slot_group.size) * group_counts).astype(np.int64)
+        position = np.where(slot_rank < group_counts, slot_rank, drawn)
+
+        return rng.permutation(order[group_starts[slot_group] + position])
+
+    def split_data(self, df, target_column):
+        """
+        Implement group-wise resampling split
+        """
+        rng = np.random.default_rng(self.random_state)
+        codes = self._group_codes(df, target_column)
+
+        shuffled = rng.permutation(len(df))
+        n_test = int(np.ceil(len(df) * self.test_size))
+        test_rows, train_rows = shuffled[:n_test], shuffled[n_test:]
+        train_rows = train_rows[self.resample_indices(codes[train_rows], rng)]
+
+        feature_positions = np.flatnonzero(df.columns != target_column)
+        y = df[target_column]
+
+        # A single gather per output instead of masking, concatenating and reshuffling
+        X_train = df.iloc[train_rows, feature_positions]
+        X_test = df.iloc[test_rows, feature_positions]
+        return X_train, X_test, y.iloc[train_rows], y.iloc[test_rows]
+
 # Context for Data Splitting
 class DataSplitterContext:
     """Context for data splitting strategies"""
@@ -146,8 +287,18 @@ if __name__ == "__main__":
     X_train, X_test, y_train, y_test = context.split_data(df, target_column='target')
     print("Time-Series Split: ", len(X_train), len(X_test))
 
+    # Hash-Based Split (stable when rows are appended)
+    context = DataSplitterContext(HashTrainTestSplit(test_size=0.3, key_column='feature1'))
+    X_train, X_test, y_train, y_test = context.split_data(df, target_column='target')
+    print("Hash Split: ", len(X_train), len(X_test))
+
     # Random Undersampling Split
     context = DataSplitterContext(RandomUndersamplingSplit(test_size=0.3))
     X_train, X_test, y_train, y_test = context.split_data(df, target_column='target')
     print("Random Undersampling Split: ", len(X_train), len(X_test))
+
+    # Group-Wise Oversampling Split
+    context = DataSplitterContext(GroupResamplingSplit(test_size=0.3, method='over'))
+    X_train, X_test, y_train, y_test = context.split_data(df, target_column='target')
+    print("Group Oversampling Split: ", len(X_train), len(X_test))
 '''
\ No newline at end of file
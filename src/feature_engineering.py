@@ -128,7 +128,7 @@ class OneHotEncoding(FeatureEngineeringStrategy):
         features (list): The list of categorical features to apply the one-hot encoding to.
         """
         self.features = features
-        self.encoder = OneHotEncoder(sparse=False, drop="first")
+        self.encoder = OneHotEncoder(sparse_output=False, drop="first")
 
     def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -189,6 +189,30 @@ class FeatureEngineer:
         return self._strategy.apply_transformation(df)
 
 
+def make_feature_strategy(strategy: str = "log", features: list = None) -> FeatureEngineeringStrategy:
+    """
+    Builds the strategy selected by name, as configured for feature_engineering_step.
+
+    Parameters:
+    strategy (str): 'log', 'standard_scaling', 'minmax_scaling' or 'onehot_encoding'.
+    features (list): The features to transform.
+
+    Returns:
+    FeatureEngineeringStrategy: The configured strategy.
+    """
+    if features is None:
+        features = []
+    if strategy == "log":
+        return LogTransformation(features)
+    elif strategy == "standard_scaling":
+        return StandardScaling(features)
+    elif strategy == "minmax_scaling":
+        return MinMaxScaling(features)
+    elif strategy == "onehot_encoding":
+        return OneHotEncoding(features)
+    raise ValueError(f"Unsupported feature engineering strategy: {strategy}")
+
+
 # Example usage
 if __name__ == "__main__":
     # Example dataframe
@@ -0,0 +1,172 @@
+import json
+import logging
+import os
+import pickle
+
+import numpy as np
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+FORMAT_VERSION = 1
+_ARRAYS = ("feature", "threshold", "left", "right", "value", "roots")
+
+
+def _round_down_to_float32(threshold: np.ndarray) -> np.ndarray:
+    # sklearn compares float32 inputs with float64 thresholds. For a float32 x,
+    # x <= t holds exactly when x <= the largest float32 not above t.
+    rounded = threshold.astype(np.float32)
+    too_high = rounded.astype(np.float64) > threshold
+    rounded[too_high] = np.nextafter(rounded[too_high], np.float32(-np.inf))
+    return rounded
+
+
+def export_forest(model, directory: str) -> dict:
+    """
+    Flattens a fitted random forest (or a pipeline ending with one) into contiguous arrays.
+
+    All trees are concatenated into global node arrays: int32 split feature and child indices,
+    float32 thresholds and leaf values, and the int32 root of each tree. Leaves point to
+    themselves, which is how the predictor recognizes a finished traversal. Every array
+    is written as a .npy file next to a meta.json, ready to be memory-mapped by MappedForestRegressor.
+    When a pipeline is given its preprocessing is stored as well, compiled to numpy when possible.
+
+    Parameters:
+    model: A fitted RandomForestRegressor / ExtraTreesRegressor, or a Pipeline ending with one.
+    directory (str): Output directory, created if needed.
+
+    Returns:
+    dict: The metadata written to meta.json.
+    """
+    from sklearn.pipeline import Pipeline
+    from src.pipeline_compiler import compile_preprocessor
+
+    preprocessor = None
+    if isinstance(model, Pipeline):
+        preprocessor = model[:-1] if len(model) > 2 else model[0]
+        model = model[-1]
+    if not hasattr(model, "estimators_") or not hasattr(model.estimators_[0], "tree_"):
+        raise TypeError("Expected a fitted forest of decision trees.")
+
+    trees = [estimator.tree_ for estimator in model.estimators_]
+    sizes = np.array([tree.node_count for tree in trees])
+    roots = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.int32)
+    if sizes.sum() >= np.iinfo(np.int32).max:
+        raise ValueError("Forest too large for int32 node indices.")
+
+    arrays = {name: [] for name in _ARRAYS[:-1]}
+    for tree, root in zip(trees, roots):
+        nodes = np.arange(tree.node_count, dtype=np.int64) + root
+        is_leaf = tree.children_left == -1
+        arrays["feature"].append(np.where(is_leaf, 0, tree.feature))
+        arrays["threshold"].append(np.where(is_leaf, np.inf, tree.threshold))
+        arrays["left"].append(np.where(is_leaf, nodes, tree.children_left + root))
+        arrays["right"].append(np.where(is_leaf, nodes, tree.children_right + root))
+        arrays["value"].append(tree.value[:, 0, 0])
+
+    flat = {
+        "feature": np.concatenate(arrays["feature"]).astype(np.int32),
+        "threshold": _round_down_to_float32(np.concatenate(arrays["threshold"]).astype(np.float64)),
+        "left": np.concatenate(arrays["left"]).astype(np.int32),
+        "right": np.concatenate(arrays["right"]).astype(np.int32),
+        "value": np.concatenate(arrays["value"]).astype(np.float32),
+        "roots": roots,
+    }
+
+    os.makedirs(directory, exist_ok=True)
+    for name, array in flat.items():
+        np.save(os.path.join(directory, f"{name}.npy"), np.ascontiguousarray(array))
+
+    meta = {
+        "format_version": FORMAT_VERSION,
+        "n_trees": len(trees),
+        "n_nodes": int(sizes.sum()),
+        "n_features": int(model.n_features_in_),
+        "max_depth": int(max(tree.max_depth for tree in trees)),
+        "has_preprocessor": preprocessor is not None,
+    }
+    if preprocessor is not None:
+        try:
+            preprocessor = compile_preprocessor(preprocessor)
+        except NotImplementedError as e:
+            logging.warning(f"Storing the sklearn preprocessor as is: {e}")
+        with open(os.path.join(directory, "preprocessor.pkl"), "wb") as f:
+            pickle.dump(preprocessor, f, protocol=pickle.HIGHEST_PROTOCOL)
+    with open(os.path.join(directory, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+
+    size_mb = sum(array.nbytes for array in flat.values()) / 1e6
+    logging.info(f"Exported {meta['n_trees']} trees ({meta['n_nodes']} nodes, {size_mb:.1f} MB) to {directory}.")
+    return meta
+
+
+# Random forest predictor over memory-mapped node arrays
+# ------------------------------------------------------
+# The arrays are opened with mmap, so loading is near-instant and every serving worker on the
+# host shares the same page-cache pages instead of holding a private deserialized forest.
+class MappedForestRegressor:
+    def __init__(self, directory: str, batch_size: int = 4096):
+        """
+        Parameters:
+        directory (str): A directory written by export_forest.
+        batch_size (int): Rows traversed at once; bounds the (rows x trees) working arrays.
+        """
+        with open(os.path.join(directory, "meta.json")) as f:
+            self.meta = json.load(f)
+        if self.meta["format_version"] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported forest format version {self.meta['format_version']}.")
+        for name in _ARRAYS:
+            setattr(self, name, np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r"))
+
+        self.preprocessor = None
+        if self.meta["has_preprocessor"]:
+            with open(os.path.join(directory, "preprocessor.pkl"), "rb") as f:
+                self.preprocessor = pickle.load(f)
+        self.batch_size = batch_size
+
+    def predict_matrix(self, X) -> np.ndarray:
+        """
+        Predicts from an already preprocessed feature matrix.
+        """
+        if hasattr(X, "toarray"):
+            X = X.toarray()
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.meta["n_features"]:
+            raise ValueError(f"Expected a matrix with {self.meta['n_features']} columns.")
+
+        n_trees, n_features = len(self.roots), X.shape[1]
+        predictions = np.empty(len(X), dtype=np.float64)
+        for start in range(0, len(X), self.batch_size):
+            batch = X[start:start + self.batch_size]
+            flat_batch = batch.ravel()
+            # One entry per (row, tree) pair; only pairs not yet on a leaf are advanced
+            nodes = np.tile(self.roots, len(batch))
+            row_offsets = np.repeat(np.arange(len(batch), dtype=np.int64) * n_features, n_trees)
+            active = np.arange(nodes.size)
+            while active.size:
+                current = nodes[active]
+                go_left = flat_batch[row_offsets[active] + self.feature[current]] <= self.threshold[current]
+                following = np.where(go_left, self.left[current], self.right[current])
+                nodes[active] = following
+                active = active[self.left[following] != following]
+            values = self.value[nodes].reshape(len(batch), n_trees)
+            predictions[start:start + len(batch)] = values.mean(axis=1, dtype=np.float64)
+        return predictions
+
+    def predict(self, X) -> np.ndarray:
+        """
+        Predicts from raw feature rows, applying the exported preprocessing first when present.
+        """
+        if self.preprocessor is not None:
+            X = self.preprocessor.transform(X)
+        return self.predict_matrix(X)
+
+
+# Example usage
+if __name__ == "__main__":
+    # pipeline = RandomForestStrategy().build_and_train_model(X_train, y_train)
+    # export_forest(pipeline, "artifacts/forest")
+    # forest = MappedForestRegressor("artifacts/forest")  # cheap in every serving worker
+    # forest.predict(X_test)
+
+    pass
@@ -74,4 +74,21 @@ class MissingValueHandler:
         self._missing_value_strategy = missing_value_strategy
     
     def handle_missing_value(self , df: pd.DataFrame) -> pd.DataFrame:
-        return self._missing_value_strategy.handle(df)
\ No newline at end of file
+        return self._missing_value_strategy.handle(df)
+
+
+def make_missing_value_strategy(strategy: str = 'drop', axis: int = 0, fill_value=None, thresh=None) -> MissingValuesHandlingStrategy:
+    """
+    Builds the strategy selected by name, as configured for handle_missing_values_step.
+
+    Args:
+        strategy (str): 'drop', or a fill method ('mean', 'median', 'mode', 'constant')
+        axis (int): Axis to drop along when strategy is 'drop'
+        fill_value: Value to use when strategy is 'constant'
+        thresh (int): Minimum number of non-missing values to keep when strategy is 'drop'
+    """
+    if strategy == 'drop':
+        return DropMissingValues(axis, thresh)
+    elif strategy in ['mean', 'median', 'mode', 'constant']:
+        return FillMissingValues(strategy, fill_value)
+    raise ValueError("unsupported strategy")
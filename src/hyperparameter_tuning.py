@@ -0,0 +1,228 @@
+import logging
+import multiprocessing
+import os
+import time
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.base import RegressorMixin, clone
+from sklearn.metrics import mean_squared_error
+from sklearn.model_selection import ParameterSampler
+
+from src.shared_arrays import SharedArray, get_shared_array
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def _run_trial(estimator: RegressorMixin, resource: str, budget: int, specs: dict, n_val: int) -> Tuple[float, float]:
+    """Fits one candidate at one budget and scores it on the holdout rows (runs in a worker process)."""
+    X, y, order = (get_shared_array(specs[key]) for key in ("X", "y", "order"))
+    val_rows = order[:n_val]
+    if resource == "n_samples":
+        train_rows = order[n_val:n_val + budget]
+    else:
+        train_rows = order[n_val:]
+        estimator.set_params(**{resource: budget})
+
+    start = time.perf_counter()
+    estimator.fit(X[train_rows], y[train_rows])
+    fit_time = time.perf_counter() - start
+
+    mse = mean_squared_error(y[val_rows], estimator.predict(X[val_rows]))
+    return mse, fit_time
+
+
+# Successive Halving Hyperparameter Search
+# ----------------------------------------
+# Every candidate starts on a small budget (rows or trees); after each round only the best
+# 1/eta of the candidates continue with eta times the budget. Poor candidates are stopped
+# early, trials of a round run in parallel, and the whole search respects a wall-clock budget:
+# at the deadline the worker processes are terminated, running trials included.
+class SuccessiveHalvingSearch:
+    def __init__(
+        self,
+        estimator: RegressorMixin,
+        param_distributions: dict,
+        n_candidates: int = 27,
+        resource: str = "n_samples",
+        min_resource: int = None,
+        max_resource: int = None,
+        eta: int = 3,
+        validation_fraction: float = 0.2,
+        time_budget_s: float = None,
+        max_workers: int = None,
+        random_state: int = 42,
+    ):
+        """
+        Parameters:
+        estimator (RegressorMixin): The unfitted estimator to tune.
+        param_distributions (dict): Parameter lists or scipy distributions to sample candidates from.
+        n_candidates (int): Number of candidates in the first round.
+        resource (str): 'n_samples' to grow the training rows, or an estimator parameter
+            such as 'n_estimators' to grow the model.
+        min_resource (int), max_resource (int): Budget of the first and the last round.
+            Defaults derive from the data size or 10 / 300 trees.
+        eta (int): Halving factor between rounds.
+        validation_fraction (float): Fraction of rows held out to score the trials.
+        time_budget_s (float): Wall-clock cap for the search; at the deadline running trials are
+            stopped (their worker processes terminated), pending ones cancelled, and the best
+            candidate of the last finished round is kept. A refit of that candidate by the
+            caller is not part of the budget.
+        max_workers (int): Number of worker processes.
+        random_state (int): Seed for candidate sampling and the holdout split.
+        """
+        if eta < 2:
+            raise ValueError("eta must be at least 2.")
+        self.estimator = estimator
+        self.param_distributions = param_distributions
+        self.n_candidates = n_candidates
+        self.resource = resource
+        self.min_resource = min_resource
+        self.max_resource = max_resource
+        self.eta = eta
+        self.validation_fraction = validation_fraction
+        self.time_budget_s = time_budget_s
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.random_state = random_state
+
+    def _budgets(self, n_train: int):
+        # One round more than the number of times eta fits into n_candidates (integer arithmetic,
+        # math.log(243, 3) is 4.999999999999999)
+        n_rounds = 1
+        while self.eta ** n_rounds <= self.n_candidates:
+            n_rounds += 1
+        if self.resource == "n_samples":
+            max_resource = min(self.max_resource or n_train, n_train)
+            floor = 20
+        else:
+            max_resource = self.max_resource or 300
+            floor = 10
+        min_resource = self.min_resource or max(floor, max_resource // self.eta ** (n_rounds - 1))
+        budgets = [min(min_resource * self.eta ** i, max_resource) for i in range(n_rounds)]
+        budgets[-1] = max_resource
+        return budgets
+
+    def fit(self, X: np.ndarray, y: np.ndarray) -> "SuccessiveHalvingSearch":
+        """
+        Runs the search on an already preprocessed matrix.
+
+        Sets best_params_, best_score_ (validation MSE), budgets_ (the budget of every round),
+        best_budget_ (the budget to refit the best candidate with: the last round's, or after a
+        timeout the largest one that candidate completed) and trials_, a DataFrame with one row
+        per trial recording its round, budget, parameters, score, fit time and status.
+        """
+        rng = np.random.default_rng(self.random_state)
+        order = rng.permutation(len(y))
+        n_val = max(1, int(len(y) * self.validation_fraction))
+        budgets = self._budgets(len(y) - n_val)
+
+        candidates = list(
+            ParameterSampler(self.param_distributions, self.n_candidates, random_state=self.random_state)
+        )
+        alive = list(range(len(candidates)))
+        deadline = time.monotonic() + self.time_budget_s if self.time_budget_s else None
+        trials = []
+        best = None
+
+        shared = {
+            "X": SharedArray(np.asarray(X, dtype=np.float64)),
+            "y": SharedArray(np.asarray(y, dtype=np.float64)),
+            "order": SharedArray(order),
+        }
+        specs = {key: block.spec for key, block in shared.items()}
+        # An owned pool, so a deadline can terminate trials that are already running
+        pool = multiprocessing.get_context().Pool(self.max_workers)
+        finished = False
+        timed_out = False
+        try:
+            for round_index, budget in enumerate(budgets):
+                logging.info(
+                    f"Successive halving round {round_index}: {len(alive)} candidate(s) "
+                    f"with {self.resource}={budget}."
+                )
+                futures = {
+                    candidate: pool.apply_async(
+                        _run_trial,
+                        (
+                            clone(self.estimator).set_params(**candidates[candidate]),
+                            self.resource,
+                            budget,
+                            specs,
+                            n_val,
+                        ),
+                    )
+                    for candidate in alive
+                }
+
+                scores = {}
+                for candidate, future in futures.items():
+                    trial = {
+                        "round": round_index,
+                        "candidate": candidate,
+                        self.resource: budget,
+                        "params": candidates[candidate],
+                    }
+                    try:
+                        timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+                        mse, fit_time = future.get(timeout=timeout)
+                        scores[candidate] = mse
+                        trial.update({"mse": mse, "fit_time_s": fit_time, "status": "completed"})
+                    except multiprocessing.TimeoutError:
+                        trial.update({"mse": np.nan, "fit_time_s": np.nan, "status": "timed_out"})
+                    trials.append(trial)
+
+                if len(scores) < len(futures):
+                    logging.warning("Time budget exhausted, stopping the search early.")
+                    timed_out = True
+                    if best is None and scores:
+                        best = min(scores, key=scores.get)
+                    break
+
+                ranked = sorted(scores, key=scores.get)
+                best = ranked[0]
+                alive = ranked[: max(1, len(ranked) // self.eta)]
+                if len(alive) == 1 and round_index < len(budgets) - 1:
+                    logging.info("A single candidate is left, stopping the search early.")
+                    break
+            finished = True
+        finally:
+            if finished and not timed_out:
+                pool.close()
+            else:
+                # Out of time or interrupted: no trial may outlive the search
+                pool.terminate()
+            pool.join()
+            for block in shared.values():
+                block.close()
+
+        if best is None:
+            raise RuntimeError("No trial finished within the time budget.")
+
+        self.budgets_ = budgets
+        self.trials_ = pd.DataFrame(trials)
+        completed = self.trials_[self.trials_["candidate"] == best].dropna(subset=["mse"])
+        self.best_params_ = candidates[best]
+        self.best_score_ = completed["mse"].iloc[-1]
+        self.best_budget_ = int(completed[self.resource].iloc[-1]) if timed_out else budgets[-1]
+        logging.info(
+            f"Best parameters: {self.best_params_} (validation MSE {self.best_score_:.4f}), "
+            f"{len(self.trials_)} trial(s) in {self.trials_['fit_time_s'].sum():.1f}s of fitting."
+        )
+        return self
+
+
+# Example usage
+if __name__ == "__main__":
+    # Example usage on a preprocessed matrix
+    # from sklearn.ensemble import RandomForestRegressor
+    # search = SuccessiveHalvingSearch(
+    #     RandomForestRegressor(random_state=42),
+    #     {"max_depth": [None, 8, 16], "min_samples_leaf": [1, 2, 4], "max_features": [0.3, 0.6, 1.0]},
+    #     resource="n_estimators",
+    #     time_budget_s=600,
+    # ).fit(X_train_processed, y_train)
+    # print(search.best_params_, search.trials_)
+
+    pass
@@ -0,0 +1,164 @@
+import logging
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, RegressorMixin, TransformerMixin
+from sklearn.linear_model import SGDRegressor
+from sklearn.preprocessing import StandardScaler
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+# Incrementally fitted preprocessing
+# ----------------------------------
+# Mean imputation, standard scaling and one-hot encoding whose statistics are updated chunk by
+# chunk with partial_fit, so the full training frame never has to be in memory.
+class IncrementalPreprocessor(BaseEstimator, TransformerMixin):
+    def __init__(self, numeric_features: List[str] = None, categorical_features: List[str] = None,
+                 categories: Dict[str, list] = None):
+        """
+        Parameters:
+        numeric_features (list), categorical_features (list): Column lists, inferred from the
+            dtypes of the first chunk when None.
+        categories (dict): Column -> known categories. Columns without an entry take the sorted
+            categories of the first chunk; later unseen categories encode as all zeros, so the
+            output width stays fixed across chunks.
+        """
+        self.numeric_features = numeric_features
+        self.categorical_features = categorical_features
+        self.categories = categories
+
+    def _start(self, X: pd.DataFrame):
+        if self.numeric_features is None:
+            self.numeric_features_ = X.select_dtypes(exclude=["object", "category"]).columns.tolist()
+        else:
+            self.numeric_features_ = list(self.numeric_features)
+        if self.categorical_features is None:
+            self.categorical_features_ = X.select_dtypes(include=["object", "category"]).columns.tolist()
+        else:
+            self.categorical_features_ = list(self.categorical_features)
+
+        known = self.categories or {}
+        self.categories_ = {
+            column: list(known[column]) if column in known else sorted(X[column].dropna().unique().tolist())
+            for column in self.categorical_features_
+        }
+        self.category_counts_ = {
+            column: np.zeros(len(values), dtype=np.int64) for column, values in self.categories_.items()
+        }
+        self.count_ = np.zeros(len(self.numeric_features_), dtype=np.int64)
+        self.sum_ = np.zeros(len(self.numeric_features_), dtype=np.float64)
+        self.scaler_ = StandardScaler()
+        self.n_rows_seen_ = 0
+
+    def partial_fit(self, X: pd.DataFrame, y=None) -> "IncrementalPreprocessor":
+        """Updates imputation, scaling and category statistics with one chunk."""
+        if not hasattr(self, "scaler_"):
+            self._start(X)
+
+        values = X[self.numeric_features_].to_numpy(dtype=np.float64)
+        present = ~np.isnan(values)
+        self.count_ += present.sum(axis=0)
+        self.sum_ += np.where(present, values, 0.0).sum(axis=0)
+        if values.shape[1]:
+            self.scaler_.partial_fit(self._impute(values))
+
+        for column, categories in self.categories_.items():
+            codes = pd.Index(categories, dtype=object).get_indexer(X[column])
+            self.category_counts_[column] += np.bincount(codes[codes >= 0], minlength=len(categories))
+
+        self.n_rows_seen_ += len(X)
+        return self
+
+    def fit(self, X: pd.DataFrame, y=None) -> "IncrementalPreprocessor":
+        for attribute in ("scaler_", "categories_"):
+            self.__dict__.pop(attribute, None)
+        return self.partial_fit(X, y)
+
+    @property
+    def statistics_(self) -> np.ndarray:
+        """Running means used to impute the numeric columns."""
+        return np.divide(self.sum_, self.count_, out=np.zeros_like(self.sum_), where=self.count_ > 0)
+
+    def _impute(self, values: np.ndarray) -> np.ndarray:
+        return np.where(np.isnan(values), self.statistics_, values)
+
+    def transform(self, X: pd.DataFrame) -> np.ndarray:
+        n_numeric = len(self.numeric_features_)
+        widths = [len(categories) for categories in self.categories_.values()]
+        output = np.zeros((len(X), n_numeric + sum(widths)), dtype=np.float64)
+        if n_numeric:
+            output[:, :n_numeric] = self.scaler_.transform(
+                self._impute(X[self.numeric_features_].to_numpy(dtype=np.float64))
+            )
+
+        offset = n_numeric
+        rows = np.arange(len(X))
+        for (column, categories), width in zip(self.categories_.items(), widths):
+            codes = pd.Index(categories, dtype=object).get_indexer(X[column]).astype(np.int64)
+            # Missing values take the most frequent category, unseen categories stay all zeros
+            if width:
+                codes[X[column].isna().to_numpy()] = int(np.argmax(self.category_counts_[column]))
+            known = codes >= 0
+            output[rows[known], offset + codes[known]] = 1.0
+            offset += width
+        return output
+
+    def get_feature_names_out(self, input_features=None) -> np.ndarray:
+        names = list(self.numeric_features_)
+        for column, categories in self.categories_.items():
+            names.extend(f"{column}_{category}" for category in categories)
+        return np.asarray(names, dtype=object)
+
+
+# SGD regressor on a standardized target
+# --------------------------------------
+# House prices are in the millions; plain SGD on the raw target needs a tiny learning rate.
+# The target scaling is taken from the first chunk and then frozen, so warm-started updates
+# keep the same target units.
+class ScaledTargetSGDRegressor(BaseEstimator, RegressorMixin):
+    def __init__(self, alpha: float = 1e-4, eta0: float = 0.01, learning_rate: str = "invscaling",
+                 random_state: int = 42):
+        self.alpha = alpha
+        self.eta0 = eta0
+        self.learning_rate = learning_rate
+        self.random_state = random_state
+
+    def partial_fit(self, X: np.ndarray, y) -> "ScaledTargetSGDRegressor":
+        y = np.asarray(y, dtype=np.float64)
+        if not hasattr(self, "regressor_"):
+            self.target_mean_ = float(y.mean())
+            self.target_scale_ = float(y.std()) or 1.0
+            self.regressor_ = SGDRegressor(
+                alpha=self.alpha,
+                eta0=self.eta0,
+                learning_rate=self.learning_rate,
+                random_state=self.random_state,
+            )
+        self.regressor_.partial_fit(X, (y - self.target_mean_) / self.target_scale_)
+        return self
+
+    def fit(self, X: np.ndarray, y) -> "ScaledTargetSGDRegressor":
+        self.__dict__.pop("regressor_", None)
+        return self.partial_fit(X, y)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return self.regressor_.predict(X) * self.target_scale_ + self.target_mean_
+
+
+def iter_xy_chunks(chunks: Iterable[pd.DataFrame], target_column: str) -> Iterator[Tuple[pd.DataFrame, pd.Series]]:
+    """
+    Splits a stream of frames (e.g. from ChunkedCSVDataIngestor) into (X, y) chunks.
+    """
+    for chunk in chunks:
+        yield chunk.drop(columns=[target_column]), chunk[target_column]
+
+
+def iter_frame_chunks(X: pd.DataFrame, y: pd.Series, chunksize: int) -> Iterator[Tuple[pd.DataFrame, pd.Series]]:
+    """
+    Streams an in-memory frame as (X, y) chunks of at most chunksize rows.
+    """
+    for start in range(0, len(X), chunksize):
+        yield X.iloc[start:start + chunksize], y.iloc[start:start + chunksize]
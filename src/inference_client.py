@@ -0,0 +1,224 @@
+import asyncio
+import logging
+import math
+import random
+from typing import List
+
+import numpy as np
+import orjson
+import pandas as pd
+from src.payload_codec import BINARY_CONTENT_TYPE, encode_frame, encode_json
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# Statuses worth retrying: rate limiting and gateway / restart errors
+RETRYABLE_STATUSES = {429, 502, 503, 504}
+
+
+class InferenceRequestError(RuntimeError):
+    """A prediction request failed for good (non-retryable status or retries exhausted)."""
+
+
+# Async pooled inference client
+# -----------------------------
+# One aiohttp session (a persistent keep-alive connection pool) is shared by all requests. Large
+# frames are split into evenly sized requests that are sent concurrently under a semaphore, and
+# transient failures (connection errors, timeouts, 429/5xx gateway statuses) are retried with
+# exponential backoff and jitter. Predictions come back in input order.
+class AsyncInferenceClient:
+    def __init__(self, url: str, protocol: str = "mlflow", max_concurrency: int = 8, max_batch_rows: int = 1024,
+                 min_batch_rows: int = 64, retries: int = 3, backoff_s: float = 0.05, timeout_s: float = 10.0):
+        """
+        Parameters:
+        url (str): The prediction endpoint, e.g. MLFlowDeploymentService.prediction_url
+            (.../invocations) or a src.prediction_server .../predict URL.
+        protocol (str): 'mlflow' (JSON {"dataframe_split": ...}) or 'binary' (src.payload_codec
+            frames, accepted by src.prediction_server).
+        max_concurrency (int): Requests in flight at once, also the connection pool size.
+        max_batch_rows (int): Maximum rows per request.
+        min_batch_rows (int): Frames are split below max_batch_rows to use the concurrency,
+            but never into requests smaller than this.
+        retries (int): Retries per request after the first attempt.
+        backoff_s (float): Base delay of the exponential backoff.
+        timeout_s (float): Total timeout of one attempt.
+        """
+        if protocol not in ("mlflow", "binary"):
+            raise ValueError("protocol must be 'mlflow' or 'binary'.")
+        self.url = url
+        self.protocol = protocol
+        self.max_concurrency = max_concurrency
+        self.max_batch_rows = max_batch_rows
+        self.min_batch_rows = min_batch_rows
+        self.retries = retries
+        self.backoff_s = backoff_s
+        self.timeout_s = timeout_s
+        self.requests_sent = 0
+        self.retries_done = 0
+        self._session = None
+        self._semaphore = None
+
+    async def __aenter__(self) -> "AsyncInferenceClient":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def open(self):
+        import aiohttp
+
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout_s)
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def split(self, n_rows: int) -> List[slice]:
+        """
+        Returns evenly sized row slices: enough requests to respect max_batch_rows and, for
+        large frames, to keep every concurrency slot busy.
+        """
+        if n_rows == 0:
+            return []
+        n_requests = max(
+            math.ceil(n_rows / self.max_batch_rows),
+            min(self.max_concurrency, n_rows // self.min_batch_rows),
+            1,
+        )
+        bounds = np.linspace(0, n_rows, n_requests + 1).round().astype(int)
+        return [slice(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+    def _encode(self, frame: pd.DataFrame):
+        if self.protocol == "binary":
+            return encode_frame(frame), BINARY_CONTENT_TYPE
+        return b'{"dataframe_split":' + encode_json(frame) + b"}", "application/json"
+
+    @staticmethod
+    def _decode(body: bytes) -> np.ndarray:
+        data = orjson.loads(body)
+        if isinstance(data, dict):
+            data = data["predictions"]
+        return np.asarray(data, dtype=np.float64).ravel()
+
+    async def _post(self, frame: pd.DataFrame) -> np.ndarray:
+        import aiohttp
+
+        body, content_type = self._encode(frame)
+        async with self._semaphore:
+            for attempt in range(self.retries + 1):
+                if attempt:
+                    self.retries_done += 1
+                    await asyncio.sleep(self.backoff_s * 2 ** (attempt - 1) * (1 + random.random()))
+                try:
+                    self.requests_sent += 1
+                    async with self._session.post(
+                        self.url, data=body, headers={"Content-Type": content_type}
+                    ) as response:
+                        payload = await response.read()
+                        if response.status == 200:
+                            return self._decode(payload)
+                        error = f"HTTP {response.status}: {payload[:200]!r}"
+                        if response.status not in RETRYABLE_STATUSES:
+                            raise InferenceRequestError(error)
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    error = f"{type(e).__name__}: {e}"
+                logging.warning(f"Prediction request failed (attempt {attempt + 1}): {error}")
+        raise InferenceRequestError(f"Prediction request failed after {self.retries + 1} attempts: {error}")
+
+    async def predict(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Scores df, splitting it into concurrent requests; returns predictions in row order.
+        """
+        await self.open()
+        parts = await asyncio.gather(*(self._post(df.iloc[part]) for part in self.split(len(df))))
+        return np.concatenate(parts) if parts else np.zeros(0)
+
+
+def predict(url: str, df: pd.DataFrame, **client_kwargs) -> np.ndarray:
+    """
+    Synchronous helper: scores df through a short-lived AsyncInferenceClient.
+    """
+
+    async def run():
+        async with AsyncInferenceClient(url, **client_kwargs) as client:
+            return await client.predict(df)
+
+    return asyncio.run(run())
+
+
+# Local stand-in server
+# ---------------------
+# Serves a model in-process with the MLflow scoring protocol (POST /invocations with
+# dataframe_split JSON) and the binary protocol, with optional injected faults, so the
+# client can be exercised without a deployed MLflow service.
+class LocalStandInServer:
+    def __init__(self, model, host: str = "127.0.0.1", port: int = 0, fail_every: int = 0, delay_s: float = 0.0):
+        """
+        Parameters:
+        model: Anything with predict(DataFrame).
+        port (int): 0 picks a free port, see .url once started.
+        fail_every (int): When > 0, every fail_every-th request answers 503.
+        delay_s (float): Artificial latency per request.
+        """
+        self.model = model
+        self.host = host
+        self.port = port
+        self.fail_every = fail_every
+        self.delay_s = delay_s
+        self.requests = 0
+        self._runner = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/invocations"
+
+    async def _invocations(self, request):
+        from aiohttp import web
+        from src.payload_codec import decode_payload
+
+        self.requests += 1
+        if self.delay_s:
+            await asyncio.sleep(self.delay_s)
+        if self.fail_every and self.requests % self.fail_every == 0:
+            return web.Response(status=503, text="injected failure")
+        body = await request.read()
+        if request.content_type == BINARY_CONTENT_TYPE:
+            frame = decode_payload(body)
+        else:
+            split = orjson.loads(body)["dataframe_split"]
+            frame = pd.DataFrame(split["data"], columns=split["columns"])
+        predictions = np.asarray(self.model.predict(frame), dtype=np.float64)
+        return web.Response(
+            body=orjson.dumps({"predictions": predictions}, option=orjson.OPT_SERIALIZE_NUMPY),
+            content_type="application/json",
+        )
+
+    async def start(self) -> "LocalStandInServer":
+        from aiohttp import web
+
+        app = web.Application(client_max_size=1 << 30)
+        app.router.add_post("/invocations", self._invocations)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "LocalStandInServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
@@ -2,6 +2,7 @@ from abc import abstractmethod, ABC
 import pandas as pd
 import zipfile
 import os
+from typing import Iterator
 
 class DataIngestor(ABC):
     @abstractmethod
@@ -55,6 +56,20 @@ class CSVDataIngestor(DataIngestor):
         except Exception as e:
             return f"An error occurred while reading the CSV file: {str(e)}"
 
+class ChunkedCSVDataIngestor(DataIngestor):
+    def __init__(self, chunksize: int = 100_000):
+        self.chunksize = chunksize
+
+    def ingest(self, file_path) -> Iterator[pd.DataFrame]:
+        """Streams the CSV file as DataFrames of at most `chunksize` rows."""
+        if not file_path.endswith('.csv'):
+            raise ValueError("This is not a .csv file")
+
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(f"The file does not exist: {file_path}")
+
+        return pd.read_csv(file_path, chunksize=self.chunksize)
+
 class JSONDataIngestor:
     def ingest(self, json_file_path) -> pd.DataFrame:
         # Check if the file is a JSON
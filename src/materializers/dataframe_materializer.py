@@ -0,0 +1,181 @@
+import json
+import logging
+import mmap
+import os
+import zlib
+from typing import Any, ClassVar, Tuple, Type, Union
+
+import numpy as np
+import pandas as pd
+from src.payload_codec import decode_frame, encode_frame
+from zenml.enums import ArtifactType
+from zenml.materializers.base_materializer import BaseMaterializer
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+DATA_FILENAME = "frame.hpcf"
+COMPRESSED_DATA_FILENAME = "frame.hpcf.zz"
+META_FILENAME = "frame.json"
+# 'none', 'zlib' or unset: compress only on remote artifact stores
+COMPRESSION_ENV = "HOUSE_PRICES_ARTIFACT_COMPRESSION"
+_INDEX_PREFIX = "__index_level_"
+
+
+def is_local_uri(uri: str) -> bool:
+    """True for paths of the local filesystem (local artifact store), False for s3://, gs://..."""
+    return "://" not in uri
+
+
+def _plain(values: Union[pd.Series, pd.Index]):
+    """A column as an array src.payload_codec encodes: numeric buffers stay views."""
+    dtype = values.dtype
+    if dtype.kind in "mM" and isinstance(dtype, np.dtype):
+        # Timestamps travel as their int64 representation
+        return values.to_numpy().view(np.int64)
+    if dtype.kind in "biuf" and not isinstance(dtype, np.dtype):
+        # Nullable extension dtypes (Int64, boolean...): NaN marks the missing values
+        return values.to_numpy(dtype=np.float64, na_value=np.nan)
+    if dtype.kind in "biuf":
+        return values.to_numpy()
+    return values.array
+
+
+def _restore(values, dtype: str):
+    if str(values.dtype) == dtype:
+        return values
+    if isinstance(values, pd.Categorical):
+        # A take from the small vocabulary: much faster than converting row by row
+        vocabulary = pd.array(np.asarray(values.categories, dtype=object), dtype=object if dtype == "object" else dtype)
+        return vocabulary.take(values.codes, allow_fill=True)
+    if dtype.startswith(("datetime64", "timedelta64")):
+        return values.view(dtype)
+    return pd.Series(values, copy=False).astype(dtype).array
+
+
+def frame_to_columns(data: Union[pd.DataFrame, pd.Series]) -> Tuple[pd.DataFrame, dict]:
+    """
+    Flattens a frame or series into positionally named plain columns that src.payload_codec
+    encodes, and returns the metadata needed to rebuild it: the kind, the original labels and
+    dtypes, and the index (a RangeIndex is stored as its bounds, other indexes as columns).
+    """
+    meta = {"kind": "series" if isinstance(data, pd.Series) else "frame"}
+    if isinstance(data, pd.Series):
+        meta["name"] = data.name
+        data = data.to_frame()
+    meta["columns"] = data.columns.tolist()
+    meta["columns_dtype"] = str(data.columns.dtype)
+    meta["dtypes"] = [str(dtype) for dtype in data.dtypes]
+
+    index = data.index
+    if isinstance(index, pd.RangeIndex):
+        meta["index"] = {"range": [index.start, index.stop, index.step], "name": index.name}
+        named = []
+    else:
+        levels = [index.get_level_values(i) for i in range(index.nlevels)]
+        meta["index"] = {"names": list(index.names), "dtypes": [str(level.dtype) for level in levels]}
+        named = [(f"{_INDEX_PREFIX}{i}", level) for i, level in enumerate(levels)]
+    named += [(str(i), data.iloc[:, i]) for i in range(data.shape[1])]
+
+    columns, meta["categories"] = {}, {}
+    for name, values in named:
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Categoricals keep their own codes, category order and unused categories
+            meta["categories"][name] = {"values": values.dtype.categories.tolist(), "ordered": values.dtype.ordered}
+            columns[name] = values.array.codes if isinstance(values, pd.Series) else values.codes
+        else:
+            columns[name] = _plain(values)
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(data)), copy=False), meta
+
+
+def columns_to_frame(columns: pd.DataFrame, meta: dict) -> Union[pd.DataFrame, pd.Series]:
+    """Inverse of frame_to_columns; numeric columns stay views on the decoded buffers."""
+
+    def column(name: str):
+        values = columns[name]
+        if name in meta["categories"]:
+            categories = meta["categories"][name]
+            return pd.Categorical.from_codes(values.to_numpy(), categories["values"], ordered=categories["ordered"])
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            return values.array
+        # The backing array itself: Series.to_numpy() is a read-only view under copy-on-write
+        return values.array.to_numpy()
+
+    index_meta = meta["index"]
+    if "range" in index_meta:
+        index = pd.RangeIndex(*index_meta["range"], name=index_meta["name"])
+    else:
+        levels = [_restore(column(f"{_INDEX_PREFIX}{i}"), dtype) for i, dtype in enumerate(index_meta["dtypes"])]
+        if len(levels) > 1:
+            index = pd.MultiIndex.from_arrays(levels, names=index_meta["names"])
+        else:
+            index = pd.Index(levels[0], name=index_meta["names"][0], copy=False)
+
+    values = [_restore(column(str(i)), dtype) for i, dtype in enumerate(meta["dtypes"])]
+    if meta["kind"] == "series":
+        return pd.Series(values[0], index=index, name=meta["name"], copy=False)
+    frame = pd.DataFrame(dict(enumerate(values)), index=index, copy=False)
+    frame.columns = pd.Index(meta["columns"], dtype=meta["columns_dtype"])
+    return frame
+
+
+# Columnar DataFrame materializer
+# -------------------------------
+# Stores pd.DataFrame and pd.Series step outputs in the binary columnar layout of
+# src.payload_codec: numeric columns as raw aligned buffers and text columns dictionary-encoded
+# (one small integer code per row, e.g. 1 byte for the yes/no columns of Housing.csv). On a
+# local artifact store the file is memory-mapped (copy-on-write) on load, so numeric columns
+# are views on the page cache instead of parsed copies (no Parquet decode, no decompression);
+# a step writing to a loaded frame gets private copies of the touched pages only. On
+# remote stores the file is zlib-compressed (level 1) since transfer size dominates there; set
+# HOUSE_PRICES_ARTIFACT_COMPRESSION to 'none' or 'zlib' to override.
+class DataFrameMaterializer(BaseMaterializer):
+    ASSOCIATED_TYPES: ClassVar[Tuple[Type[Any], ...]] = (pd.DataFrame, pd.Series)
+    ASSOCIATED_ARTIFACT_TYPE: ClassVar[ArtifactType] = ArtifactType.DATA
+
+    def _compress(self) -> bool:
+        setting = os.environ.get(COMPRESSION_ENV)
+        if setting:
+            if setting not in ("none", "zlib"):
+                raise ValueError(f"{COMPRESSION_ENV} must be 'none' or 'zlib', got '{setting}'.")
+            return setting == "zlib"
+        return not is_local_uri(self.uri)
+
+    def save(self, data: Union[pd.DataFrame, pd.Series]) -> None:
+        columns, meta = frame_to_columns(data)
+        payload = encode_frame(columns)
+        meta["compression"] = "zlib" if self._compress() else "none"
+        if meta["compression"] == "zlib":
+            payload = zlib.compress(payload, level=1)
+            filename = COMPRESSED_DATA_FILENAME
+        else:
+            filename = DATA_FILENAME
+        with self.artifact_store.open(os.path.join(self.uri, filename), "wb") as f:
+            f.write(payload)
+        with self.artifact_store.open(os.path.join(self.uri, META_FILENAME), "w") as f:
+            json.dump(meta, f)
+
+    def load(self, data_type: Type[Any]) -> Union[pd.DataFrame, pd.Series]:
+        with self.artifact_store.open(os.path.join(self.uri, META_FILENAME), "r") as f:
+            meta = json.load(f)
+
+        if meta["compression"] == "zlib":
+            with self.artifact_store.open(os.path.join(self.uri, COMPRESSED_DATA_FILENAME), "rb") as f:
+                # bytearray: views on immutable bytes would make the loaded columns read-only
+                payload = bytearray(zlib.decompress(f.read()))
+        else:
+            path = os.path.join(self.uri, DATA_FILENAME)
+            if is_local_uri(path):
+                # The mapping lives as long as the arrays viewing it; ACCESS_COPY keeps them
+                # writable without ever writing back to the artifact
+                with open(path, "rb") as f:
+                    payload = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            else:
+                with self.artifact_store.open(path, "rb") as f:
+                    payload = bytearray(f.read())
+
+        data = columns_to_frame(decode_frame(payload, categorical=True), meta)
+        if issubclass(data_type, pd.Series) and isinstance(data, pd.DataFrame):
+            # Same convention as the default materializer: a one-column frame loads as a series
+            data = data.iloc[:, 0]
+        return data
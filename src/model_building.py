@@ -1,29 +1,103 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import Any
-from sklearn.ensemble import RandomForestRegressor
+from typing import Any, Iterable, Tuple
+import numpy as np
+from sklearn.ensemble import GradientBoostingRegressor, HistGradientBoostingRegressor, RandomForestRegressor
 # Concrete Strategy for Random Forest using scikit-learn
 from sklearn.compose import ColumnTransformer
-from sklearn.preprocessing import StandardScaler, OneHotEncoder
+from sklearn.impute import SimpleImputer
+from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder, StandardScaler
 
 import pandas as pd
-from sklearn.base import RegressorMixin
-from sklearn.linear_model import LinearRegression
+from sklearn.base import RegressorMixin, TransformerMixin
+from sklearn.linear_model import LinearRegression, Ridge
 from sklearn.pipeline import Pipeline
+from src.hyperparameter_tuning import SuccessiveHalvingSearch
+from src.incremental_learning import IncrementalPreprocessor, ScaledTargetSGDRegressor, iter_frame_chunks
+from src.preprocessing_cache import PreprocessingCache
 
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 
+# Shared preprocessing: impute and scale numeric columns, impute and one-hot encode categoricals
+def build_preprocessor(X_train: pd.DataFrame, dense: bool = False) -> ColumnTransformer:
+    numeric_features = X_train.select_dtypes(exclude=["object", "category"]).columns
+    categorical_features = X_train.select_dtypes(include=["object", "category"]).columns
+
+    logging.info(f"Numeric features: {numeric_features.tolist()}")
+    logging.info(f"Categorical features: {categorical_features.tolist()}")
+
+    numeric_transformer = Pipeline(
+        steps=[
+            ("imputer", SimpleImputer(strategy="mean")),
+            ("scaler", StandardScaler()),
+        ]
+    )
+    categorical_transformer = Pipeline(
+        steps=[
+            ("imputer", SimpleImputer(strategy="most_frequent")),
+            ("onehot", OneHotEncoder(handle_unknown="ignore", sparse_output=not dense)),
+        ]
+    )
+
+    return ColumnTransformer(
+        transformers=[
+            ("num", numeric_transformer, numeric_features),
+            ("cat", categorical_transformer, categorical_features),
+        ],
+        sparse_threshold=0 if dense else 0.3,
+    )
+
+
 # Abstract Base Class for Model Building Strategy
 class ModelBuildingStrategy(ABC):
     @abstractmethod
     def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> RegressorMixin:
         pass
 
+    # Optional PreprocessingCache reused across fits on the same training frame
+    cache: PreprocessingCache = None
+
+    @abstractmethod
+    def make_estimator(self) -> RegressorMixin:
+        """Returns the unfitted regressor, for callers that preprocess the data themselves."""
+        pass
+
+    def build_preprocessor(self, X_train: pd.DataFrame) -> TransformerMixin:
+        """
+        Returns the unfitted preprocessor make_estimator's regressor expects (used by
+        ParallelModelTrainer); the shared dense impute / scale / one-hot one by default.
+        """
+        return build_preprocessor(X_train, dense=True)
+
+    def _fit_pipeline(
+        self, preprocessor, X_train: pd.DataFrame, y_train: pd.Series, preprocessor_name: str = "preprocessor"
+    ) -> Pipeline:
+        """Fits preprocessor + estimator, reusing a cached preprocessed matrix when available."""
+        estimator = self.make_estimator()
+        if self.cache is None:
+            pipeline = Pipeline(steps=[(preprocessor_name, preprocessor), ("model", estimator)])
+            return pipeline.fit(X_train, y_train)
+
+        fitted_preprocessor, X_transformed = self.cache.fit_transform(preprocessor, X_train)
+        estimator.fit(X_transformed, y_train)
+        return Pipeline(steps=[(preprocessor_name, fitted_preprocessor), ("model", estimator)])
+
+
+def _validate_training_data(X_train: pd.DataFrame, y_train: pd.Series):
+    # Ensure the inputs are of the correct type
+    if not isinstance(X_train, pd.DataFrame):
+        raise TypeError("X_train must be a pandas DataFrame.")
+    if not isinstance(y_train, pd.Series):
+        raise TypeError("y_train must be a pandas Series.")
+
 
 # Concrete Strategy for Linear Regression using scikit-learn
 class LinearRegressionStrategy(ModelBuildingStrategy):
+    def __init__(self, cache: PreprocessingCache = None):
+        self.cache = cache
+
     def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
         # Ensure the inputs are of the correct type
         if not isinstance(X_train, pd.DataFrame):
@@ -33,66 +107,350 @@ class LinearRegressionStrategy(ModelBuildingStrategy):
 
         logging.info("Initializing Linear Regression model with scaling.")
 
-        # Creating a pipeline with standard scaling and linear regression
-        pipeline = Pipeline(
-            [
-                ("scaler", StandardScaler()),  # Feature scaling
-                ("model", LinearRegression()),  # Linear regression model
-            ]
-        )
-
+        # Creating and fitting a pipeline with standard scaling and linear regression
         logging.info("Training Linear Regression model.")
-        pipeline.fit(X_train, y_train)  # Fit the pipeline to the training data
+        pipeline = self._fit_pipeline(StandardScaler(), X_train, y_train, preprocessor_name="scaler")
 
         logging.info("Model training completed.")
         return pipeline
 
+    def make_estimator(self) -> RegressorMixin:
+        return LinearRegression()
+
 # Concrete Strategy for Random Forest using scikit-learn
 class RandomForestStrategy(ModelBuildingStrategy):
+    def __init__(self, n_estimators: int = 100, random_state: int = 42, cache: PreprocessingCache = None):
+        self.n_estimators = n_estimators
+        self.random_state = random_state
+        self.cache = cache
+
     def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
-        # Ensure the inputs are of the correct type
-        if not isinstance(X_train, pd.DataFrame):
-            raise TypeError("X_train must be a pandas DataFrame.")
-        if not isinstance(y_train, pd.Series):
-            raise TypeError("y_train must be a pandas Series.")
+        _validate_training_data(X_train, y_train)
 
         logging.info("Initializing Random Forest model with preprocessing.")
 
-        # Separate categorical and numeric columns
-        numeric_features = X_train.select_dtypes(include=["int64", "float64"]).columns
-        categorical_features = X_train.select_dtypes(include=["object", "category"]).columns
+        # Create and fit a pipeline with preprocessing and the Random Forest model
+        logging.info("Training Random Forest model.")
+        pipeline = self._fit_pipeline(build_preprocessor(X_train), X_train, y_train)
+
+        logging.info("Model training completed.")
+        return pipeline
+
+    def make_estimator(self) -> RegressorMixin:
+        return RandomForestRegressor(n_estimators=self.n_estimators, random_state=self.random_state)
+
+
+# Concrete Strategy for Gradient Boosting using scikit-learn
+class GradientBoostingStrategy(ModelBuildingStrategy):
+    def __init__(
+        self,
+        n_estimators: int = 100,
+        learning_rate: float = 0.1,
+        random_state: int = 42,
+        cache: PreprocessingCache = None,
+    ):
+        self.n_estimators = n_estimators
+        self.learning_rate = learning_rate
+        self.random_state = random_state
+        self.cache = cache
+
+    def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+        _validate_training_data(X_train, y_train)
+
+        logging.info("Initializing Gradient Boosting model with preprocessing.")
+        logging.info("Training Gradient Boosting model.")
+        pipeline = self._fit_pipeline(build_preprocessor(X_train), X_train, y_train)
+
+        logging.info("Model training completed.")
+        return pipeline
+
+    def make_estimator(self) -> RegressorMixin:
+        return GradientBoostingRegressor(
+            n_estimators=self.n_estimators,
+            learning_rate=self.learning_rate,
+            random_state=self.random_state,
+        )
+
+
+# Concrete Strategy for Ridge Regression using scikit-learn
+class RidgeStrategy(ModelBuildingStrategy):
+    def __init__(self, alpha: float = 1.0, cache: PreprocessingCache = None):
+        self.alpha = alpha
+        self.cache = cache
 
-        logging.info(f"Numeric features: {numeric_features.tolist()}")
-        logging.info(f"Categorical features: {categorical_features.tolist()}")
+    def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+        _validate_training_data(X_train, y_train)
+
+        logging.info("Initializing Ridge Regression model with preprocessing.")
+        logging.info("Training Ridge Regression model.")
+        pipeline = self._fit_pipeline(build_preprocessor(X_train), X_train, y_train)
+
+        logging.info("Model training completed.")
+        return pipeline
+
+    def make_estimator(self) -> RegressorMixin:
+        return Ridge(alpha=self.alpha)
 
-        # Preprocessing for numeric features
-        numeric_transformer = StandardScaler()
 
-        # Preprocessing for categorical features
-        categorical_transformer = OneHotEncoder(handle_unknown="ignore")
+# Concrete Strategy for histogram gradient boosting with native categorical support
+class HistGradientBoostingStrategy(ModelBuildingStrategy):
+    def __init__(
+        self,
+        max_iter: int = 500,
+        learning_rate: float = 0.1,
+        early_stopping: bool = True,
+        random_state: int = 42,
+        cache: PreprocessingCache = None,
+    ):
+        """
+        Parameters:
+        max_iter (int): Maximum number of boosting iterations.
+        learning_rate (float): Shrinkage of each iteration.
+        early_stopping (bool): Stop once the held-out validation loss stops improving.
+        random_state (int): Seed for the validation split.
+        cache (PreprocessingCache): Optional cache for the encoded matrix.
+        """
+        self.max_iter = max_iter
+        self.learning_rate = learning_rate
+        self.early_stopping = early_stopping
+        self.random_state = random_state
+        self.cache = cache
+        self.categorical_mask_ = None
 
-        # Combine preprocessors in a column transformer
-        preprocessor = ColumnTransformer(
+    def build_preprocessor(self, X_train: pd.DataFrame) -> ColumnTransformer:
+        """
+        Ordinal-encodes the categoricals into a single column each; numeric columns pass through.
+
+        Missing and unseen values become NaN, which the model routes natively, so no imputer
+        and no one-hot expansion is needed. The output stays float64: the model bins its input
+        as float64 anyway, so a narrower dtype would only add a conversion copy.
+        """
+        numeric_features = X_train.select_dtypes(exclude=["object", "category"]).columns
+        categorical_features = X_train.select_dtypes(include=["object", "category"]).columns
+        self.categorical_mask_ = np.r_[
+            np.zeros(len(numeric_features), dtype=bool), np.ones(len(categorical_features), dtype=bool)
+        ]
+
+        return ColumnTransformer(
             transformers=[
-                ("num", numeric_transformer, numeric_features),
-                ("cat", categorical_transformer, categorical_features),
+                ("num", "passthrough", numeric_features),
+                (
+                    "cat",
+                    OrdinalEncoder(
+                        handle_unknown="use_encoded_value",
+                        unknown_value=np.nan,
+                        encoded_missing_value=np.nan,
+                    ),
+                    categorical_features,
+                ),
             ]
         )
 
-        # Create a pipeline with preprocessing and the Random Forest model
-        pipeline = Pipeline(
-            steps=[
-                ("preprocessor", preprocessor),  # Preprocessing step
-                ("model", RandomForestRegressor(random_state=42)),  # Random Forest model
-            ]
+    def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+        _validate_training_data(X_train, y_train)
+
+        logging.info("Initializing Histogram Gradient Boosting model with native categoricals.")
+        preprocessor = self.build_preprocessor(X_train)
+
+        logging.info("Training Histogram Gradient Boosting model.")
+        pipeline = self._fit_pipeline(preprocessor, X_train, y_train)
+
+        n_iter = pipeline.named_steps["model"].n_iter_
+        logging.info(f"Model training completed after {n_iter} iteration(s).")
+        return pipeline
+
+    def make_estimator(self) -> RegressorMixin:
+        return HistGradientBoostingRegressor(
+            max_iter=self.max_iter,
+            learning_rate=self.learning_rate,
+            early_stopping=self.early_stopping,
+            categorical_features=self.categorical_mask_,
+            random_state=self.random_state,
         )
 
-        logging.info("Training Random Forest model.")
-        pipeline.fit(X_train, y_train)  # Fit the pipeline to the training data
+
+# Concrete Strategy tuning another strategy's estimator with successive halving
+class SuccessiveHalvingStrategy(ModelBuildingStrategy):
+    DEFAULT_PARAM_DISTRIBUTIONS = {
+        "max_depth": [None, 8, 16, 32],
+        "min_samples_leaf": [1, 2, 4, 8],
+        "max_features": [0.3, 0.6, 1.0],
+    }
+
+    def __init__(
+        self,
+        base_strategy: ModelBuildingStrategy = None,
+        param_distributions: dict = None,
+        resource: str = "n_estimators",
+        n_candidates: int = 27,
+        eta: int = 3,
+        time_budget_s: float = None,
+        max_workers: int = None,
+        cache: PreprocessingCache = None,
+    ):
+        """
+        Parameters:
+        base_strategy (ModelBuildingStrategy): Strategy whose estimator is tuned, Random Forest by default.
+        param_distributions (dict): Search space, defaults to a Random Forest space.
+        resource (str): 'n_samples' or an estimator parameter such as 'n_estimators'.
+        n_candidates (int), eta (int): Candidates in the first round and the halving factor.
+        time_budget_s (float): Wall-clock cap for the search. The final fit of the best
+            candidate on the full training data is excluded and comes on top.
+        max_workers (int): Number of parallel trials.
+        cache (PreprocessingCache): Optional cache for the preprocessed matrix.
+        """
+        self.base_strategy = base_strategy or RandomForestStrategy()
+        self.param_distributions = param_distributions or self.DEFAULT_PARAM_DISTRIBUTIONS
+        self.resource = resource
+        self.n_candidates = n_candidates
+        self.eta = eta
+        self.time_budget_s = time_budget_s
+        self.max_workers = max_workers
+        self.cache = cache or PreprocessingCache()
+        self.best_params_ = None
+        self.trials_ = None
+
+    def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+        _validate_training_data(X_train, y_train)
+
+        logging.info("Tuning hyperparameters with successive halving.")
+        preprocessor, X_transformed = self.cache.fit_transform(self.build_preprocessor(X_train), X_train)
+        self.tune(X_transformed, y_train.to_numpy())
+
+        logging.info("Training the tuned model on the full training data.")
+        pipeline = self._fit_pipeline(self.build_preprocessor(X_train), X_train, y_train)
 
         logging.info("Model training completed.")
         return pipeline
 
+    def build_preprocessor(self, X_train: pd.DataFrame) -> TransformerMixin:
+        return self.base_strategy.build_preprocessor(X_train)
+
+    def tune(self, X_transformed: np.ndarray, y_train: np.ndarray) -> RegressorMixin:
+        """
+        Runs the search on an already preprocessed matrix (as ParallelModelTrainer workers do).
+
+        Returns:
+        RegressorMixin: The tuned, unfitted estimator.
+        """
+        search = SuccessiveHalvingSearch(
+            self.base_strategy.make_estimator(),
+            self.param_distributions,
+            n_candidates=self.n_candidates,
+            resource=self.resource,
+            eta=self.eta,
+            time_budget_s=self.time_budget_s,
+            max_workers=self.max_workers,
+        ).fit(X_transformed, y_train)
+        self.best_params_ = dict(search.best_params_)
+        if self.resource != "n_samples":
+            # The final model gets the largest budget of the search, e.g. the most trees,
+            # or after a timeout the largest one the best candidate was actually trained with
+            self.best_params_[self.resource] = search.best_budget_
+        self.trials_ = search.trials_
+        return self.make_estimator()
+
+    def make_estimator(self) -> RegressorMixin:
+        # Untuned until build_and_train_model or tune has run
+        return self.base_strategy.make_estimator().set_params(**(self.best_params_ or {}))
+
+
+# Concrete Strategy for incremental (out-of-core) training with partial_fit
+class IncrementalSGDStrategy(ModelBuildingStrategy):
+    def __init__(
+        self,
+        categories: dict = None,
+        warm_start_model: Pipeline = None,
+        chunksize: int = 10_000,
+        n_epochs: int = 1,
+        alpha: float = 1e-4,
+        eta0: float = 0.01,
+        cache: PreprocessingCache = None,
+    ):
+        """
+        Parameters:
+        categories (dict): Known categories per categorical column; fixes the encoded width.
+        warm_start_model (Pipeline): A pipeline previously trained by this strategy (e.g. the
+            deployed model). Training continues from its coefficients, so only the new rows
+            have to be streamed. Its preprocessor statistics are frozen: the coefficients were
+            fitted on that imputation and scaling, and moving them would shift every feature.
+        chunksize (int): Rows per partial_fit call when training from an in-memory frame.
+        n_epochs (int): Passes over an in-memory frame.
+        alpha (float), eta0 (float): Regularization and initial learning rate of the SGD model.
+        cache (PreprocessingCache): Unused, incremental fits never materialize the full matrix.
+        """
+        if warm_start_model is not None and not (
+            isinstance(warm_start_model.named_steps.get("preprocessor"), IncrementalPreprocessor)
+            and isinstance(warm_start_model.named_steps.get("model"), ScaledTargetSGDRegressor)
+        ):
+            raise ValueError("warm_start_model must be a pipeline trained by IncrementalSGDStrategy.")
+        self.categories = categories
+        self.warm_start_model = warm_start_model
+        self.freeze_preprocessor = warm_start_model is not None
+        self.chunksize = chunksize
+        self.n_epochs = n_epochs
+        self.alpha = alpha
+        self.eta0 = eta0
+        self.cache = cache
+
+    def make_estimator(self) -> RegressorMixin:
+        return ScaledTargetSGDRegressor(alpha=self.alpha, eta0=self.eta0)
+
+    def partial_fit_chunks(self, chunks: Iterable[Tuple[pd.DataFrame, pd.Series]]) -> Pipeline:
+        """
+        Updates the model with a stream of (X, y) chunks.
+
+        Parameters:
+        chunks (Iterable): (X, y) chunks, e.g. iter_xy_chunks over ChunkedCSVDataIngestor output.
+
+        Returns:
+        Pipeline: The updated pipeline; calling again continues training it.
+        """
+        if self.warm_start_model is None:
+            logging.info("Initializing incremental SGD model.")
+            self.warm_start_model = Pipeline(
+                steps=[
+                    ("preprocessor", IncrementalPreprocessor(categories=self.categories)),
+                    ("model", self.make_estimator()),
+                ]
+            )
+        preprocessor = self.warm_start_model.named_steps["preprocessor"]
+        model = self.warm_start_model.named_steps["model"]
+
+        n_rows = 0
+        for X_chunk, y_chunk in chunks:
+            _validate_training_data(X_chunk, y_chunk)
+            if not self.freeze_preprocessor:
+                preprocessor.partial_fit(X_chunk)
+            model.partial_fit(preprocessor.transform(X_chunk), y_chunk.to_numpy())
+            n_rows += len(X_chunk)
+
+        logging.info(f"Incremental training consumed {n_rows} row(s).")
+        return self.warm_start_model
+
+    def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+        _validate_training_data(X_train, y_train)
+
+        logging.info("Training incremental SGD model.")
+        pipeline = None
+        for _ in range(self.n_epochs):
+            pipeline = self.partial_fit_chunks(iter_frame_chunks(X_train, y_train, self.chunksize))
+
+        logging.info("Model training completed.")
+        return pipeline
+
+
+# Registry of strategies selectable by name from the pipeline steps
+MODEL_STRATEGIES = {
+    "linear_regression": LinearRegressionStrategy,
+    "random_forest": RandomForestStrategy,
+    "gradient_boosting": GradientBoostingStrategy,
+    "ridge": RidgeStrategy,
+    "hist_gradient_boosting": HistGradientBoostingStrategy,
+    "random_forest_halving": SuccessiveHalvingStrategy,
+    "incremental_sgd": IncrementalSGDStrategy,
+}
+
 
 # Context Class for Model Building
 class ModelBuilder:
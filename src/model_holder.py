@@ -0,0 +1,163 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+from src.model_signature import ModelSignature
+from src.model_store import read_model
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+class _ModelSlot:
+    def __init__(self, model, version: str):
+        self.model = model
+        self.version = version
+        self.in_flight = 0
+
+
+# Hot-reloadable model holder
+# ---------------------------
+# Serving code scores through the holder instead of keeping its own model reference. A reload
+# loads the new version on a background thread and warms it with synthetic rows built from the
+# model signature (the first predict pays for lazy allocations and imports), then swaps it in
+# under a lock: the next call uses the new model while calls already running finish on the old
+# one. The old model is released only once its in-flight count has drained to zero.
+class ModelHolder:
+    def __init__(self, model, version: str = None, signature: ModelSignature = None,
+                 warmup_rows: int = 64, warmup_rounds: int = 3, drain_timeout_s: float = 30.0):
+        """
+        Parameters:
+        model: The initially served model.
+        version (str): Its version, usually the resolved model URI.
+        signature (ModelSignature): Used to build warm-up rows; without it no warm-up is done.
+        warmup_rows (int), warmup_rounds (int): Size and number of warm-up predict calls.
+        drain_timeout_s (float): Maximum wait for in-flight calls on the old model after a swap.
+        """
+        self.signature = signature
+        self.warmup_rows = warmup_rows
+        self.warmup_rounds = warmup_rounds
+        self.drain_timeout_s = drain_timeout_s
+        self.reloads = 0
+        self.last_reload_s = None
+        self._current = _ModelSlot(model, version)
+        self._condition = threading.Condition()
+        self._reload_lock = threading.Lock()
+        self._listeners = []
+        self._watcher = None
+        self._stop_watching = threading.Event()
+
+    @property
+    def version(self) -> str:
+        return self._current.version
+
+    @property
+    def model(self):
+        return self._current.model
+
+    def add_listener(self, listener: Callable[[str], None]):
+        """Registers a function called with the new version after every swap."""
+        self._listeners.append(listener)
+
+    @contextmanager
+    def acquire(self):
+        """Yields the current model, which stays alive until the block exits."""
+        with self._condition:
+            slot = self._current
+            slot.in_flight += 1
+        try:
+            yield slot.model
+        finally:
+            with self._condition:
+                slot.in_flight -= 1
+                self._condition.notify_all()
+
+    def predict(self, X):
+        with self.acquire() as model:
+            return model.predict(X)
+
+    def _warm_up(self, model):
+        if self.signature is None:
+            return
+        rows = self.signature.example_frame(self.warmup_rows)
+        for _ in range(self.warmup_rounds):
+            model.predict(rows)
+            model.predict(rows.iloc[:1])
+
+    def swap(self, model, version: str):
+        """
+        Atomically replaces the served model, then waits for calls on the old one to drain.
+        """
+        with self._condition:
+            old, self._current = self._current, _ModelSlot(model, version)
+        logging.info(f"Now serving model {version} (was {old.version}).")
+        for listener in self._listeners:
+            listener(version)
+
+        with self._condition:
+            drained = self._condition.wait_for(lambda: old.in_flight == 0, timeout=self.drain_timeout_s)
+        if not drained:
+            logging.warning(f"{old.in_flight} call(s) still running on model {old.version} after the drain timeout.")
+        old.model = None
+
+    def reload(self, model_uri: str) -> bool:
+        """
+        Loads, warms up and swaps in model_uri. Returns False if it is already being served.
+        """
+        with self._reload_lock:
+            if model_uri == self.version:
+                return False
+            start = time.perf_counter()
+            model = read_model(model_uri)
+            self._warm_up(model)
+            self.swap(model, model_uri)
+            self.reloads += 1
+            self.last_reload_s = time.perf_counter() - start
+            return True
+
+    def reload_async(self, model_uri: str) -> threading.Thread:
+        """Runs reload on a background thread; serving continues on the current model meanwhile."""
+
+        def run():
+            try:
+                self.reload(model_uri)
+            except Exception as e:
+                logging.error(f"Reloading model {model_uri} failed, keeping {self.version}: {e}")
+
+        thread = threading.Thread(target=run, name="model-reload", daemon=True)
+        thread.start()
+        return thread
+
+    def watch(self, version_fn: Callable[[], str], interval_s: float = 30.0) -> threading.Thread:
+        """
+        Polls version_fn (e.g. the deployed model URI) and reloads whenever it changes.
+        """
+
+        def run():
+            while not self._stop_watching.wait(interval_s):
+                try:
+                    version = version_fn()
+                except Exception as e:
+                    logging.warning(f"Could not check the model version: {e}")
+                    continue
+                if version != self.version:
+                    self.reload_async(version).join()
+
+        self._stop_watching.clear()
+        self._watcher = threading.Thread(target=run, name="model-watch", daemon=True)
+        self._watcher.start()
+        return self._watcher
+
+    def stop_watching(self):
+        self._stop_watching.set()
+
+    def metrics(self) -> dict:
+        return {
+            "version": self.version,
+            "in_flight": self._current.in_flight,
+            "reloads": self.reloads,
+            "last_reload_s": self.last_reload_s,
+        }
+
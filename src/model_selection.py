@@ -0,0 +1,166 @@
+import logging
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Tuple
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.base import RegressorMixin
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from sklearn.pipeline import Pipeline
+
+from src.model_building import ModelBuildingStrategy
+from src.preprocessing_cache import PreprocessingCache
+from src.shared_arrays import SharedArray, get_shared_array
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def _fit_and_score(
+    name: str, estimator: RegressorMixin, specs: dict, tuning_strategy: ModelBuildingStrategy = None
+) -> Tuple[dict, RegressorMixin]:
+    """
+    Fits one estimator on the shared matrices and measures it (runs in a worker process). A
+    strategy that tunes its estimator first (SuccessiveHalvingStrategy) runs its search here.
+    """
+    X_train, y_train = get_shared_array(specs["X_train"]), get_shared_array(specs["y_train"])
+    X_val, y_val = get_shared_array(specs["X_val"]), get_shared_array(specs["y_val"])
+
+    tune_time = 0.0
+    if tuning_strategy is not None:
+        # The trainer already runs one strategy per CPU: a search pool per worker would
+        # oversubscribe the machine, so its trials run one at a time
+        tuning_strategy.max_workers = 1
+        start = time.perf_counter()
+        estimator = tuning_strategy.tune(X_train, y_train)
+        tune_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    estimator.fit(X_train, y_train)
+    fit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    y_pred = estimator.predict(X_val)
+    predict_time = time.perf_counter() - start
+
+    row = {
+        "strategy": name,
+        "tune_time_s": tune_time,
+        "fit_time_s": fit_time,
+        "predict_latency_ms_per_row": 1000 * predict_time / max(len(y_val), 1),
+        "model_size_bytes": len(pickle.dumps(estimator, protocol=pickle.HIGHEST_PROTOCOL)),
+        "Mean Squared Error": mean_squared_error(y_val, y_pred),
+        "Mean Absolute Error": mean_absolute_error(y_val, y_pred),
+        "R-Squared": r2_score(y_val, y_pred),
+    }
+    return row, estimator
+
+
+# Trains several model building strategies side by side
+# ------------------------------------------------------
+# The data is preprocessed once per distinct strategy preprocessor (build_preprocessor), the
+# dense matrices are placed in shared memory and every worker fits only the strategy's
+# estimator on them. Strategies that tune their estimator
+# (SuccessiveHalvingStrategy) run the search in their worker, on the same matrices.
+class ParallelModelTrainer:
+    def __init__(
+        self,
+        strategies: Dict[str, ModelBuildingStrategy],
+        max_workers: int = None,
+        cache: PreprocessingCache = None,
+    ):
+        """
+        Parameters:
+        strategies (dict): Strategy name -> ModelBuildingStrategy exposing `make_estimator`.
+        max_workers (int): Size of the process pool, defaults to one worker per
+            strategy capped at the CPU count.
+        cache (PreprocessingCache): Optional cache for the preprocessed matrices.
+        """
+        if not strategies:
+            raise ValueError("At least one strategy is required.")
+        self.strategies = strategies
+        self.max_workers = max_workers or min(len(strategies), os.cpu_count() or 1)
+        self.cache = cache or PreprocessingCache()
+
+    def train(
+        self, X_train: pd.DataFrame, y_train: pd.Series, X_val: pd.DataFrame, y_val: pd.Series
+    ) -> Tuple[pd.DataFrame, Dict[str, Pipeline]]:
+        """
+        Trains every strategy and ranks them on the validation data.
+
+        Returns:
+        tuple: The leaderboard sorted by validation MSE, and the fitted pipelines by strategy name.
+        """
+        # Strategies expecting the same (unfitted) preprocessor share one set of matrices, e.g.
+        # HistGradientBoostingStrategy gets its ordinal-encoded one and the rest the one-hot one
+        groups = {}
+        for name, strategy in self.strategies.items():
+            preprocessor = strategy.build_preprocessor(X_train)
+            groups.setdefault(joblib.hash(preprocessor), (preprocessor, []))[1].append(name)
+
+        shared = {
+            "y_train": SharedArray(y_train.to_numpy(dtype=np.float64)),
+            "y_val": SharedArray(y_val.to_numpy(dtype=np.float64)),
+        }
+        blocks = list(shared.values())
+        try:
+            preprocessors, specs = {}, {}
+            for preprocessor, names in groups.values():
+                preprocessor, X_train_matrix = self.cache.fit_transform(preprocessor, X_train)
+                matrices = {
+                    "X_train": SharedArray(np.asarray(X_train_matrix, dtype=np.float64)),
+                    "X_val": SharedArray(np.asarray(self.cache.transform(preprocessor, X_val), dtype=np.float64)),
+                }
+                del X_train_matrix
+                blocks.extend(matrices.values())
+                group_specs = {key: block.spec for key, block in {**shared, **matrices}.items()}
+                for name in names:
+                    preprocessors[name], specs[name] = preprocessor, group_specs
+
+            logging.info(
+                f"Training {len(self.strategies)} strategies on {len(groups)} preprocessed matrix set(s) "
+                f"with {self.max_workers} worker(s)."
+            )
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        _fit_and_score,
+                        name,
+                        strategy.make_estimator(),
+                        specs[name],
+                        # Not yet tuned: the worker runs the search on the shared matrices
+                        strategy if hasattr(strategy, "tune") and strategy.best_params_ is None else None,
+                    )
+                    for name, strategy in self.strategies.items()
+                ]
+                results = [future.result() for future in futures]
+        finally:
+            for block in blocks:
+                block.close()
+
+        leaderboard = (
+            pd.DataFrame([row for row, _ in results])
+            .sort_values("Mean Squared Error")
+            .reset_index(drop=True)
+        )
+        models = {
+            row["strategy"]: Pipeline(steps=[("preprocessor", preprocessors[row["strategy"]]), ("model", estimator)])
+            for row, estimator in results
+        }
+        logging.info(f"Model leaderboard:\n{leaderboard.to_string(index=False)}")
+        return leaderboard, models
+
+
+# Example usage
+if __name__ == "__main__":
+    # Example usage with the registered strategies
+    # from src.model_building import MODEL_STRATEGIES
+    # trainer = ParallelModelTrainer({name: cls() for name, cls in MODEL_STRATEGIES.items()}, max_workers=4)
+    # leaderboard, models = trainer.train(X_train, y_train, X_val, y_val)
+    # print(leaderboard)
+
+    pass
@@ -0,0 +1,183 @@
+import json
+import logging
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+# Model Signature
+# ---------------
+# Everything the serving side needs to know about the training frame: column order, dtypes,
+# category vocabularies and imputation constants. It is emitted once at training time, so the
+# predictor validates and coerces payloads without re-reading Housing.csv or re-fitting encoders.
+class ModelSignature:
+    def __init__(self, columns: list, dtypes: dict, categories: dict, fill_values: dict):
+        """
+        Parameters:
+        columns (list): Feature columns in the order the model expects them.
+        dtypes (dict): Column -> numpy dtype name.
+        categories (dict): Categorical column -> known categories.
+        fill_values (dict): Column -> value used for missing entries.
+        """
+        self.columns = list(columns)
+        self.dtypes = dict(dtypes)
+        self.categories = {column: list(values) for column, values in categories.items()}
+        self.fill_values = dict(fill_values)
+        self._numeric = [c for c in self.columns if c not in self.categories]
+        self._category_sets = {column: set(values) for column, values in self.categories.items()}
+
+    @classmethod
+    def from_training_data(cls, X_train: pd.DataFrame, pipeline=None) -> "ModelSignature":
+        """
+        Builds the signature of a training frame.
+
+        Vocabularies and imputation constants are read from the fitted preprocessing of the
+        pipeline when it can be compiled; otherwise they are computed from X_train (mean for
+        numeric columns, most frequent value for categoricals).
+
+        Parameters:
+        X_train (pd.DataFrame): The training features.
+        pipeline (Pipeline): Optional fitted pipeline trained on X_train.
+
+        Returns:
+        ModelSignature: The signature.
+        """
+        categorical = X_train.select_dtypes(include=["object", "category"]).columns
+        numeric = X_train.columns.difference(categorical, sort=False)
+
+        categories = {c: sorted(X_train[c].dropna().unique().tolist()) for c in categorical}
+        fill_values = {c: float(X_train[c].mean()) for c in numeric}
+        for c in categorical:
+            mode = X_train[c].mode()
+            fill_values[c] = mode.iloc[0] if len(mode) else None
+
+        if pipeline is not None:
+            fill_values.update(cls._fitted_constants(pipeline, categories))
+
+        return cls(
+            columns=X_train.columns.tolist(),
+            dtypes={c: str(dtype) for c, dtype in X_train.dtypes.items()},
+            categories=categories,
+            fill_values=fill_values,
+        )
+
+    @staticmethod
+    def _fitted_constants(pipeline, categories: dict) -> dict:
+        from src.pipeline_compiler import compile_preprocessor
+
+        try:
+            # Everything before the model, including the fused step preprocessing if any
+            compiled = compile_preprocessor(pipeline[:-1] if len(pipeline) > 2 else pipeline[0])
+        except (NotImplementedError, AttributeError, TypeError) as e:
+            logging.info(f"Using training data statistics for the signature: {e}")
+            return {}
+
+        fill_values = {}
+        for block in compiled.blocks:
+            if block["kind"] == "numeric":
+                for column, fill in zip(block["columns"], block["row_fill"]):
+                    if not np.isnan(fill):
+                        fill_values[column] = fill
+            else:
+                column = block["columns"][0]
+                categories[column] = block["vocabulary"].tolist()
+                if block["fill_value"] is not None:
+                    fill_values[column] = block["fill_value"]
+        return fill_values
+
+    def to_dict(self) -> dict:
+        return {
+            "columns": self.columns,
+            "dtypes": self.dtypes,
+            "categories": self.categories,
+            "fill_values": self.fill_values,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ModelSignature":
+        return cls(data["columns"], data["dtypes"], data["categories"], data["fill_values"])
+
+    def save(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2, default=lambda value: value.item())
+
+    @staticmethod
+    def load(path: str) -> "ModelSignature":
+        """Loads a signature file, once per process and path."""
+        return _load_signature(path)
+
+    def example_frame(self, n_rows: int = 64) -> pd.DataFrame:
+        """
+        Builds synthetic rows matching the signature, e.g. to warm up a freshly loaded model.
+
+        Numeric columns take their imputation constant and categorical columns cycle through
+        their vocabulary, so every encoder branch is exercised.
+        """
+        columns = {}
+        for column in self.columns:
+            if column in self.categories:
+                vocabulary = self.categories[column] or [self.fill_values.get(column)]
+                columns[column] = [vocabulary[i % len(vocabulary)] for i in range(n_rows)]
+            else:
+                fill = self.fill_values.get(column)
+                columns[column] = np.full(n_rows, np.nan if fill is None else fill)
+        return self.coerce(pd.DataFrame(columns))
+
+    def coerce(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Validates a payload frame and coerces it to the training schema, column by column.
+
+        Extra columns (e.g. the target) are dropped, columns are reordered, numeric columns are
+        parsed and cast, and missing entries receive the imputation constants. Unknown categories
+        are kept (the encoder ignores them) but logged.
+
+        Parameters:
+        df (pd.DataFrame): The incoming rows.
+
+        Returns:
+        pd.DataFrame: A new frame with exactly the signature's columns and dtypes; numeric
+        columns that needed no conversion share their data with df.
+        Raises ValueError when columns are missing or numeric values cannot be parsed.
+        """
+        missing = [c for c in self.columns if c not in df.columns]
+        if missing:
+            raise ValueError(f"Payload is missing columns: {missing}")
+
+        coerced = {}
+        invalid = []
+        for column in self._numeric:
+            raw = df[column]
+            dtype = np.dtype(self.dtypes[column])
+            if raw.dtype == dtype and not raw.hasnans:
+                # Already in the training dtype with nothing to impute: no copy
+                coerced[column] = raw
+                continue
+            values = pd.to_numeric(raw, errors="coerce")
+            if (values.isna() & raw.notna()).any():
+                invalid.append(column)
+            if dtype.kind in "iu" and values.isna().any():
+                # Mean imputation yields fractional values; truncating them would shift predictions
+                dtype = np.dtype(np.float64)
+            values = values.fillna(self.fill_values.get(column, np.nan))
+            coerced[column] = values.astype(dtype)
+        if invalid:
+            raise ValueError(f"Non-numeric values in numeric columns: {invalid}")
+
+        for column, known in self._category_sets.items():
+            values = df[column].astype(object).where(df[column].notna(), self.fill_values.get(column))
+            unknown = ~values.isin(known)
+            if unknown.any():
+                logging.warning(f"{int(unknown.sum())} unknown value(s) in column '{column}'.")
+            coerced[column] = values
+
+        return pd.DataFrame(coerced, index=df.index, copy=False)[self.columns]
+
+
+@lru_cache(maxsize=8)
+def _load_signature(path: str) -> ModelSignature:
+    with open(path) as f:
+        return ModelSignature.from_dict(json.load(f))
@@ -0,0 +1,54 @@
+import logging
+import os
+from functools import lru_cache
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def resolve_model_uri(model_uri: str) -> str:
+    """Maps 'deployed' to the model URI served by the continuous deployment pipeline."""
+    if model_uri != "deployed":
+        return model_uri
+
+    from zenml.integrations.mlflow.model_deployers import MLFlowModelDeployer
+
+    existing_services = MLFlowModelDeployer.get_active_model_deployer().find_model_server(
+        pipeline_name="continuous_deployment_pipeline",
+        pipeline_step_name="mlflow_model_deployer_step",
+    )
+    if not existing_services:
+        raise RuntimeError("No deployed model found.")
+    return existing_services[0].config.model_uri
+
+
+@lru_cache(maxsize=4)
+def load_model(model_uri: str):
+    """
+    Loads a trained pipeline once per process and URI (see read_model).
+    """
+    return read_model(model_uri)
+
+
+def read_model(model_uri: str):
+    """
+    Loads a trained pipeline, without caching.
+
+    Parameters:
+    model_uri (str): A local .pkl / .joblib file, any MLflow model URI (runs:/, models:/, a
+        model directory), or 'deployed' for the model currently served by the deployment pipeline.
+
+    Returns:
+    The fitted model, usually the sklearn Pipeline produced by model_building_step.
+    """
+    if model_uri.endswith((".pkl", ".joblib")) and os.path.isfile(model_uri):
+        import joblib
+
+        logging.info(f"Loading model from {model_uri}.")
+        return joblib.load(model_uri)
+
+    import mlflow
+
+    model_uri = resolve_model_uri(model_uri)
+    logging.info(f"Loading MLflow model from {model_uri}.")
+    return mlflow.sklearn.load_model(model_uri)
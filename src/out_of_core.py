@@ -0,0 +1,276 @@
+import logging
+import time
+from typing import Iterator, List, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.pipeline import Pipeline
+from src.csv_row_index import reservoir_sample
+from src.data_splitter import HashTrainTestSplit
+from src.incremental_learning import IncrementalPreprocessor, ScaledTargetSGDRegressor
+from src.ingest_data import ChunkedCSVDataIngestor
+from src.model_signature import ModelSignature
+from src.preprocessing_compiler import STEP_NAME, compile_preprocessing
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# Peak working set of one chunk, as a multiple of its parsed size: the parser buffers, the
+# filtered and transformed copies and the encoded float64 matrix fed to partial_fit
+WORKING_SET_FACTOR = 8
+
+
+class CSVChunkStream:
+    """A CSV file as a re-iterable stream: every iteration reads it again, chunk by chunk."""
+
+    def __init__(self, file_path: str, chunksize: int):
+        self.file_path = file_path
+        self.chunksize = chunksize
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        # Chunks keep the row numbers of the file as index, which the hash split keys on
+        return iter(ChunkedCSVDataIngestor(self.chunksize).ingest(self.file_path))
+
+
+def estimate_chunksize(file_path: str, memory_limit_mb: float, sample_rows: int = 10_000) -> int:
+    """
+    Rows per chunk so that one chunk's working set stays within memory_limit_mb.
+
+    The limit covers the data only; the interpreter and imported libraries come on top.
+    """
+    sample = pd.read_csv(file_path, nrows=sample_rows)
+    bytes_per_row = sample.memory_usage(deep=True).sum() / max(len(sample), 1)
+    chunksize = int(memory_limit_mb * 1e6 / (bytes_per_row * WORKING_SET_FACTOR))
+    if chunksize < 1_000:
+        raise ValueError(f"A memory limit of {memory_limit_mb} MB leaves chunks of {chunksize} rows.")
+    return chunksize
+
+
+# Streaming z-score outlier filter
+# --------------------------------
+# OutlierDetector(ZScoreOutlierDetection(threshold)).handle_outliers(method="remove") over a
+# stream: the first pass merges per-chunk means and sums of squared deviations (Chan et al.),
+# later passes drop the rows whose |z| exceeds the threshold in any numeric column. As with
+# scipy.stats.zscore, a column with missing values or no spread flags nothing.
+class StreamingZScoreFilter:
+    def __init__(self, threshold: float = 3):
+        self.threshold = threshold
+        self.columns_ = None
+
+    def update(self, df: pd.DataFrame):
+        # A column is numeric in the whole file only if it is numeric in every chunk
+        numeric = df.select_dtypes(include=[int, float]).columns.tolist()
+        if self.columns_ is None:
+            self.columns_ = numeric
+            self.count_ = {column: 0 for column in numeric}
+            self.mean_ = {column: 0.0 for column in numeric}
+            self.M2_ = {column: 0.0 for column in numeric}
+            self.has_missing_ = {column: False for column in numeric}
+        self.columns_ = [column for column in self.columns_ if column in numeric]
+
+        for column in self.columns_:
+            values = df[column].to_numpy(dtype=np.float64)
+            if np.isnan(values).any():
+                self.has_missing_[column] = True
+                continue
+            if not len(values):
+                continue
+            n_a, mean_a = self.count_[column], self.mean_[column]
+            n_b, mean_b = len(values), float(values.mean())
+            n = n_a + n_b
+            delta = mean_b - mean_a
+            self.count_[column] = n
+            self.mean_[column] = mean_a + delta * n_b / n
+            self.M2_[column] += float(((values - mean_b) ** 2).sum()) + delta * delta * n_a * n_b / n
+
+    def keep_mask(self, df: pd.DataFrame) -> np.ndarray:
+        keep = np.ones(len(df), dtype=bool)
+        for column in self.columns_:
+            std = np.sqrt(self.M2_[column] / self.count_[column]) if self.count_[column] else 0.0
+            if self.has_missing_[column] or std == 0:
+                continue
+            z = (df[column].to_numpy(dtype=np.float64) - self.mean_[column]) / std
+            keep &= np.abs(z) <= self.threshold
+        return keep
+
+
+class StreamingRegressionMetrics:
+    """Mean squared error and R-squared accumulated over chunks, as RegressionModelEvaluationStrategy."""
+
+    def __init__(self):
+        self.n = 0
+        self.squared_error = 0.0
+        self.mean = 0.0
+        self.M2 = 0.0
+
+    def update(self, y_true, y_pred):
+        y_true = np.asarray(y_true, dtype=np.float64)
+        if not len(y_true):
+            return
+        self.squared_error += float(((y_true - np.asarray(y_pred, dtype=np.float64)) ** 2).sum())
+        n_b, mean_b = len(y_true), float(y_true.mean())
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.M2 += float(((y_true - mean_b) ** 2).sum()) + delta * delta * self.n * n_b / n
+        self.mean += delta * n_b / n
+        self.n = n
+
+    def metrics(self) -> dict:
+        mse = self.squared_error / self.n
+        r2 = 1.0 - self.squared_error / self.M2 if self.M2 > 0 else float("nan")
+        return {"Mean Squared Error": mse, "R-Squared": r2}
+
+
+# Out-of-core training
+# --------------------
+# ml_pipeline for files that do not fit in memory: ingestion, outlier filtering, splitting,
+# step preprocessing (missing values, feature engineering), training and evaluation all run
+# over the CSV chunk by chunk, so memory is bounded by the chunk size whatever the file size.
+# Statistics come from dedicated passes before the model sees any row:
+#   1. outlier moments and category vocabularies over all rows;
+#   2. one pass per step preprocessing stage that needs statistics (FusedPreprocessor.fit_chunks);
+#   3. imputation / scaling statistics of the model preprocessor;
+# then n_epochs training passes with frozen preprocessing and an evaluation pass over the test
+# rows. The split is HashTrainTestSplit (row number keyed), which needs no shuffle. The result
+# has the shape model_building_step returns with step preprocessing, ending with the
+# IncrementalSGDStrategy preprocessor and model, so it can be warm-started later.
+class OutOfCoreTrainer:
+    def __init__(
+        self,
+        file_path: str,
+        target_column: str = "price",
+        memory_limit_mb: float = 512,
+        chunksize: int = None,
+        missing_values: dict = None,
+        feature_engineering: list = None,
+        outlier_threshold: float = 3,
+        test_size: float = 0.2,
+        n_epochs: int = 1,
+        alpha: float = 1e-4,
+        eta0: float = 0.01,
+        signature_sample_size: int = 10_000,
+    ):
+        """
+        Parameters:
+        file_path (str): The training CSV.
+        target_column (str): Column to predict.
+        memory_limit_mb (float): Memory the data may take at once; sets the chunk size.
+        chunksize (int): Rows per chunk, overriding memory_limit_mb.
+        missing_values (dict), feature_engineering (list): Step preprocessing configurations, as
+            in model_building_step.
+        outlier_threshold (float): Z-score threshold of the outlier filter.
+        test_size (float): Fraction of rows held out for evaluation.
+        n_epochs (int): Training passes.
+        alpha (float), eta0 (float): Regularization and initial learning rate of the SGD model.
+        signature_sample_size (int): Training rows sampled for the model signature.
+        """
+        self.file_path = file_path
+        self.target_column = target_column
+        self.memory_limit_mb = memory_limit_mb
+        self.chunksize = chunksize
+        self.missing_values = missing_values
+        self.feature_engineering = feature_engineering
+        self.outlier_threshold = outlier_threshold
+        self.test_size = test_size
+        self.n_epochs = n_epochs
+        self.alpha = alpha
+        self.eta0 = eta0
+        self.signature_sample_size = signature_sample_size
+
+    def _timed(self, name: str, chunks: Iterator) -> Iterator:
+        """Passes the chunks through while recording the pass duration and row count."""
+        start, rows = time.perf_counter(), 0
+        for chunk in chunks:
+            rows += len(chunk[0]) if isinstance(chunk, tuple) else len(chunk)
+            yield chunk
+        self.passes_.append({"pass": name, "seconds": time.perf_counter() - start, "rows": rows})
+        logging.info(f"Pass '{name}': {rows} row(s) in {self.passes_[-1]['seconds']:.1f}s.")
+
+    def _split_chunks(self, test: bool) -> Iterator[Tuple[pd.DataFrame, pd.Series]]:
+        for chunk in self.stream_:
+            keep = self.outliers_.keep_mask(chunk)
+            keep &= self.splitter_.test_mask(chunk) if test else ~self.splitter_.test_mask(chunk)
+            chunk = chunk[keep]
+            X, y = chunk.drop(columns=[self.target_column]), chunk[self.target_column]
+            if not test:
+                rows = self.step_preprocessing_.training_row_mask(X)
+                X, y = X[rows], y[rows]
+            if len(X):
+                yield X, y
+
+    def _training_frames(self, name: str):
+        return lambda: self._timed(name, (X for X, _ in self._split_chunks(test=False)))
+
+    def fit(self) -> "OutOfCoreTrainer":
+        """Trains and evaluates; sets pipeline_, signature_, metrics_ and passes_."""
+        self.passes_: List[dict] = []
+        chunksize = self.chunksize or estimate_chunksize(self.file_path, self.memory_limit_mb)
+        logging.info(f"Streaming {self.file_path} in chunks of {chunksize} rows.")
+        self.stream_ = CSVChunkStream(self.file_path, chunksize)
+        self.splitter_ = HashTrainTestSplit(test_size=self.test_size)
+        self.step_preprocessing_ = compile_preprocessing(self.missing_values, self.feature_engineering)
+
+        # 1. Outlier statistics and vocabularies over the whole file. The z-scores are taken on
+        # the raw values (e.g. 'area' rather than log1p('area')): the step preprocessing is only
+        # fitted on the rows this filter keeps, so unlike ml_pipeline this may drop other rows.
+        self.outliers_ = StreamingZScoreFilter(self.outlier_threshold)
+        vocabularies = {}
+        for chunk in self._timed("outlier statistics", iter(self.stream_)):
+            self.outliers_.update(chunk)
+            for column in chunk.select_dtypes(include=["object", "category"]).columns:
+                vocabularies.setdefault(column, set()).update(chunk[column].dropna().unique().tolist())
+
+        # 2. Step preprocessing statistics, one pass per stage that needs them
+        self.step_preprocessing_.fit_chunks(self._training_frames("step preprocessing statistics"))
+        output_columns = set(self.step_preprocessing_.get_feature_names_out())
+
+        # 3. Model preprocessor statistics (the signature sample is drawn in the same pass);
+        # categories are fixed to the full-file vocabularies, so no chunk widens the encoding
+        categories = {c: sorted(values) for c, values in vocabularies.items() if c in output_columns}
+        preprocessor = IncrementalPreprocessor(categories=categories)
+        model = ScaledTargetSGDRegressor(alpha=self.alpha, eta0=self.eta0)
+
+        def fit_preprocessor(frames):
+            for X in frames:
+                preprocessor.partial_fit(self.step_preprocessing_.transform(X))
+                yield X
+
+        sample = reservoir_sample(
+            fit_preprocessor(self._training_frames("model preprocessor statistics")()),
+            n=self.signature_sample_size,
+            random_state=0,
+        )
+
+        # 4. Training with frozen preprocessing
+        for epoch in range(self.n_epochs):
+            for X, y in self._timed(f"training epoch {epoch + 1}", self._split_chunks(test=False)):
+                model.partial_fit(preprocessor.transform(self.step_preprocessing_.transform(X)), y.to_numpy())
+        self.pipeline_ = Pipeline(
+            steps=[(STEP_NAME, self.step_preprocessing_), ("preprocessor", preprocessor), ("model", model)]
+        )
+
+        # 5. Evaluation on the held-out rows
+        evaluation = StreamingRegressionMetrics()
+        for X, y in self._timed("evaluation", self._split_chunks(test=True)):
+            evaluation.update(y.to_numpy(), self.pipeline_.predict(X))
+        self.metrics_ = evaluation.metrics()
+        logging.info(f"Model Evaluation Metrics: {self.metrics_}")
+
+        # Vocabularies from the whole file rather than the sample, which may miss rare categories
+        signature = ModelSignature.from_training_data(sample, self.pipeline_)
+        categories = {c: sorted(vocabularies[c]) if c in vocabularies else v for c, v in signature.categories.items()}
+        self.signature_ = ModelSignature(signature.columns, signature.dtypes, categories, signature.fill_values)
+        return self
+
+
+# Example usage
+if __name__ == "__main__":
+    # trainer = OutOfCoreTrainer(
+    #     "large_housing.csv",
+    #     memory_limit_mb=256,
+    #     missing_values={"strategy": "mean"},
+    #     feature_engineering=[{"strategy": "log", "features": ["area"]}],
+    # ).fit()
+    # trainer.pipeline_, trainer.metrics_, trainer.passes_
+
+    pass
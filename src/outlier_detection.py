@@ -1,11 +1,8 @@
 import logging
 from abc import ABC, abstractmethod
-from scipy.stats import zscore
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
 
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -23,6 +20,8 @@ class ZScoreOutlierDetection(OutlierDetectionStrategy):
         self.threshold = threshold
 
     def detect_outliers(self, df: pd.DataFrame , numeric_cols: pd.core.indexes.base.Index) -> pd.DataFrame:
+        from scipy.stats import zscore
+
         logging.info("Detecting outliers using the Z-score method.")
         z_scores = zscore(df[numeric_cols])
         outliers = (z_scores > self.threshold) | (z_scores < -self.threshold)
@@ -86,6 +85,10 @@ class OutlierDetector:
         return df_cleaned
 
     def visualize_outliers(self, df: pd.DataFrame, features: list):
+        # Plotting libraries are slow to import and only needed here
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         logging.info(f"Visualizing outliers for features: {features}")
         for feature in features:
             plt.figure(figsize=(10, 6))
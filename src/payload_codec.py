@@ -0,0 +1,173 @@
+import logging
+import mmap
+import struct
+from typing import Union
+
+import numpy as np
+import orjson
+import pandas as pd
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# Binary columnar frame layout:
+#   magic (4 bytes) | version (uint8) | 3 reserved bytes | header length (uint32, little endian)
+#   | header (orjson) | padding to 8 bytes | column buffers, each starting on an 8-byte boundary
+MAGIC = b"HPCF"
+VERSION = 1
+_PREAMBLE = struct.Struct("<4sB3xI")
+_ALIGNMENT = 8
+
+BINARY_CONTENT_TYPE = "application/x-house-prices-frame"
+ARROW_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def _padding(size: int) -> int:
+    return -size % _ALIGNMENT
+
+
+def _code_dtype(vocabulary_size: int) -> str:
+    for dtype in ("<i1", "<i2"):
+        if vocabulary_size <= np.iinfo(dtype).max:
+            return dtype
+    return "<i4"
+
+
+def encode_frame(df: pd.DataFrame) -> bytes:
+    """
+    Serializes a frame into the binary columnar format.
+
+    Numeric and boolean columns are written as their raw little-endian buffers; nullable ones
+    (Int64, Float64, boolean) as their numpy dtype, or as float64 with NaN when values are
+    missing (so decoded Int64 columns with missing values come back as float64). Text columns are
+    dictionary-encoded: codes in the buffer (-1 for missing; int8 when the vocabulary allows, up
+    to int32) and the vocabulary in the header.
+
+    Parameters:
+    df (pd.DataFrame): The rows to send.
+
+    Returns:
+    bytes: The payload, decoded by decode_frame.
+    """
+    columns, buffers, offset = [], [], 0
+    for name in df.columns:
+        series = df[name]
+        entry = {"name": str(name)}
+        if isinstance(series.dtype, pd.api.extensions.ExtensionDtype) and series.dtype.kind in "biuf":
+            dtype = np.dtype(np.float64) if series.hasnans else series.dtype.numpy_dtype
+            values = np.ascontiguousarray(series.to_numpy(dtype=dtype, na_value=np.nan), dtype=dtype.newbyteorder("<"))
+        elif series.dtype.kind in "biuf":
+            values = np.ascontiguousarray(series.to_numpy(), dtype=series.dtype.newbyteorder("<"))
+        else:
+            codes, vocabulary = pd.factorize(series, use_na_sentinel=True)
+            values = codes.astype(_code_dtype(len(vocabulary)))
+            entry["vocabulary"] = vocabulary.tolist()
+        entry.update({"dtype": values.dtype.str, "offset": offset, "nbytes": values.nbytes})
+        columns.append(entry)
+        buffers.append(values)
+        offset += values.nbytes + _padding(values.nbytes)
+
+    header = orjson.dumps({"n_rows": len(df), "columns": columns})
+    parts = [_PREAMBLE.pack(MAGIC, VERSION, len(header)), header, b"\0" * _padding(_PREAMBLE.size + len(header))]
+    for values in buffers:
+        parts.append(values.data)
+        parts.append(b"\0" * _padding(values.nbytes))
+    return b"".join(parts)
+
+
+def decode_frame(payload: Union[bytes, bytearray, memoryview, mmap.mmap], categorical: bool = False) -> pd.DataFrame:
+    """
+    Deserializes a binary columnar payload.
+
+    Numeric columns are views on the payload buffer (no copy; read-only if it is bytes), so the
+    payload may be a memory-mapped file. Text columns are rebuilt from their codes and
+    vocabulary, as object columns or, with categorical=True, as Categoricals over the codes (no
+    per-row objects).
+    """
+    buffer = memoryview(payload)
+    magic, version, header_length = _PREAMBLE.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("Not a binary columnar frame.")
+    if version != VERSION:
+        raise ValueError(f"Unsupported frame version {version}.")
+
+    start = _PREAMBLE.size
+    header = orjson.loads(buffer[start:start + header_length])
+    start += header_length + _padding(start + header_length)
+
+    columns = {}
+    for entry in header["columns"]:
+        values = np.frombuffer(buffer, dtype=entry["dtype"], count=header["n_rows"], offset=start + entry["offset"])
+        if "vocabulary" in entry and categorical:
+            values = pd.Categorical.from_codes(values, categories=entry["vocabulary"])
+        elif "vocabulary" in entry:
+            # Code -1 (missing) picks the trailing None
+            values = np.asarray(entry["vocabulary"] + [None], dtype=object)[values]
+        columns[entry["name"]] = values
+    return pd.DataFrame(columns, copy=False)
+
+
+def encode_arrow(df: pd.DataFrame) -> bytes:
+    """Serializes a frame as an Arrow IPC stream (requires pyarrow)."""
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def decode_arrow(payload: bytes) -> pd.DataFrame:
+    """Deserializes an Arrow IPC stream or file (requires pyarrow)."""
+    import pyarrow as pa
+
+    if payload[:6] == b"ARROW1":
+        table = pa.ipc.open_file(pa.py_buffer(payload)).read_all()
+    else:
+        table = pa.ipc.open_stream(pa.py_buffer(payload)).read_all()
+    return table.to_pandas()
+
+
+def encode_json(df: pd.DataFrame) -> bytes:
+    """
+    Serializes a frame as JSON in DataFrame.to_json(orient="split") layout, through orjson.
+    """
+    data = {"columns": [str(c) for c in df.columns], "data": df.to_numpy(dtype=object).tolist()}
+    return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def decode_json(payload: Union[str, bytes]) -> pd.DataFrame:
+    """
+    Deserializes split-oriented JSON ({"columns": [...], "data": [[...], ...]}) or a list of
+    records, through orjson.
+    """
+    data = orjson.loads(payload)
+    if isinstance(data, list):
+        return pd.DataFrame.from_records(data)
+    return pd.DataFrame(data["data"], columns=data.get("columns"))
+
+
+def decode_payload(payload: Union[str, bytes]) -> pd.DataFrame:
+    """
+    Decodes any supported payload, detected from its first bytes: the binary columnar
+    format, an Arrow IPC stream/file, or JSON.
+    """
+    if isinstance(payload, str):
+        return decode_json(payload)
+    if payload[:4] == MAGIC:
+        return decode_frame(payload)
+    # Arrow IPC files start with "ARROW1", streams with the 0xFFFFFFFF continuation marker
+    if payload[:6] == b"ARROW1" or payload[:4] == b"\xff\xff\xff\xff":
+        return decode_arrow(payload)
+    return decode_json(payload)
+
+
+def encode_payload(df: pd.DataFrame, payload_format: str = "binary") -> bytes:
+    """
+    Encodes a frame as 'binary' (the columnar format), 'arrow' or 'json'.
+    """
+    encoders = {"binary": encode_frame, "arrow": encode_arrow, "json": encode_json}
+    if payload_format not in encoders:
+        raise ValueError(f"Unknown payload format '{payload_format}', expected one of {sorted(encoders)}.")
+    return encoders[payload_format](df)
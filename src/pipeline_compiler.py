@@ -0,0 +1,422 @@
+import logging
+import math
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+# Compiled, sklearn-free scorer
+# -----------------------------
+# Holds the fitted preprocessing as plain arrays: numeric fill values, an optional log1p mask and
+# affine scaling, and per categorical column a vocabulary plus the code used for missing values. For linear
+# models the coefficients are folded in as well, so a prediction is a dot product plus one table
+# lookup per categorical column. Only numpy is needed to score (and to unpickle, for linear models).
+class CompiledPipeline:
+    def __init__(self, blocks: List[dict], coef: np.ndarray = None, intercept: float = None, model: Any = None):
+        """
+        Parameters:
+        blocks (list): Preprocessing blocks in output order, as produced by compile_pipeline.
+        coef (np.ndarray), intercept (float): Linear model parameters, folded into the blocks.
+        model (Any): Fitted non-linear model applied to the compiled matrix instead.
+        """
+        self.blocks = blocks
+        self.model = model
+        self.n_features = sum(len(b["columns"]) if b["kind"] == "numeric" else len(b["vocabulary"]) for b in blocks)
+        self.intercept = None
+        if coef is not None:
+            self._fold_linear_model(np.asarray(coef, dtype=np.float64).ravel(), float(intercept))
+
+    def _fold_linear_model(self, coef: np.ndarray, intercept: float):
+        offset = 0
+        for block in self.blocks:
+            if block["kind"] == "numeric":
+                width = len(block["columns"])
+                c = coef[offset:offset + width]
+                block["weights"] = c / block["scale"]
+                intercept -= float(np.sum(c * block["shift"] / block["scale"]))
+                block["row_weights"] = block["weights"].tolist()
+            else:
+                width = len(block["vocabulary"])
+                # The trailing 0 is the contribution of an unknown category (code -1)
+                block["table"] = np.append(coef[offset:offset + width], 0.0)
+                known = ~pd.isna(block["vocabulary"]) | (block["vocabulary"] == None)  # noqa: E711
+                block["row_table"] = dict(zip(block["vocabulary"][known].tolist(), block["table"][:-1][known].tolist()))
+                # Weight of a NaN category, which a dict lookup cannot find
+                block["row_nan"] = float(np.sum(block["table"][:-1][~known]))
+            offset += width
+        self.intercept = intercept
+
+    @staticmethod
+    def _column(X, column) -> np.ndarray:
+        values = X[column]
+        return values.to_numpy() if isinstance(values, pd.Series) else np.asarray(values)
+
+    @staticmethod
+    def _codes(block: dict, values: np.ndarray) -> np.ndarray:
+        values = np.asarray(values, dtype=object)
+        nan = pd.isna(values) if values.size else np.zeros(0, dtype=bool)
+        # As in sklearn, SimpleImputer only fills NaN and None is a category of its own, unless
+        # the fused step preprocessing (pandas fillna) filled both
+        none = np.zeros(len(values), dtype=bool)
+        if not block.get("fills_none"):
+            none[nan] = [value is None for value in values[nan]]
+            nan &= ~none
+
+        # Hash lookup (-1 when unknown): works for an empty vocabulary and for categories mixing
+        # strings and numbers, which cannot be sorted or binary-searched. pandas does not tell
+        # None from NaN, so those categories are matched separately.
+        vocabulary = block["vocabulary"]
+        special = pd.isna(vocabulary) if len(vocabulary) else np.zeros(0, dtype=bool)
+        codes = np.full(len(values), -1, dtype=np.int64)
+        regular = ~(nan | none)
+        if regular.any() and not special.all():
+            positions = np.flatnonzero(~special)
+            found = pd.Index(vocabulary[~special], dtype=object).get_indexer(values[regular])
+            codes[regular] = np.where(found >= 0, positions[found], -1)
+        for position in np.flatnonzero(special):
+            codes[none if vocabulary[position] is None else nan] = position
+        if block["fill_value"] is not None:
+            codes[nan] = block["fill_code"]
+        return codes
+
+    def _numeric(self, block: dict, X) -> np.ndarray:
+        values = np.column_stack([self._column(X, c).astype(np.float64) for c in block["columns"]])
+        values = np.where(np.isnan(values), block["fill"], values)
+        if "log1p" in block:
+            values[:, block["log1p"]] = np.log1p(values[:, block["log1p"]])
+        return values
+
+    def transform(self, X) -> np.ndarray:
+        """
+        Builds the model input matrix from a DataFrame or a dict of column arrays.
+        """
+        n_rows = len(self._column(X, self._first_column()))
+        output = np.zeros((n_rows, self.n_features), dtype=np.float64)
+        offset = 0
+        for block in self.blocks:
+            if block["kind"] == "numeric":
+                width = len(block["columns"])
+                output[:, offset:offset + width] = (self._numeric(block, X) - block["shift"]) / block["scale"]
+            else:
+                width = len(block["vocabulary"])
+                codes = self._codes(block, self._column(X, block["columns"][0]))
+                known = codes >= 0
+                output[np.flatnonzero(known), offset + codes[known]] = 1.0
+            offset += width
+        return output
+
+    def _first_column(self):
+        return self.blocks[0]["columns"][0]
+
+    def predict(self, X) -> np.ndarray:
+        """
+        Scores a DataFrame or a dict of column arrays.
+        """
+        if self.intercept is None:
+            return self.model.predict(self.transform(X))
+
+        n_rows = len(self._column(X, self._first_column()))
+        prediction = np.full(n_rows, self.intercept)
+        for block in self.blocks:
+            if block["kind"] == "numeric":
+                prediction += self._numeric(block, X) @ block["weights"]
+            else:
+                prediction += block["table"][self._codes(block, self._column(X, block["columns"][0]))]
+        return prediction
+
+    def predict_row(self, row: Dict[str, Any]) -> float:
+        """
+        Scores a single record given as a dict, without building any array (linear models only).
+        """
+        if self.intercept is None:
+            return float(self.predict({key: [value] for key, value in row.items()})[0])
+
+        prediction = self.intercept
+        for block in self.blocks:
+            if block["kind"] == "numeric":
+                logs = block.get("row_log1p") or [False] * len(block["columns"])
+                for column, weight, fill, log in zip(block["columns"], block["row_weights"], block["row_fill"], logs):
+                    value = row.get(column)
+                    if value is None or (isinstance(value, float) and math.isnan(value)):
+                        value = fill
+                    prediction += weight * (math.log1p(value) if log else value)
+            else:
+                value = row.get(block["columns"][0])
+                nan = isinstance(value, float) and math.isnan(value)
+                if (nan or (value is None and block.get("fills_none"))) and block["fill_value"] is not None:
+                    value, nan = block["fill_value"], False
+                prediction += block["row_nan"] if nan else block["row_table"].get(value, 0.0)
+        return prediction
+
+
+def _kept_by_imputer(imputer) -> np.ndarray:
+    """
+    Columns a fitted SimpleImputer outputs: with keep_empty_features=False (the default) it
+    drops the columns that were all missing during fit, whose statistic is NaN.
+    """
+    statistics = np.asarray(imputer.statistics_, dtype=object)
+    if getattr(imputer, "keep_empty_features", False):
+        return np.ones(len(statistics), dtype=bool)
+    return ~pd.isna(statistics)
+
+
+def _numeric_block(columns: list, steps: list) -> dict:
+    from sklearn.impute import SimpleImputer
+    from sklearn.preprocessing import FunctionTransformer, StandardScaler
+
+    width = len(columns)
+    block = {
+        "kind": "numeric",
+        "columns": list(columns),
+        "fill": np.full(width, np.nan),
+        "shift": np.zeros(width),
+        "scale": np.ones(width),
+    }
+    scaled = False
+    for step in steps:
+        if isinstance(step, SimpleImputer) and not scaled:
+            kept = _kept_by_imputer(step)
+            block["columns"] = [column for column, keep in zip(block["columns"], kept) if keep]
+            block["fill"] = np.asarray(step.statistics_, dtype=np.float64)[kept]
+            block["shift"], block["scale"] = block["shift"][kept], block["scale"][kept]
+        elif isinstance(step, FunctionTransformer) and step.func is None:
+            # A fitted ColumnTransformer holds 'passthrough' columns as the identity transformer
+            continue
+        elif isinstance(step, StandardScaler) and not scaled:
+            scaled = True
+            if step.mean_ is not None:
+                block["shift"] = np.asarray(step.mean_, dtype=np.float64)
+            if step.scale_ is not None:
+                block["scale"] = np.asarray(step.scale_, dtype=np.float64)
+        else:
+            raise NotImplementedError(f"Cannot compile numeric transformer {type(step).__name__}.")
+    block["row_fill"] = block["fill"].tolist()
+    return block
+
+
+def _categorical_blocks(columns: list, steps: list) -> List[dict]:
+    from sklearn.impute import SimpleImputer
+    from sklearn.preprocessing import OneHotEncoder
+
+    fill_values = [None] * len(columns)
+    encoder = None
+    for step in steps:
+        if isinstance(step, SimpleImputer) and encoder is None:
+            kept = _kept_by_imputer(step)
+            columns = [column for column, keep in zip(columns, kept) if keep]
+            fill_values = [value for value, keep in zip(step.statistics_, kept) if keep]
+        elif isinstance(step, OneHotEncoder) and step.drop_idx_ is None and step.handle_unknown == "ignore":
+            encoder = step
+        else:
+            raise NotImplementedError(f"Cannot compile categorical transformer {type(step).__name__}.")
+    if encoder is None:
+        raise NotImplementedError("A categorical transformer must end with OneHotEncoder(handle_unknown='ignore').")
+
+    blocks = []
+    for column, categories, fill_value in zip(columns, encoder.categories_, fill_values):
+        vocabulary = np.asarray(categories, dtype=object)
+        matches = np.flatnonzero(vocabulary == fill_value) if fill_value is not None else []
+        blocks.append(
+            {
+                "kind": "categorical",
+                "columns": [column],
+                "vocabulary": vocabulary,
+                "fill_value": fill_value,
+                "fill_code": int(matches[0]) if len(matches) else -1,
+            }
+        )
+    return blocks
+
+
+def _compile_transformer(columns: list, transformer) -> List[dict]:
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import OneHotEncoder
+
+    if isinstance(transformer, str):
+        if transformer == "drop":
+            return []
+        if transformer == "passthrough":
+            return [_numeric_block(columns, [])]
+        raise NotImplementedError(f"Cannot compile transformer '{transformer}'.")
+
+    steps = [step for _, step in transformer.steps] if isinstance(transformer, Pipeline) else [transformer]
+    if isinstance(steps[-1], OneHotEncoder):
+        return _categorical_blocks(columns, steps)
+    block = _numeric_block(columns, steps)
+    # Every column may have been dropped by the imputer
+    return [block] if block["columns"] else []
+
+
+def _compile_blocks(preprocessor) -> List[dict]:
+    from sklearn.compose import ColumnTransformer
+
+    if not isinstance(preprocessor, ColumnTransformer):
+        return _compile_transformer(list(preprocessor.feature_names_in_), preprocessor)
+
+    blocks = []
+    for _, transformer, columns in preprocessor.transformers_:
+        # Remainder columns are reported by position
+        columns = [
+            preprocessor.feature_names_in_[c] if isinstance(c, (int, np.integer)) else c for c in columns
+        ]
+        if columns:
+            blocks.extend(_compile_transformer(columns, transformer))
+    return blocks
+
+
+def _fold_step_preprocessing(blocks: List[dict], fused) -> List[dict]:
+    """
+    Folds the stages of a fitted FusedPreprocessor into the blocks of the preprocessor after it.
+
+    Per column the stages reduce to a fill value, an optional log1p (first transformation only)
+    and one composed affine map. Fill values stay in input space, so a model-side imputation
+    constant is mapped back through the inverse of the fused transformations.
+    """
+    chains = {}
+
+    def chain(column) -> dict:
+        return chains.setdefault(column, {"fill": None, "log1p": False, "shift": 0.0, "scale": 1.0})
+
+    for stage in fused.stages_:
+        if stage["kind"] == "fill":
+            for column, value in stage["values"].items():
+                chain(column)["fill"] = value
+        elif stage["kind"] == "log1p":
+            for column in stage["columns"]:
+                link = chain(column)
+                if link["log1p"] or link["shift"] != 0.0 or link["scale"] != 1.0:
+                    raise NotImplementedError(f"Cannot compile a log transformation of '{column}' after another one.")
+                link["log1p"] = True
+        elif stage["kind"] == "affine":
+            for column in stage["shift"]:
+                link = chain(column)
+                link["shift"] += stage["shift"][column] * link["scale"]
+                link["scale"] *= stage["scale"][column]
+        elif stage["kind"] == "onehot":
+            raise NotImplementedError("Cannot compile one-hot encoding in the step preprocessing.")
+
+    for block in blocks:
+        if block["kind"] != "numeric":
+            link = chains.get(block["columns"][0])
+            if link is not None and link["fill"] is not None:
+                matches = np.flatnonzero(block["vocabulary"] == link["fill"])
+                block["fill_value"] = link["fill"]
+                block["fill_code"] = int(matches[0]) if len(matches) else -1
+                block["fills_none"] = True
+            continue
+
+        # Copies: the arrays may be views on the fitted sklearn statistics
+        for key in ("fill", "shift", "scale"):
+            block[key] = np.array(block[key], dtype=np.float64)
+        log_mask = np.zeros(len(block["columns"]), dtype=bool)
+        for j, column in enumerate(block["columns"]):
+            link = chains.get(column)
+            if link is None:
+                continue
+            if link["fill"] is not None:
+                block["fill"][j] = float(link["fill"])
+            elif not np.isnan(block["fill"][j]):
+                filled = block["fill"][j] * link["scale"] + link["shift"]
+                block["fill"][j] = np.expm1(filled) if link["log1p"] else filled
+            block["shift"][j] = link["shift"] + block["shift"][j] * link["scale"]
+            block["scale"][j] *= link["scale"]
+            log_mask[j] = link["log1p"]
+        if log_mask.any():
+            block["log1p"] = log_mask
+            block["row_log1p"] = log_mask.tolist()
+        block["row_fill"] = block["fill"].tolist()
+    return blocks
+
+
+def _compile_preprocessing(preprocessor) -> List[dict]:
+    from sklearn.pipeline import Pipeline
+    from src.preprocessing_compiler import FusedPreprocessor
+
+    steps = [step for _, step in preprocessor.steps] if isinstance(preprocessor, Pipeline) else [preprocessor]
+    if not isinstance(steps[0], FusedPreprocessor):
+        return _compile_blocks(preprocessor)
+
+    # The fused step preprocessing of model_building_step, then the model's own preprocessor
+    fused = steps[0]
+    if len(steps) > 2:
+        raise NotImplementedError("Only one preprocessing step can follow the step preprocessing.")
+    if len(steps) == 2:
+        blocks = _compile_blocks(steps[1])
+    else:
+        blocks = [_numeric_block(list(fused.get_feature_names_out()), [])]
+    return _fold_step_preprocessing(blocks, fused)
+
+
+def compile_preprocessor(preprocessor) -> CompiledPipeline:
+    """
+    Compiles a fitted preprocessing step alone; use CompiledPipeline.transform to build model inputs.
+    A Pipeline starting with the fused step preprocessing (src.preprocessing_compiler) is accepted.
+    """
+    return CompiledPipeline(_compile_preprocessing(preprocessor))
+
+
+def compile_pipeline(pipeline, X_validation: pd.DataFrame = None, rtol: float = 1e-6) -> CompiledPipeline:
+    """
+    Compiles a fitted preprocessing + model pipeline into a CompiledPipeline.
+
+    Supports the ColumnTransformer built by model_building_step and build_preprocessor (mean /
+    most-frequent imputation, standard scaling, one-hot encoding) or a bare StandardScaler,
+    optionally preceded by the fused step preprocessing (fills, log and scaling strategies).
+
+    Parameters:
+    pipeline (Pipeline): The fitted pipeline, ending with the model step.
+    X_validation (pd.DataFrame): When given, the compiled scorer is checked against
+        pipeline.predict on these rows.
+    rtol (float): Relative tolerance of that check.
+
+    Returns:
+    CompiledPipeline: The compiled scorer.
+    """
+    from sklearn.linear_model import ElasticNet, Lasso, LinearRegression, Ridge, SGDRegressor
+    from src.preprocessing_compiler import FusedPreprocessor
+
+    preprocessor, model = pipeline[:-1], pipeline[-1]
+    if len(preprocessor) == 1:
+        preprocessor = preprocessor[0]
+    elif not isinstance(preprocessor[0], FusedPreprocessor):
+        raise NotImplementedError("Only pipelines with a single preprocessing step can be compiled.")
+    blocks = _compile_preprocessing(preprocessor)
+
+    if isinstance(model, (LinearRegression, Ridge, Lasso, ElasticNet, SGDRegressor)):
+        compiled = CompiledPipeline(blocks, coef=model.coef_, intercept=np.ravel(model.intercept_)[0])
+    else:
+        compiled = CompiledPipeline(blocks, model=model)
+
+    if X_validation is not None:
+        validate_compiled_pipeline(pipeline, compiled, X_validation, rtol=rtol)
+    return compiled
+
+
+def validate_compiled_pipeline(pipeline, compiled: CompiledPipeline, X: pd.DataFrame, rtol: float = 1e-6) -> float:
+    """
+    Checks that the compiled scorer reproduces pipeline.predict on X.
+
+    Returns:
+    float: The largest absolute difference. Raises ValueError when outside the tolerance.
+    """
+    expected = pipeline.predict(X)
+    actual = compiled.predict(X)
+    max_difference = float(np.max(np.abs(expected - actual))) if len(X) else 0.0
+    if not np.allclose(actual, expected, rtol=rtol, atol=rtol * max(float(np.max(np.abs(expected), initial=0)), 1.0)):
+        raise ValueError(f"Compiled pipeline deviates from pipeline.predict by up to {max_difference}.")
+    logging.info(f"Compiled pipeline matches pipeline.predict (max abs difference {max_difference:.3g}).")
+    return max_difference
+
+
+# Example usage
+if __name__ == "__main__":
+    # pipeline = model_building_step output (fitted sklearn Pipeline)
+    # compiled = compile_pipeline(pipeline, X_validation=X_test)
+    # compiled.predict(X_test)
+    # compiled.predict_row(X_test.iloc[0].to_dict())
+
+    pass
@@ -1,28 +1,38 @@
 import os
 
 from src.pipelines.training_pipeline import ml_pipeline
-from src.steps.dynamic_importer import dynamic_importer
-from src.steps.prediction_service_loader import prediction_service_loader
-from src.steps.predictor import predictor
 from zenml import pipeline
-from zenml.integrations.mlflow.steps import mlflow_model_deployer_step
 
 requirements_file = os.path.join(os.path.dirname(__file__), "requirements.txt")
 
 
 @pipeline
-def continuous_deployment_pipeline():
+def continuous_deployment_pipeline(hot_reload_url: str = None):
     """Run a training job and deploy an MLflow model deployment."""
+    # Steps (and mlflow with them) are imported when the pipeline is built, keeping imports of
+    # this module, e.g. by run_deployement.py --help, cheap
+    from src.steps.model_reload_step import model_reload_step
+    from zenml.integrations.mlflow.steps import mlflow_model_deployer_step
+
     # Run the training pipeline
     trained_model = ml_pipeline()  # No need for is_promoted return value anymore
 
     # (Re)deploy the trained model
-    mlflow_model_deployer_step(workers=3, deploy_decision=True, model=trained_model)
+    service = mlflow_model_deployer_step(workers=3, deploy_decision=True, model=trained_model)
+
+    # Optionally hot-swap the new model into a running src.prediction_server
+    if hot_reload_url:
+        model_reload_step(service=service, server_url=hot_reload_url)
 
 
 @pipeline(enable_cache=False)
 def inference_pipeline():
     """Run a batch inference job with data loaded from an API."""
+    from src.steps.dynamic_importer import dynamic_importer
+    from src.steps.model_signature_loader import model_signature_loader
+    from src.steps.prediction_service_loader import prediction_service_loader
+    from src.steps.predictor import predictor
+
     # Load batch data for inference
     batch_data = dynamic_importer()
 
@@ -32,5 +42,34 @@ def inference_pipeline():
         step_name="mlflow_model_deployer_step",
     )
 
+    # Load the input signature recorded when the model was trained
+    signature = model_signature_loader()
+
     # Run predictions on the batch data
-    predictor(service=model_deployment_service, input_data=batch_data)
+    predictor(service=model_deployment_service, input_data=batch_data, signature=signature)
+
+
+@pipeline(enable_cache=False)
+def batch_inference_pipeline(
+    input_path: str,
+    output_path: str,
+    chunksize: int = 100_000,
+    n_workers: int = None,
+    passthrough_columns: list = None,
+):
+    """Score a whole file of listings with the deployed model, chunk by chunk."""
+    from src.steps.batch_scoring_step import batch_scoring_step
+    from src.steps.model_signature_loader import model_signature_loader
+
+    # Load the input signature recorded when the model was trained
+    signature = model_signature_loader()
+
+    # Validate, score in worker processes and write the predictions incrementally
+    batch_scoring_step(
+        signature=signature,
+        input_path=input_path,
+        output_path=output_path,
+        chunksize=chunksize,
+        n_workers=n_workers,
+        passthrough_columns=passthrough_columns,
+    )
@@ -0,0 +1,199 @@
+import inspect
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Any, Dict, List, Tuple, get_args, get_origin
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+class ArtifactProxy:
+    """Placeholder for a step output while the pipeline graph is being traced."""
+
+    def __init__(self, node: "StepNode", index: int):
+        self.node = node
+        self.index = index
+
+    def __repr__(self) -> str:
+        return f"ArtifactProxy({self.node.name}[{self.index}])"
+
+    def __iter__(self):
+        raise TypeError(f"Output of {self.node.name} cannot be unpacked while tracing; it has a single output.")
+
+    def __bool__(self):
+        raise TypeError("Step outputs cannot drive control flow in a pipeline definition.")
+
+
+class StepNode:
+    def __init__(self, name: str, step, args: tuple, kwargs: dict, n_outputs: int):
+        self.name = name
+        self.step = step
+        self.args = args
+        self.kwargs = kwargs
+        self.n_outputs = n_outputs
+        self.outputs = [ArtifactProxy(self, i) for i in range(max(n_outputs, 1))]
+
+    @property
+    def upstream(self) -> List["StepNode"]:
+        nodes = []
+        for value in list(self.args) + list(self.kwargs.values()):
+            for proxy in _proxies(value):
+                if proxy.node not in nodes:
+                    nodes.append(proxy.node)
+        return nodes
+
+
+def _proxies(value) -> List[ArtifactProxy]:
+    if isinstance(value, ArtifactProxy):
+        return [value]
+    if isinstance(value, (list, tuple)):
+        return [proxy for item in value for proxy in _proxies(item)]
+    if isinstance(value, dict):
+        return [proxy for item in value.values() for proxy in _proxies(item)]
+    return []
+
+
+def _output_count(step) -> int:
+    definition = getattr(step, "entrypoint_definition", None)
+    if definition is not None:
+        return len(definition.outputs)
+    annotation = inspect.signature(step.entrypoint).return_annotation
+    if annotation is None or annotation is inspect.Signature.empty:
+        return 1
+    if get_origin(annotation) in (tuple, Tuple):
+        return len(get_args(annotation))
+    return 1
+
+
+# Local pipeline runner
+# ---------------------
+# Runs a ZenML pipeline definition without the orchestrator. The pipeline function is first
+# traced: calling a step records a node and returns placeholders for its outputs, which gives the
+# same step graph ZenML would build. The nodes are then executed through step.entrypoint on a
+# thread pool as soon as their inputs are ready, so independent branches run concurrently and
+# artifacts are handed over in memory by reference (no materialization, no artifact store).
+class LocalPipelineRunner:
+    def __init__(self, max_workers: int = None):
+        """
+        Parameters:
+        max_workers (int): Steps run at once (threads); None lets the executor decide.
+        """
+        self.max_workers = max_workers
+        self.nodes_: List[StepNode] = []
+        self.timings_: Dict[str, float] = {}
+
+    @contextmanager
+    def _tracing(self):
+        from zenml.pipelines.pipeline_definition import Pipeline
+        from zenml.steps import BaseStep
+
+        runner = self
+
+        def trace_step(step, *args, **kwargs):
+            return runner._add_node(step, args, kwargs)
+
+        def trace_pipeline(pipeline, *args, **kwargs):
+            # Nested pipelines (e.g. ml_pipeline inside continuous_deployment_pipeline) are inlined
+            return pipeline.entrypoint(*args, **kwargs)
+
+        original_step_call, original_pipeline_call = BaseStep.__call__, Pipeline.__call__
+        BaseStep.__call__, Pipeline.__call__ = trace_step, trace_pipeline
+        try:
+            yield
+        finally:
+            BaseStep.__call__, Pipeline.__call__ = original_step_call, original_pipeline_call
+
+    def _add_node(self, step, args: tuple, kwargs: dict):
+        base_name = getattr(step, "name", None) or step.entrypoint.__name__
+        names = {node.name for node in self.nodes_}
+        name, i = base_name, 2
+        while name in names:
+            name, i = f"{base_name}_{i}", i + 1
+        node = StepNode(name, step, args, kwargs, _output_count(step))
+        self.nodes_.append(node)
+        return tuple(node.outputs) if node.n_outputs > 1 else node.outputs[0]
+
+    def trace(self, pipeline, **params) -> Any:
+        """Builds the step graph of pipeline; returns its (proxied) return value."""
+        self.nodes_ = []
+        entrypoint = getattr(pipeline, "entrypoint", pipeline)
+        with self._tracing():
+            return entrypoint(**params)
+
+    @staticmethod
+    def _resolve(value, results: Dict[Tuple[str, int], Any]):
+        if isinstance(value, ArtifactProxy):
+            return results[(value.node.name, value.index)]
+        if isinstance(value, list):
+            return [LocalPipelineRunner._resolve(item, results) for item in value]
+        if isinstance(value, tuple):
+            return tuple(LocalPipelineRunner._resolve(item, results) for item in value)
+        if isinstance(value, dict):
+            return {key: LocalPipelineRunner._resolve(item, results) for key, item in value.items()}
+        return value
+
+    def _execute(self, node: StepNode, results: dict):
+        args = self._resolve(node.args, results)
+        kwargs = self._resolve(node.kwargs, results)
+        # Parameters set with step.configure / with_options apply, call arguments win
+        configuration = getattr(node.step, "configuration", None)
+        parameters = dict(getattr(configuration, "parameters", None) or {})
+        parameters.update(kwargs)
+
+        start = time.perf_counter()
+        output = node.step.entrypoint(*args, **parameters)
+        self.timings_[node.name] = time.perf_counter() - start
+        logging.info(f"Step {node.name} finished in {self.timings_[node.name]:.2f}s.")
+        return output
+
+    def run(self, pipeline, **params) -> Dict[str, Any]:
+        """
+        Traces and executes pipeline locally.
+
+        Parameters:
+        pipeline: A @pipeline (or its plain function).
+        **params: Pipeline parameters.
+
+        Returns:
+        dict: Step name -> output (a tuple for multi-output steps), plus "return" for the
+        pipeline's resolved return value.
+        """
+        returned = self.trace(pipeline, **params)
+        self.timings_ = {}
+        results: Dict[Tuple[str, int], Any] = {}
+        outputs: Dict[str, Any] = {}
+        remaining = {node.name: node for node in self.nodes_}
+        done, running = set(), {}
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="local-step") as executor:
+            while remaining or running:
+                for name, node in list(remaining.items()):
+                    if all(upstream.name in done for upstream in node.upstream):
+                        running[executor.submit(self._execute, node, results)] = node
+                        del remaining[name]
+                if not running:
+                    raise RuntimeError(f"Unresolvable step dependencies: {sorted(remaining)}")
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    node = running.pop(future)
+                    # Fails fast: the exception of the first failed step propagates
+                    output = future.result()
+                    outputs[node.name] = output
+                    if node.n_outputs > 1:
+                        for i, value in enumerate(output):
+                            results[(node.name, i)] = value
+                    else:
+                        results[(node.name, 0)] = output
+                    done.add(node.name)
+
+        logging.info(f"Pipeline ran locally in {time.perf_counter() - start:.2f}s ({len(self.nodes_)} steps).")
+        outputs["return"] = self._resolve(returned, results)
+        return outputs
+
+
+def run_locally(pipeline, max_workers: int = None, **params) -> Dict[str, Any]:
+    """Runs pipeline with a LocalPipelineRunner; see LocalPipelineRunner.run."""
+    return LocalPipelineRunner(max_workers=max_workers).run(pipeline, **params)
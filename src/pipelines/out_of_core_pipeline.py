@@ -0,0 +1,27 @@
+from src.pipelines.training_pipeline import FEATURE_ENGINEERING, MISSING_VALUES
+from zenml import Model, pipeline
+
+
+@pipeline(
+    model=Model(
+        name="prices_predictor"
+    ),
+)
+def out_of_core_pipeline(file_path: str = "src/Data/Housing.csv", memory_limit_mb: float = 512, n_epochs: int = 1):
+    """
+    ml_pipeline for datasets larger than memory: every stage streams the CSV in chunks sized
+    by memory_limit_mb, with the same step preprocessing configuration.
+    """
+    # Imported when the pipeline is built, not when this module is imported
+    from src.steps.out_of_core_training_step import out_of_core_training_step
+    from src.steps.step_options import experiment_tracker_name
+
+    out_of_core_training_step = out_of_core_training_step.with_options(experiment_tracker=experiment_tracker_name())
+    model, model_signature, evaluation_metrics = out_of_core_training_step(
+        file_path=file_path,
+        memory_limit_mb=memory_limit_mb,
+        missing_values=MISSING_VALUES,
+        feature_engineering=FEATURE_ENGINEERING,
+        n_epochs=n_epochs,
+    )
+    return model
@@ -1,11 +1,13 @@
+import logging
+
 from zenml import Model , pipeline, step
-from src.steps.data_ingestion_step import data_ingestion_step
-from src.steps.handle_missing_values_step import handle_missing_values_step
-from src.steps.data_splitter_step import data_splitter_step
-from src.steps.feature_engineering_step import feature_engineering_step
-from src.steps.outlier_detection_step import outlier_detection_step
-from src.steps.model_building_step import model_building_step
-from src.steps.model_evaluator_step import model_evaluator_step
+
+# Step-level preprocessing, as handle_missing_values_step / feature_engineering_step parameters.
+# thresh=0 comes from the original pipeline and keeps every row (each has at least 0 non-missing
+# values), so this drop is a no-op; Housing.csv has no missing values.
+MISSING_VALUES = {"strategy": "drop", "thresh": 0}
+FEATURE_ENGINEERING = [{"strategy": "log", "features": ["area"]}]
+
 @pipeline(
     model = Model(
         name = "prices_predictor"
@@ -13,7 +15,24 @@ from src.steps.model_evaluator_step import model_evaluator_step
 )
 #def ml_pipeline():
 #@pipeline(enable_cache=False, model=Model(name="prices_predictor"))
-def ml_pipeline():
+def ml_pipeline(fused_preprocessing: bool = True):
+    # fused_preprocessing: compile the missing value and feature engineering strategies into the
+    # model pipeline (fitted once on the training split, replayed at inference) instead of
+    # running them as separate steps over the whole dataset, so the deployed model takes raw
+    # rows. Outlier detection still judges the transformed values (log1p('area')), so the same
+    # rows are removed as with the separate steps.
+
+    # Steps are imported when the pipeline is built, not when this module is imported,
+    # so importing the pipeline stays free of sklearn and the stack lookup
+    from src.steps.data_ingestion_step import data_ingestion_step
+    from src.steps.data_splitter_step import data_splitter_step
+    from src.steps.feature_engineering_step import feature_engineering_step
+    from src.steps.handle_missing_values_step import handle_missing_values_step
+    from src.steps.model_building_step import model_building_step
+    from src.steps.model_evaluator_step import model_evaluator_step
+    from src.steps.outlier_detection_step import outlier_detection_step
+    from src.steps.step_options import experiment_tracker_name
+
     # Step 1: Data Ingestion
     # - Reads data from zip file
     # - Uses Factory pattern for data ingestion
@@ -24,19 +43,30 @@ def ml_pipeline():
     # - Uses Strategy pattern for handling missing values
     # - Default strategy is 'mean' for numerical columns
     # - Returns cleaned dataframe
-    df_fill_data = handle_missing_values_step(raw_data , thresh=0 )
-
+    #
     # Step 3: Feature Engineering
     # - Applies log transformation to selected features
     # - Transforms 'ground_living_area' and 'sale_price'
     # - Returns engineered dataframe
-    engineer_data = feature_engineering_step(df = df_fill_data, features = ['area'], strategy = 'log')
+    # (with fused_preprocessing both are part of the model pipeline built in Step 6)
+    if fused_preprocessing:
+        engineer_data = raw_data
+    else:
+        df_fill_data = handle_missing_values_step(raw_data, **MISSING_VALUES)
+        for params in FEATURE_ENGINEERING:
+            df_fill_data = feature_engineering_step(df=df_fill_data, **params)
+        engineer_data = df_fill_data
 
     # Step 4: Outlier Detection and Handling
     # - Uses Z-score method for outlier detection
     # - Handles outliers in 'sale_price' column
     # - Returns cleaned dataframe
-    df_clean_data = outlier_detection_step(engineer_data)
+    if fused_preprocessing:
+        df_clean_data = outlier_detection_step(
+            engineer_data, missing_values=MISSING_VALUES, feature_engineering=FEATURE_ENGINEERING
+        )
+    else:
+        df_clean_data = outlier_detection_step(engineer_data)
 
     # Step 5: Data Splitting
     # - Splits data into train and test sets
@@ -49,8 +79,16 @@ def ml_pipeline():
     # - Uses MLflow for experiment tracking
     # - Implements pipeline with StandardScaler and LinearRegression
     # - Handles categorical encoding
-    # - Returns trained model
-    model = model_building_step(X_train, y_train)
+    # - Returns trained model and its input signature
+    model_building_step = model_building_step.with_options(experiment_tracker=experiment_tracker_name())
+    if fused_preprocessing:
+        model, model_signature = model_building_step(
+            X_train, y_train, missing_values=MISSING_VALUES, feature_engineering=FEATURE_ENGINEERING
+        )
+    else:
+        # The model and its signature then expect feature-engineered rows, not raw serving rows
+        logging.warning("fused_preprocessing is off: the deployed model expects feature-engineered input.")
+        model, model_signature = model_building_step(X_train, y_train)
 
     # Step 7: Model Evaluation
     # - Calculates mean squared error and R2 score
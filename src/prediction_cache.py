@@ -0,0 +1,160 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+# Prediction cache
+# ----------------
+# Repeated lookups of the same listing hit the same feature row, so its prediction is kept in a
+# bounded LRU store with an optional TTL. Rows are canonicalized first (fixed column order,
+# numerics as float64, missing values unified) so that 3 and 3.0, or a reordered payload, map to
+# the same 64-bit hash_pandas_object key. Every entry belongs to one model version; when the
+# version changes (a new deployment) the whole store is dropped.
+class PredictionCache:
+    def __init__(self, columns: List[str] = None, max_entries: int = 100_000, ttl_s: float = None,
+                 version_fn: Callable[[], str] = None, version_check_interval_s: float = 30.0):
+        """
+        Parameters:
+        columns (list): Feature columns in canonical order (e.g. ModelSignature.columns); other
+            columns are ignored. Defaults to the sorted columns of each frame.
+        max_entries (int): Maximum cached rows; the least recently used are evicted.
+        ttl_s (float): Optional lifetime of an entry in seconds.
+        version_fn (callable): Optional function returning the currently deployed model version,
+            polled at most every version_check_interval_s seconds.
+        """
+        self.columns = list(columns) if columns is not None else None
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.version_fn = version_fn
+        self.version_check_interval_s = version_check_interval_s
+        self.model_version = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._seconds_per_row = 0.0
+        self._scored_rows = 0
+        self._next_version_check = 0.0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def canonicalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Returns the frame with canonical column order and dtypes."""
+        columns = self.columns if self.columns is not None else sorted(df.columns)
+        canonical = {}
+        for column in columns:
+            values = df[column]
+            if values.dtype.kind in "biuf":
+                canonical[column] = values.to_numpy(dtype=np.float64)
+            else:
+                canonical[column] = values.astype(object).where(values.notna(), None).to_numpy()
+        return pd.DataFrame(canonical)
+
+    def keys(self, df: pd.DataFrame) -> np.ndarray:
+        """Returns one uint64 key per row of the canonicalized frame."""
+        return pd.util.hash_pandas_object(self.canonicalize(df), index=False).to_numpy()
+
+    def set_model_version(self, model_version: str):
+        """Records the model version, dropping every entry if it changed."""
+        with self._lock:
+            if model_version != self.model_version:
+                if self.model_version is not None:
+                    logging.info(f"Model version changed to {model_version}, clearing the prediction cache.")
+                    self.invalidations += 1
+                self._entries.clear()
+                self.model_version = model_version
+
+    def _check_version(self):
+        if self.version_fn is None or time.monotonic() < self._next_version_check:
+            return
+        self._next_version_check = time.monotonic() + self.version_check_interval_s
+        try:
+            self.set_model_version(self.version_fn())
+        except Exception as e:
+            logging.warning(f"Could not check the deployed model version: {e}")
+
+    def lookup(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Looks up every row of df.
+
+        Returns:
+        tuple: The row keys, the cached predictions (NaN on misses) and the boolean miss mask.
+        """
+        self._check_version()
+        keys = self.keys(df)
+        predictions = np.full(len(keys), np.nan)
+        now = time.monotonic()
+        with self._lock:
+            for i, key in enumerate(keys.tolist()):
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                if entry[1] is not None and entry[1] < now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                predictions[i] = entry[0]
+        missing = np.isnan(predictions)
+        self.hits += int((~missing).sum())
+        self.misses += int(missing.sum())
+        return keys, predictions, missing
+
+    def store(self, keys: np.ndarray, predictions: np.ndarray, seconds: float = None, model_version: str = None):
+        """
+        Stores freshly scored rows. seconds, the time it took to score them, feeds latency_saved_s.
+        When model_version is given and is no longer the cache's version (the model was swapped
+        while scoring), nothing is stored.
+        """
+        expires = time.monotonic() + self.ttl_s if self.ttl_s is not None else None
+        with self._lock:
+            if model_version is not None and model_version != self.model_version:
+                return
+            for key, prediction in zip(keys.tolist(), np.asarray(predictions, dtype=np.float64).tolist()):
+                self._entries[key] = (prediction, expires)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if seconds is not None and len(keys):
+                self._seconds_per_row = (self._seconds_per_row * self._scored_rows + seconds) / (
+                    self._scored_rows + len(keys)
+                )
+                self._scored_rows += len(keys)
+
+    def predict(self, df: pd.DataFrame, predict_fn: Callable[[pd.DataFrame], np.ndarray]) -> np.ndarray:
+        """
+        Returns predictions for df, scoring only the rows that are not cached.
+        """
+        keys, predictions, missing = self.lookup(df)
+        if missing.any():
+            start = time.perf_counter()
+            predictions[missing] = predict_fn(df[missing])
+            self.store(keys[missing], predictions[missing], time.perf_counter() - start)
+        return predictions
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def latency_saved_s(self) -> float:
+        """Estimated model time avoided: hits times the mean scoring time of a missed row."""
+        return self.hits * self._seconds_per_row
+
+    def metrics(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "latency_saved_ms": self.latency_saved_s * 1000,
+            "invalidations": self.invalidations,
+            "model_version": self.model_version,
+        }
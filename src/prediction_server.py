@@ -0,0 +1,322 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+from src.model_holder import ModelHolder
+from src.model_signature import ModelSignature
+from src.payload_codec import decode_payload
+from src.prediction_cache import PredictionCache
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+# Histogram with percentiles
+# --------------------------
+# Fixed buckets give the cumulative distribution since startup; a ring buffer of the most
+# recent observations gives the current p50 / p99 without unbounded memory.
+class Histogram:
+    def __init__(self, buckets: List[float], window: int = 10_000):
+        """
+        Parameters:
+        buckets (list): Increasing upper bounds; a last +inf bucket is added.
+        window (int): Number of recent observations used for the percentiles.
+        """
+        self.buckets = list(buckets) + [float("inf")]
+        self.counts = np.zeros(len(self.buckets), dtype=np.int64)
+        self.total = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, value: float):
+        self.counts[np.searchsorted(self.buckets, value)] += 1
+        self.total += value
+        self.recent.append(value)
+
+    def percentile(self, q: float) -> float:
+        return float(np.percentile(self.recent, q)) if self.recent else 0.0
+
+    def snapshot(self) -> dict:
+        count = int(self.counts.sum())
+        return {
+            "count": count,
+            "mean": self.total / count if count else 0.0,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "buckets": {str(bound): int(n) for bound, n in zip(self.buckets, self.counts)},
+        }
+
+
+# Micro-batcher
+# -------------
+# Concurrent requests are queued and coalesced: the first waiting request opens a batch that is
+# closed when it reaches max_batch_size rows or after max_wait_ms, whichever comes first. The
+# whole batch is scored with one predict call on a worker thread, so the event loop keeps
+# accepting requests while the model runs and per-call overhead is paid once per batch. Only
+# frames with the same columns share a batch (pd.concat would NaN-fill the others), and when
+# a batch fails its requests are scored one by one, so a bad request fails only itself.
+class MicroBatcher:
+    def __init__(self, predict_fn: Callable[[pd.DataFrame], np.ndarray], max_batch_size: int = 64,
+                 max_wait_ms: float = 2.0):
+        """
+        Parameters:
+        predict_fn (callable): Scores a DataFrame, e.g. a fitted pipeline's predict.
+        max_batch_size (int): Maximum rows per predict call (a larger single request is scored alone).
+        max_wait_ms (float): Maximum time the first request of a batch waits for others.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.batch_sizes = Histogram([1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024])
+        self.model_latency_ms = Histogram([0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000])
+        self._queue = None
+        self._task = None
+        # Requests that did not fit (other columns, or too many rows for) the batch they arrived for
+        self._deferred = deque()
+        # One thread: batches are scored in order and the model is never called concurrently
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="micro-batcher")
+
+    def start(self):
+        """Starts the batching loop on the running event loop."""
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._executor.shutdown(wait=True)
+
+    async def predict(self, frame: pd.DataFrame) -> np.ndarray:
+        """Queues the rows of frame and waits for their predictions."""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((frame, future))
+        return await future
+
+    async def _collect(self) -> list:
+        first = self._deferred.popleft() if self._deferred else await self._queue.get()
+        pending, columns, n_rows = [first], list(first[0].columns), len(first[0])
+
+        def add(item):
+            nonlocal n_rows
+            # Requests that would overflow the batch open the next one instead
+            if list(item[0].columns) != columns or n_rows + len(item[0]) > self.max_batch_size:
+                self._deferred.append(item)
+                return
+            pending.append(item)
+            n_rows += len(item[0])
+
+        # Deferred requests come first
+        for _ in range(len(self._deferred)):
+            if n_rows >= self.max_batch_size:
+                break
+            add(self._deferred.popleft())
+        deadline = time.perf_counter() + self.max_wait_ms / 1000
+        while n_rows < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            add(item)
+        # Requests that arrived meanwhile join the batch without waiting any longer
+        while n_rows < self.max_batch_size and not self._queue.empty():
+            add(self._queue.get_nowait())
+        return pending
+
+    def _score(self, frames: List[pd.DataFrame]) -> np.ndarray:
+        start = time.perf_counter()
+        batch = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        predictions = np.asarray(self.predict_fn(batch))
+        self.model_latency_ms.observe((time.perf_counter() - start) * 1000)
+        self.batch_sizes.observe(len(batch))
+        return predictions
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = await self._collect()
+            frames = [frame for frame, _ in pending]
+            try:
+                predictions = await loop.run_in_executor(self._executor, self._score, frames)
+            except Exception as e:
+                if len(pending) == 1:
+                    logging.error(f"Prediction failed: {e}")
+                    self._resolve(pending[0][1], exception=e)
+                    continue
+                logging.warning(f"Batch of {len(pending)} requests failed ({e}), scoring them one by one.")
+                for frame, future in pending:
+                    try:
+                        result = await loop.run_in_executor(self._executor, self._score, [frame])
+                    except Exception as request_error:
+                        logging.error(f"Prediction failed: {request_error}")
+                        self._resolve(future, exception=request_error)
+                    else:
+                        self._resolve(future, result=result)
+                continue
+            offset = 0
+            for frame, future in pending:
+                self._resolve(future, result=predictions[offset:offset + len(frame)])
+                offset += len(frame)
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, result: np.ndarray = None, exception: Exception = None):
+        # The request may have been cancelled (client gone) while it waited
+        if future.done():
+            return
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+
+def create_app(model, signature: ModelSignature = None, max_batch_size: int = 64, max_wait_ms: float = 2.0,
+               cache: PredictionCache = None):
+    """
+    Builds the FastAPI prediction app around an already loaded model.
+
+    The model is served through a ModelHolder, so a new version can be loaded, warmed up and
+    swapped in without downtime, either by POST /reload or by ModelHolder.watch.
+
+    Endpoints:
+    POST /predict   Rows as a binary columnar or Arrow IPC payload (src.payload_codec), or JSON
+                    {"columns": [...], "data": [[...], ...]} -> {"predictions": [...]}
+    POST /reload    {"model_uri": "..."}: loads, warms up and swaps in a model in the background.
+    GET  /metrics   Request latency, model latency, batch-size histograms, cache and model version.
+    GET  /health    Liveness probe.
+
+    Parameters:
+    model: The fitted pipeline (anything with predict(DataFrame)), or a ModelHolder.
+    signature (ModelSignature): When given, payloads are validated and coerced to the training schema.
+    max_batch_size (int), max_wait_ms (float): Micro-batching limits, see MicroBatcher.
+    cache (PredictionCache): Optional cache in front of the batcher; only missed rows are scored.
+
+    Returns:
+    fastapi.FastAPI: The app, to be run by uvicorn.
+    """
+    from fastapi import FastAPI, HTTPException, Request
+    from fastapi.responses import ORJSONResponse
+
+    holder = model if isinstance(model, ModelHolder) else ModelHolder(model, signature=signature)
+    if cache is not None:
+        holder.add_listener(cache.set_model_version)
+    batcher = MicroBatcher(holder.predict, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+    request_latency_ms = Histogram([0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000])
+    app = FastAPI(title="House price prediction server", default_response_class=ORJSONResponse)
+
+    @app.on_event("startup")
+    async def start_batcher():
+        batcher.start()
+
+    @app.on_event("shutdown")
+    async def stop_batcher():
+        await batcher.stop()
+
+    @app.post("/predict")
+    async def predict(request: Request):
+        start = time.perf_counter()
+        try:
+            frame = decode_payload(await request.body())
+            if signature is not None:
+                frame = signature.coerce(frame)
+        except (KeyError, TypeError, ValueError) as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        if cache is None:
+            predictions = await batcher.predict(frame)
+        else:
+            keys, predictions, missing = cache.lookup(frame)
+            if missing.any():
+                model_version, scoring_start = holder.version, time.perf_counter()
+                predictions[missing] = await batcher.predict(frame[missing])
+                cache.store(keys[missing], predictions[missing], time.perf_counter() - scoring_start, model_version)
+        request_latency_ms.observe((time.perf_counter() - start) * 1000)
+        return {"predictions": predictions.tolist()}
+
+    @app.get("/metrics")
+    async def metrics():
+        return {
+            "request_latency_ms": request_latency_ms.snapshot(),
+            "model_latency_ms": batcher.model_latency_ms.snapshot(),
+            "batch_size": batcher.batch_sizes.snapshot(),
+            "prediction_cache": cache.metrics() if cache is not None else None,
+            "model": holder.metrics(),
+        }
+
+    @app.post("/reload", status_code=202)
+    async def reload(payload: dict):
+        if "model_uri" not in payload:
+            raise HTTPException(status_code=422, detail="model_uri is required.")
+        holder.reload_async(payload["model_uri"])
+        return {"serving": holder.version, "loading": payload["model_uri"]}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    app.state.batcher = batcher
+    app.state.model_holder = holder
+    return app
+
+
+def serve(model_uri: str, signature_path: str = None, host: str = "127.0.0.1", port: int = 8000,
+          max_batch_size: int = 64, max_wait_ms: float = 2.0, cache_size: int = 0, cache_ttl_s: float = None,
+          watch_interval_s: float = 30.0):
+    """
+    Loads the model once and serves it locally with uvicorn (a single process, so every
+    request shares the loaded model and the micro-batcher).
+
+    When serving 'deployed', the deployed model URI is polled every watch_interval_s seconds and
+    a new version from continuous_deployment_pipeline is hot-reloaded. With cache_size > 0 a
+    PredictionCache is put in front of the model; it is cleared on every model swap.
+    """
+    import uvicorn
+    from src.model_store import read_model, resolve_model_uri
+
+    model_version = resolve_model_uri(model_uri)
+    signature = ModelSignature.load(signature_path) if signature_path else None
+    holder = ModelHolder(read_model(model_version), model_version, signature=signature)
+    if model_uri == "deployed":
+        holder.watch(lambda: resolve_model_uri("deployed"), interval_s=watch_interval_s)
+    cache = None
+    if cache_size > 0:
+        cache = PredictionCache(
+            columns=signature.columns if signature is not None else None,
+            max_entries=cache_size,
+            ttl_s=cache_ttl_s,
+        )
+        cache.set_model_version(model_version)
+    app = create_app(holder, signature, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms, cache=cache)
+    uvicorn.run(app, host=host, port=port, log_level="warning")
+
+
+if __name__ == "__main__":
+    import click
+
+    @click.command()
+    @click.option("--model-uri", required=True, help="Model file, MLflow model URI or 'deployed'.")
+    @click.option("--signature", "signature_path", default=None, help="model_signature.json logged at training.")
+    @click.option("--host", default="127.0.0.1")
+    @click.option("--port", default=8000, type=int)
+    @click.option("--max-batch-size", default=64, type=int)
+    @click.option("--max-wait-ms", default=2.0, type=float)
+    @click.option("--cache-size", default=0, type=int, help="Cached predictions, 0 disables the cache.")
+    @click.option("--cache-ttl-s", default=None, type=float)
+    def main(model_uri, signature_path, host, port, max_batch_size, max_wait_ms, cache_size, cache_ttl_s):
+        """Run the in-process micro-batching prediction server."""
+        serve(model_uri, signature_path, host, port, max_batch_size, max_wait_ms, cache_size, cache_ttl_s)
+
+    main()
@@ -0,0 +1,121 @@
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from typing import Any, Tuple
+
+import joblib
+import pandas as pd
+from sklearn.base import TransformerMixin, clone
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+# Cache of fitted preprocessors and the matrices they produce
+# -----------------------------------------------------------
+# Entries are keyed on a fingerprint of the input frame and the transformer parameters, so
+# hyperparameter trials, CV folds and repeated pipeline runs over the same rows reuse the
+# transformed matrix instead of re-running imputation, scaling and one-hot encoding.
+class PreprocessingCache:
+    def __init__(self, max_entries: int = 8, cache_dir: str = None):
+        """
+        Parameters:
+        max_entries (int): Number of entries kept in memory (least recently used are evicted).
+        cache_dir (str): Optional directory persisting entries across processes and runs.
+        """
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def fingerprint(X: pd.DataFrame) -> str:
+        """
+        Returns a digest of the frame's values, index, column names and dtypes.
+
+        Parameters:
+        X (pd.DataFrame): The frame to fingerprint.
+
+        Returns:
+        str: A hex digest that changes whenever any of them changes.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(pd.util.hash_pandas_object(X, index=True).to_numpy().tobytes())
+        digest.update(repr([(str(c), str(t)) for c, t in X.dtypes.items()]).encode("utf8"))
+        return digest.hexdigest()
+
+    def _key(self, transformer: TransformerMixin, X: pd.DataFrame, fitted: bool) -> str:
+        kind = "transform" if fitted else "fit_transform"
+        return f"{kind}-{joblib.hash(transformer)}-{self.fingerprint(X)}"
+
+    def _get(self, key: str) -> Any:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        if self.cache_dir:
+            path = os.path.join(self.cache_dir, f"{key}.joblib")
+            if os.path.exists(path):
+                value = joblib.load(path, mmap_mode="r")
+                self._put(key, value, persist=False)
+                return value
+        return None
+
+    def _put(self, key: str, value: Any, persist: bool = True):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        if persist and self.cache_dir:
+            path = os.path.join(self.cache_dir, f"{key}.joblib")
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            joblib.dump(value, tmp_path)
+            os.replace(tmp_path, path)
+
+    def _lookup(self, key: str):
+        value = self._get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            logging.info("Reusing cached preprocessed matrix.")
+        return value
+
+    def fit_transform(self, transformer: TransformerMixin, X: pd.DataFrame) -> Tuple[TransformerMixin, Any]:
+        """
+        Fits a clone of an unfitted transformer on X, or returns the cached result.
+
+        Parameters:
+        transformer (TransformerMixin): The unfitted transformer; it is not modified.
+        X (pd.DataFrame): The training frame.
+
+        Returns:
+        tuple: The fitted transformer and the transformed matrix. Treat both as read-only,
+        they are shared with later cache hits.
+        """
+        key = self._key(transformer, X, fitted=False)
+        value = self._lookup(key)
+        if value is None:
+            fitted = clone(transformer)
+            value = (fitted, fitted.fit_transform(X))
+            self._put(key, value)
+        return value
+
+    def transform(self, fitted_transformer: TransformerMixin, X: pd.DataFrame) -> Any:
+        """
+        Transforms X with an already fitted transformer, or returns the cached matrix.
+        """
+        key = self._key(fitted_transformer, X, fitted=True)
+        value = self._lookup(key)
+        if value is None:
+            value = fitted_transformer.transform(X)
+            self._put(key, value)
+        return value
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
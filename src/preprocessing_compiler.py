@@ -0,0 +1,384 @@
+import logging
+from typing import Callable, Iterable, List, Sequence
+
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.utils.validation import check_is_fitted
+from src.csv_row_index import reservoir_sample
+from src.feature_engineering import (
+    FeatureEngineeringStrategy,
+    LogTransformation,
+    MinMaxScaling,
+    OneHotEncoding,
+    StandardScaling,
+    make_feature_strategy,
+)
+from src.handle_missing_values import (
+    DropMissingValues,
+    FillMissingValues,
+    MissingValuesHandlingStrategy,
+    make_missing_value_strategy,
+)
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# Name of the fused step when prepended to a model pipeline
+STEP_NAME = "step_preprocessing"
+
+
+# Fused step preprocessing
+# ------------------------
+# Compiles the strategies configured for handle_missing_values_step and feature_engineering_step
+# into one sklearn transformer. Fitting learns every constant the strategies compute from the
+# data (fill values, scaling statistics, one-hot categories) in a single pass over one working
+# copy; transforming replays them, so training and serving apply the identical transform. Each
+# fitted stage is a plain dict, which src.pipeline_compiler folds into compiled scorers.
+#
+# Row filters cannot run at inference: DropMissingValues(axis=0) becomes training_row_mask,
+# applied to the training data only (at serving, missing values reach the model's imputer).
+class FusedPreprocessor(TransformerMixin, BaseEstimator):
+    def __init__(self, missing_value_strategy: MissingValuesHandlingStrategy = None,
+                 feature_strategies: Sequence[FeatureEngineeringStrategy] = ()):
+        """
+        Parameters:
+        missing_value_strategy (MissingValuesHandlingStrategy): DropMissingValues or FillMissingValues.
+        feature_strategies (list): FeatureEngineeringStrategy instances, applied in order.
+        """
+        self.missing_value_strategy = missing_value_strategy
+        self.feature_strategies = feature_strategies
+
+    def _fit_missing_values(self, X: pd.DataFrame) -> dict:
+        return self._fit_missing_values_with(self.missing_value_strategy, X)
+
+    @staticmethod
+    def _fit_missing_values_with(strategy: MissingValuesHandlingStrategy, X: pd.DataFrame) -> dict:
+        if isinstance(strategy, DropMissingValues):
+            if strategy.axis in (1, "columns"):
+                # Column drops are replayed at inference, so the dropped set is fitted once
+                non_missing = X.notna().sum(axis=0)
+                keep = non_missing >= strategy.thresh if strategy.thresh is not None else non_missing == len(X)
+                return {"kind": "drop_columns", "columns": X.columns[~keep.to_numpy()].tolist()}
+            return None
+        if not isinstance(strategy, FillMissingValues):
+            if strategy is not None:
+                raise NotImplementedError(f"Cannot compile missing value strategy {type(strategy).__name__}.")
+            return None
+
+        # Same column selection as FillMissingValues.handle
+        if strategy.method in ("mean", "median"):
+            numeric_columns = X.select_dtypes(include=["float64", "int64"]).columns
+            statistics = X[numeric_columns].mean() if strategy.method == "mean" else X[numeric_columns].median()
+            values = {column: float(value) for column, value in statistics.items() if not pd.isna(value)}
+        elif strategy.method == "mode":
+            values = {}
+            for column in X.columns:
+                mode = X[column].mode()
+                if len(mode):
+                    values[column] = mode.iloc[0].item() if hasattr(mode.iloc[0], "item") else mode.iloc[0]
+        elif strategy.method == "constant" and strategy.fill_value is not None:
+            values = {column: strategy.fill_value for column in X.columns}
+        else:
+            logging.error(f"Unknown method: {strategy.method}. No missing values handled.")
+            return None
+        return {"kind": "fill", "values": values}
+
+    @staticmethod
+    def _fit_feature_strategy(strategy: FeatureEngineeringStrategy, X: pd.DataFrame) -> dict:
+        features = list(strategy.features)
+        missing = [feature for feature in features if feature not in X.columns]
+        if missing:
+            raise ValueError(
+                f"Features {missing} are not model inputs; transforms of the target must stay in feature_engineering_step."
+            )
+        if isinstance(strategy, LogTransformation):
+            return {"kind": "log1p", "columns": features}
+        if isinstance(strategy, StandardScaling):
+            # Population standard deviation, as StandardScaler; constant columns keep scale 1
+            std = X[features].std(ddof=0)
+            return {
+                "kind": "affine",
+                "shift": X[features].mean().astype(float).to_dict(),
+                "scale": std.where(std > 0, 1.0).astype(float).to_dict(),
+            }
+        if isinstance(strategy, MinMaxScaling):
+            low, high = strategy.scaler.feature_range
+            data_min, data_max = X[features].min().astype(float), X[features].max().astype(float)
+            data_range = (data_max - data_min).where(data_max > data_min, 1.0)
+            scale = data_range / (high - low)
+            return {"kind": "affine", "shift": (data_min - low * scale).to_dict(), "scale": scale.to_dict()}
+        if isinstance(strategy, OneHotEncoding):
+            # drop="first" as OneHotEncoding; unknown or missing values encode as all zeros
+            return {"kind": "onehot", "categories": {f: sorted(X[f].dropna().unique().tolist()) for f in features}}
+        raise NotImplementedError(f"Cannot compile feature engineering strategy {type(strategy).__name__}.")
+
+    @staticmethod
+    def _apply(stage: dict, X: pd.DataFrame) -> pd.DataFrame:
+        # Stages only assign whole columns, so the caller's shallow copy is never written through
+        kind = stage["kind"]
+        if kind == "fill":
+            for column, value in stage["values"].items():
+                if column in X.columns:
+                    X[column] = X[column].fillna(value)
+        elif kind == "drop_columns":
+            X = X.drop(columns=[c for c in stage["columns"] if c in X.columns])
+        elif kind == "log1p":
+            # float64 first: serving payloads may carry object columns (e.g. a None in one row)
+            for column in stage["columns"]:
+                X[column] = np.log1p(X[column].astype(np.float64))
+        elif kind == "affine":
+            for column in stage["shift"]:
+                X[column] = (X[column].astype(np.float64) - stage["shift"][column]) / stage["scale"][column]
+        elif kind == "onehot":
+            encoded = {}
+            for column, categories in stage["categories"].items():
+                values = X[column].to_numpy()
+                for category in categories[1:]:
+                    encoded[f"{column}_{category}"] = (values == category).astype(np.float64)
+            X = pd.concat([X.drop(columns=list(stage["categories"])), pd.DataFrame(encoded, index=X.index)], axis=1)
+        return X
+
+    def fit_transform(self, X: pd.DataFrame, y=None) -> pd.DataFrame:
+        """Fits every stage on the output of the previous one and returns the transformed X."""
+        if not isinstance(X, pd.DataFrame):
+            raise TypeError("X must be a pandas DataFrame.")
+        self.feature_names_in_ = np.asarray(X.columns, dtype=object)
+        self.n_features_in_ = X.shape[1]
+        self.stages_ = []
+        X = X.copy(deep=False)
+        stage = self._fit_missing_values(X)
+        if stage is not None:
+            self.stages_.append(stage)
+            X = self._apply(stage, X)
+        for strategy in self.feature_strategies:
+            stage = self._fit_feature_strategy(strategy, X)
+            self.stages_.append(stage)
+            X = self._apply(stage, X)
+        self.feature_names_out_ = np.asarray(X.columns, dtype=object)
+        return X
+
+    def fit(self, X: pd.DataFrame, y=None) -> "FusedPreprocessor":
+        self.fit_transform(X)
+        return self
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        check_is_fitted(self, "stages_")
+        X = X.copy(deep=False)
+        for stage in self.stages_:
+            X = self._apply(stage, X)
+        return X
+
+    def get_feature_names_out(self, input_features=None) -> np.ndarray:
+        check_is_fitted(self, "feature_names_out_")
+        return self.feature_names_out_
+
+    def fit_chunks(self, chunks: Callable[[], Iterable[pd.DataFrame]], sample_size: int = 100_000) -> "FusedPreprocessor":
+        """
+        Fits on a stream of frames that does not fit in memory, with the same result as fit on
+        their concatenation. Each stage that needs statistics takes one pass over the stream with
+        the stages before it applied; log transformations, constant fills and row drops take none.
+        All statistics are exact except the median fill, computed from a uniform sample.
+
+        Parameters:
+        chunks (Callable): Returns a fresh iterator over the training frames on every call
+            (rows already filtered with training_row_mask).
+        sample_size (int): Rows sampled for the median fill.
+
+        Returns:
+        FusedPreprocessor: self.
+        """
+        empty = next(iter(chunks())).iloc[:0]
+        self.feature_names_in_ = np.asarray(empty.columns, dtype=object)
+        self.n_features_in_ = empty.shape[1]
+        self.stages_ = []
+
+        def transformed():
+            for chunk in chunks():
+                yield self.transform(chunk)
+
+        for strategy in [self.missing_value_strategy, *self.feature_strategies]:
+            if strategy is None:
+                continue
+            if not _needs_statistics(strategy):
+                stage = self._fit_stage(strategy, self.transform(empty))
+            elif isinstance(strategy, FillMissingValues) and strategy.method == "median":
+                stage = self._fit_stage(strategy, reservoir_sample(transformed(), n=sample_size, random_state=0))
+            else:
+                statistics = _StageStatistics(strategy)
+                for chunk in transformed():
+                    statistics.update(chunk)
+                stage = statistics.stage()
+            if stage is not None:
+                self.stages_.append(stage)
+        self.feature_names_out_ = np.asarray(self.transform(empty).columns, dtype=object)
+        return self
+
+    def _fit_stage(self, strategy, X: pd.DataFrame) -> dict:
+        if isinstance(strategy, MissingValuesHandlingStrategy):
+            return self._fit_missing_values_with(strategy, X)
+        return self._fit_feature_strategy(strategy, X)
+
+    def training_row_mask(self, X: pd.DataFrame) -> np.ndarray:
+        """
+        Rows kept for training by DropMissingValues(axis=0), as DataFrame.dropna would keep them;
+        all rows for the other strategies.
+        """
+        strategy = self.missing_value_strategy
+        if not isinstance(strategy, DropMissingValues) or strategy.axis not in (0, "index"):
+            return np.ones(len(X), dtype=bool)
+        if strategy.thresh is None:
+            return ~X.isna().any(axis=1).to_numpy()
+        return (X.notna().sum(axis=1) >= strategy.thresh).to_numpy()
+
+
+# Streaming stage statistics
+# --------------------------
+# Mergeable per-chunk aggregates for the stages that FusedPreprocessor.fit_chunks cannot fit
+# from an empty frame: sums and counts (mean fill), value counts (mode fill), non-missing counts
+# (column drops), Chan's pairwise mean / M2 update (standard scaling), extrema (min-max scaling)
+# and category sets (one-hot encoding). Each yields the stage the in-memory fit would.
+class _StageStatistics:
+    def __init__(self, strategy):
+        self.strategy = strategy
+        self.n_rows = 0
+        self.columns = None
+        self.count, self.total, self.M2 = {}, {}, {}
+        self.minimum, self.maximum = {}, {}
+        self.value_counts = {}
+        self.categories = {}
+
+    def _columns(self, X: pd.DataFrame) -> list:
+        strategy = self.strategy
+        if isinstance(strategy, FillMissingValues) and strategy.method == "mean":
+            return X.select_dtypes(include=["float64", "int64"]).columns.tolist()
+        if isinstance(strategy, MissingValuesHandlingStrategy):
+            return X.columns.tolist()
+        missing = [feature for feature in strategy.features if feature not in X.columns]
+        if missing:
+            raise ValueError(
+                f"Features {missing} are not model inputs; transforms of the target must stay in feature_engineering_step."
+            )
+        return list(strategy.features)
+
+    def update(self, X: pd.DataFrame):
+        strategy = self.strategy
+        if self.columns is None:
+            self.columns = self._columns(X)
+        self.n_rows += len(X)
+        for column in self.columns:
+            values = X[column]
+            if isinstance(strategy, DropMissingValues):
+                self.count[column] = self.count.get(column, 0) + int(values.count())
+            elif isinstance(strategy, FillMissingValues) and strategy.method == "mean":
+                self.count[column] = self.count.get(column, 0) + int(values.count())
+                self.total[column] = self.total.get(column, 0.0) + float(values.sum())
+            elif isinstance(strategy, FillMissingValues):
+                counts = values.value_counts(dropna=True)
+                previous = self.value_counts.get(column)
+                self.value_counts[column] = counts if previous is None else previous.add(counts, fill_value=0)
+            elif isinstance(strategy, StandardScaling):
+                values = values.to_numpy(dtype=np.float64)
+                values = values[~np.isnan(values)]
+                if not len(values):
+                    continue
+                n_a, mean_a, M2_a = self.count.get(column, 0), self.total.get(column, 0.0), self.M2.get(column, 0.0)
+                n_b, mean_b = len(values), float(values.mean())
+                M2_b = float(((values - mean_b) ** 2).sum())
+                n = n_a + n_b
+                delta = mean_b - mean_a
+                self.count[column] = n
+                self.total[column] = mean_a + delta * n_b / n
+                self.M2[column] = M2_a + M2_b + delta * delta * n_a * n_b / n
+            elif isinstance(strategy, MinMaxScaling):
+                low, high = values.min(), values.max()
+                if not pd.isna(low):
+                    self.minimum[column] = min(self.minimum.get(column, low), low)
+                    self.maximum[column] = max(self.maximum.get(column, high), high)
+            elif isinstance(strategy, OneHotEncoding):
+                self.categories.setdefault(column, set()).update(values.dropna().unique().tolist())
+            else:
+                raise NotImplementedError(f"Cannot fit {type(strategy).__name__} on a stream.")
+
+    def stage(self) -> dict:
+        strategy = self.strategy
+        columns = self.columns or []
+        if isinstance(strategy, DropMissingValues):
+            keep = [
+                self.count.get(c, 0) >= strategy.thresh if strategy.thresh is not None else self.count.get(c, 0) == self.n_rows
+                for c in columns
+            ]
+            return {"kind": "drop_columns", "columns": [c for c, k in zip(columns, keep) if not k]}
+        if isinstance(strategy, FillMissingValues) and strategy.method == "mean":
+            return {"kind": "fill", "values": {c: self.total[c] / self.count[c] for c in columns if self.count.get(c)}}
+        if isinstance(strategy, FillMissingValues) and strategy.method == "mode":
+            values = {}
+            for column in columns:
+                counts = self.value_counts.get(column)
+                if counts is not None and len(counts):
+                    # Ties resolve to the smallest value, as Series.mode()[0]
+                    mode = min(counts.index[counts.to_numpy() == counts.max()].tolist())
+                    values[column] = mode.item() if hasattr(mode, "item") else mode
+            return {"kind": "fill", "values": values}
+        if isinstance(strategy, FillMissingValues):
+            logging.error(f"Unknown method: {strategy.method}. No missing values handled.")
+            return None
+        if isinstance(strategy, StandardScaling):
+            std = {c: np.sqrt(self.M2[c] / self.count[c]) if self.count.get(c) else np.nan for c in columns}
+            return {
+                "kind": "affine",
+                "shift": {c: float(self.total.get(c, np.nan)) for c in columns},
+                "scale": {c: float(std[c]) if std[c] > 0 else 1.0 for c in columns},
+            }
+        if isinstance(strategy, MinMaxScaling):
+            low, high = strategy.scaler.feature_range
+            shift, scale = {}, {}
+            for column in columns:
+                data_min, data_max = float(self.minimum.get(column, np.nan)), float(self.maximum.get(column, np.nan))
+                data_range = data_max - data_min if data_max > data_min else 1.0
+                scale[column] = data_range / (high - low)
+                shift[column] = data_min - low * scale[column]
+            return {"kind": "affine", "shift": shift, "scale": scale}
+        return {"kind": "onehot", "categories": {c: sorted(self.categories.get(c, ())) for c in columns}}
+
+
+def _needs_statistics(strategy) -> bool:
+    """False for the stages fitted from the column names alone."""
+    if isinstance(strategy, LogTransformation):
+        return False
+    if isinstance(strategy, DropMissingValues):
+        return strategy.axis in (1, "columns")
+    if isinstance(strategy, FillMissingValues):
+        return strategy.method in ("mean", "median", "mode")
+    return True
+
+
+def compile_preprocessing(missing_values: dict = None, feature_engineering: List[dict] = None) -> FusedPreprocessor:
+    """
+    Builds the (unfitted) fused transformer from step configurations.
+
+    Parameters:
+    missing_values (dict): Parameters of handle_missing_values_step (strategy, axis, fill_value, thresh).
+    feature_engineering (list): Parameters of each feature_engineering_step (strategy, features),
+        in pipeline order. A single dict is accepted too.
+
+    Returns:
+    FusedPreprocessor: Fit it on the training features (or prepend it to a model pipeline).
+    """
+    missing_value_strategy = make_missing_value_strategy(**missing_values) if missing_values else None
+    if isinstance(feature_engineering, dict):
+        feature_engineering = [feature_engineering]
+    feature_strategies = [make_feature_strategy(**params) for params in feature_engineering or []]
+    return FusedPreprocessor(missing_value_strategy, feature_strategies)
+
+
+# Example usage
+if __name__ == "__main__":
+    # preprocessor = compile_preprocessing(
+    #     missing_values={"strategy": "mean"},
+    #     feature_engineering=[{"strategy": "log", "features": ["area"]}],
+    # )
+    # X_train_processed = preprocessor.fit_transform(X_train)
+    # pipeline = Pipeline([(STEP_NAME, preprocessor), *model_pipeline.steps])
+
+    pass
@@ -0,0 +1,77 @@
+import logging
+from multiprocessing import shared_memory
+from typing import Tuple
+
+import numpy as np
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# Blocks attached by this process through get_shared_array, kept open for the life of the process
+_attached_blocks = {}
+
+
+# Owner of a numpy array placed in a named shared memory block
+# ------------------------------------------------------------
+# Worker processes attach to the block by name instead of receiving a pickled copy,
+# so N workers read one physical copy of the training matrix.
+class SharedArray:
+    def __init__(self, array: np.ndarray):
+        """
+        Copies the array into a new shared memory block.
+
+        Parameters:
+        array (np.ndarray): The array to share. It is made C-contiguous first.
+        """
+        array = np.ascontiguousarray(array)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self.array = np.ndarray(array.shape, dtype=array.dtype, buffer=self._shm.buf)
+        self.array[...] = array
+        self.spec = (self._shm.name, array.shape, array.dtype.str)
+        logging.info(f"Shared {array.nbytes / 1e6:.1f} MB array as '{self._shm.name}'.")
+
+    def close(self):
+        """Releases and unlinks the shared memory block."""
+        if self._shm is None:
+            return
+        self.array = None
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def attach_shared_array(spec: Tuple[str, tuple, str]) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """
+    Attaches to an array created by SharedArray in another process.
+
+    Parameters:
+    spec (tuple): The `SharedArray.spec` of the owner.
+
+    Returns:
+    tuple: The attached block (keep a reference while the array is in use) and a
+    read-only array view over it.
+    """
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    array.flags.writeable = False
+    return shm, array
+
+
+def get_shared_array(spec: Tuple[str, tuple, str]) -> np.ndarray:
+    """
+    Returns a read-only view of a shared array, attaching at most once per process.
+
+    Worker processes call this for every task; the block stays attached for the life of
+    the worker so fitted estimators may keep references to the view.
+    """
+    name = spec[0]
+    if name not in _attached_blocks:
+        _attached_blocks[name] = attach_shared_array(spec)
+    return _attached_blocks[name][1]
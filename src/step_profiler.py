@@ -0,0 +1,373 @@
+import functools
+import html
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Callable, Dict, List
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    return default if value is None else value.lower() not in ("0", "false", "no", "off", "")
+
+
+def _rss_bytes() -> int:
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        # Linux: second field of statm is the resident set in pages
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _max_rss_bytes() -> int:
+    """Peak resident set size of the process so far, or None where it is not available."""
+    try:
+        import resource
+    except ImportError:
+        # Windows: the peak working set
+        try:
+            import psutil
+
+            return getattr(psutil.Process().memory_info(), "peak_wset", None)
+        except ImportError:
+            return None
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux and the BSDs
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _describe(value: Any) -> Any:
+    """Shape summary of a step input or output."""
+    if isinstance(value, (tuple, list)) and value and any(hasattr(item, "shape") for item in value):
+        return [_describe(item) for item in value]
+    if hasattr(value, "shape"):
+        return {"type": type(value).__name__, "shape": list(value.shape)}
+    return {"type": type(value).__name__}
+
+
+# Sampling stack profiler
+# -----------------------
+# A daemon thread snapshots the stack of the profiled thread every interval and counts the
+# collapsed stacks ("module:function;module:function..." as used by flame graph tools).
+class _StackSampler:
+    def __init__(self, thread_id: int, interval_s: float):
+        self.thread_id = thread_id
+        self.interval_s = interval_s
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval_s):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def __enter__(self) -> "_StackSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+
+class RSSMonitor:
+    """Polls the resident set size to find its peak while a step runs."""
+
+    def __init__(self, interval_s: float = 0.01):
+        self.interval_s = interval_s
+        self.peak = _rss_bytes()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-monitor", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval_s):
+            self.peak = max(self.peak, _rss_bytes())
+
+    def __enter__(self) -> "RSSMonitor":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _rss_bytes())
+
+
+# Step profiler
+# -------------
+# Collects one record per step execution: wall and CPU time, RSS before/peak/after, the Python
+# allocation peak (tracemalloc; for steps that did not overlap others) and the shapes of inputs
+# and outputs. Records are appended to a JSON report (and rendered to HTML) in report_dir,
+# logged as MLflow metrics to the run that was active when the step started (or that the step
+# started itself), and the slowest step's sampled stacks are kept when stack sampling is on.
+# Profiling is opt-in (STEP_PROFILER=1): tracing allocations slows numpy/pandas-heavy steps.
+class StepProfiler:
+    def __init__(self, enabled: bool = None, trace_allocations: bool = None, sample_stacks: bool = None,
+                 sample_interval_s: float = 0.005, report_dir: str = None):
+        """
+        Parameters default to the STEP_PROFILER, STEP_PROFILER_TRACEMALLOC,
+        STEP_PROFILER_SAMPLE_STACKS and STEP_PROFILER_DIR environment variables.
+
+        enabled (bool): Profile at all (default off).
+        trace_allocations (bool): Record the tracemalloc peak (default off; slows Python-heavy code).
+        sample_stacks (bool): Sample stacks of every step and keep those of the slowest (default off).
+        sample_interval_s (float): Stack sampling interval.
+        report_dir (str): Directory receiving step_profile.json / step_profile.html (default: none).
+        """
+        self.enabled = _env_flag("STEP_PROFILER", False) if enabled is None else enabled
+        self.trace_allocations = _env_flag("STEP_PROFILER_TRACEMALLOC", False) if trace_allocations is None else trace_allocations
+        self.sample_stacks = _env_flag("STEP_PROFILER_SAMPLE_STACKS", False) if sample_stacks is None else sample_stacks
+        self.sample_interval_s = sample_interval_s
+        self.report_dir = os.environ.get("STEP_PROFILER_DIR") if report_dir is None else report_dir
+        self.records: List[dict] = []
+        self.slowest_stacks: Dict[str, Any] = None
+        self._lock = threading.Lock()
+        self._tracing_steps = 0
+        self._started_tracing = False
+        # Currently running steps: token -> (step name, names of the steps it overlapped)
+        self._running: Dict[object, tuple] = {}
+
+    def profile(self, func: Callable, name: str = None) -> Callable:
+        """Wraps a step function; functools.wraps keeps the signature ZenML inspects."""
+        step_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+            return self._run(step_name, func, args, kwargs)
+
+        return wrapper
+
+    def _run(self, step_name: str, func: Callable, args: tuple, kwargs: dict):
+        with self._lock:
+            # Steps may run concurrently (src.pipelines.local_runner). tracemalloc has a single
+            # process-wide peak, so it is only reset (and reported) for a step that runs alone;
+            # overlapping steps record each other's names and no Python allocation peak
+            running = dict(self._running)
+            overlapped = set(step for step, _ in running.values())
+            for _, others in running.values():
+                others.add(step_name)
+            token = object()
+            self._running[token] = (step_name, overlapped)
+            if self.trace_allocations:
+                # Tracing stays on until the last of the concurrent steps finishes
+                if self._tracing_steps == 0 and not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    self._started_tracing = True
+                self._tracing_steps += 1
+                if not running:
+                    tracemalloc.reset_peak()
+                traced_before = tracemalloc.get_traced_memory()[0]
+
+        # The step may end the MLflow run it logs to (model_building_step does), so the run is
+        # resolved now and the profile metrics are logged to it by id afterwards
+        mlflow_run_id = self._active_mlflow_run_id()
+        rss_before = _rss_bytes()
+        sampler = _StackSampler(threading.get_ident(), self.sample_interval_s) if self.sample_stacks else None
+        wall_start, cpu_start, wall_start_time = time.perf_counter(), time.process_time(), time.time()
+        try:
+            with RSSMonitor() as rss:
+                if sampler is not None:
+                    with sampler:
+                        output = func(*args, **kwargs)
+                else:
+                    output = func(*args, **kwargs)
+        finally:
+            wall_s, cpu_s = time.perf_counter() - wall_start, time.process_time() - cpu_start
+            with self._lock:
+                overlapped = self._running.pop(token)[1]
+                python_peak = None
+                if self.trace_allocations:
+                    if not overlapped:
+                        python_peak = tracemalloc.get_traced_memory()[1] - traced_before
+                    self._tracing_steps -= 1
+                    if self._tracing_steps == 0 and self._started_tracing:
+                        tracemalloc.stop()
+                        self._started_tracing = False
+
+        if mlflow_run_id is None:
+            mlflow_run_id = self._step_mlflow_run_id(wall_start_time)
+        record = {
+            "step": step_name,
+            "started_at": time.time() - wall_s,
+            "wall_s": wall_s,
+            "cpu_s": cpu_s,
+            "rss_before_bytes": rss_before,
+            "rss_peak_bytes": rss.peak,
+            "rss_peak_increase_bytes": rss.peak - rss_before,
+            "max_rss_lifetime_bytes": _max_rss_bytes(),
+            "python_alloc_peak_bytes": python_peak,
+            "concurrent_steps": sorted(overlapped),
+            "inputs": {key: _describe(value) for key, value in list(zip(func.__code__.co_varnames, args)) + list(kwargs.items())},
+            "output": _describe(output),
+        }
+        self._record(record, sampler, mlflow_run_id)
+        return output
+
+    def _record(self, record: dict, sampler: "_StackSampler", mlflow_run_id: str = None):
+        with self._lock:
+            self.records.append(record)
+            if sampler is not None and (
+                self.slowest_stacks is None or record["wall_s"] > self.slowest_stacks["wall_s"]
+            ):
+                self.slowest_stacks = {
+                    "step": record["step"],
+                    "wall_s": record["wall_s"],
+                    "samples": sum(sampler.stacks.values()),
+                    "collapsed": dict(sampler.stacks.most_common()),
+                }
+        logging.info(
+            f"Step {record['step']}: {record['wall_s']:.2f}s wall, {record['cpu_s']:.2f}s CPU, "
+            f"peak RSS +{record['rss_peak_increase_bytes'] / 1e6:.1f} MB."
+        )
+        if mlflow_run_id is not None:
+            self._log_to_mlflow(record, mlflow_run_id)
+        if self.report_dir:
+            self.write_reports(self.report_dir)
+
+    @staticmethod
+    def _active_mlflow_run_id() -> str:
+        # Only when mlflow is already in use: importing it here would dominate small steps
+        mlflow = sys.modules.get("mlflow")
+        run = mlflow.active_run() if mlflow is not None else None
+        return run.info.run_id if run is not None else None
+
+    @staticmethod
+    def _step_mlflow_run_id(started_at: float) -> str:
+        """The MLflow run the step started itself (and may have ended already), if any."""
+        mlflow = sys.modules.get("mlflow")
+        if mlflow is None:
+            return None
+        run = mlflow.active_run() or mlflow.last_active_run()
+        # MLflow start times are in milliseconds, truncated
+        if run is None or run.info.start_time < int(started_at * 1000):
+            return None
+        return run.info.run_id
+
+    @staticmethod
+    def _log_to_mlflow(record: dict, run_id: str):
+        from mlflow.tracking import MlflowClient
+
+        prefix = f"profile.{record['step']}"
+        metrics = {
+            f"{prefix}.wall_s": record["wall_s"],
+            f"{prefix}.cpu_s": record["cpu_s"],
+            f"{prefix}.rss_peak_increase_mb": record["rss_peak_increase_bytes"] / 1e6,
+        }
+        if record["python_alloc_peak_bytes"] is not None:
+            metrics[f"{prefix}.python_alloc_peak_mb"] = record["python_alloc_peak_bytes"] / 1e6
+        # Logged by run id: the run may no longer be the active one (or active at all)
+        client = MlflowClient()
+        for key, value in metrics.items():
+            client.log_metric(run_id, key, value)
+
+    def report(self) -> dict:
+        with self._lock:
+            records = list(self.records)
+        slowest = max(records, key=lambda r: r["wall_s"])["step"] if records else None
+        return {"records": records, "slowest_step": slowest, "slowest_step_stacks": self.slowest_stacks}
+
+    def write_reports(self, directory: str) -> str:
+        """
+        Merges this process's records into directory/step_profile.json (steps may run in separate
+        processes) and renders directory/step_profile.html. Returns the JSON path.
+        """
+        os.makedirs(directory, exist_ok=True)
+        json_path = os.path.join(directory, "step_profile.json")
+        report = self.report()
+        own_keys = {(r["step"], r["started_at"]) for r in report["records"]}
+        if os.path.isfile(json_path):
+            with open(json_path) as f:
+                previous = json.load(f)
+            others = [r for r in previous.get("records", []) if (r["step"], r["started_at"]) not in own_keys]
+            report["records"] = sorted(others + report["records"], key=lambda r: r["started_at"])
+            report["slowest_step"] = max(report["records"], key=lambda r: r["wall_s"])["step"]
+            if report["slowest_step_stacks"] is None:
+                report["slowest_step_stacks"] = previous.get("slowest_step_stacks")
+        with open(json_path, "w") as f:
+            json.dump(report, f, indent=2)
+        with open(os.path.join(directory, "step_profile.html"), "w") as f:
+            f.write(render_html(report))
+        return json_path
+
+
+def render_html(report: dict) -> str:
+    """Renders a profile report as a standalone HTML table (plus the slowest step's top stacks)."""
+    columns = [
+        ("step", "Step", None),
+        ("wall_s", "Wall (s)", "{:.3f}"),
+        ("cpu_s", "CPU (s)", "{:.3f}"),
+        ("rss_peak_increase_bytes", "Peak RSS + (MB)", "mb"),
+        ("python_alloc_peak_bytes", "Python alloc peak (MB)", "mb"),
+        ("concurrent_steps", "Concurrent with", "json"),
+        ("inputs", "Inputs", "json"),
+        ("output", "Output", "json"),
+    ]
+
+    def cell(value, style):
+        if value is None:
+            return ""
+        if style == "mb":
+            return f"{value / 1e6:.2f}"
+        if style == "json":
+            return html.escape(json.dumps(value))
+        return style.format(value) if style else html.escape(str(value))
+
+    total = sum(r["wall_s"] for r in report["records"]) or 1.0
+    rows = []
+    for record in report["records"]:
+        share = 100 * record["wall_s"] / total
+        bar = f'<div style="background:#4a90d9;height:8px;width:{share:.1f}%"></div>'
+        cells = "".join(f"<td>{cell(record.get(key), style)}</td>" for key, _, style in columns)
+        rows.append(f"<tr>{cells}<td>{bar}</td></tr>")
+    header = "".join(f"<th>{title}</th>" for _, title, _ in columns) + "<th>Share of wall time</th>"
+
+    stacks = ""
+    if report.get("slowest_step_stacks"):
+        sampled = report["slowest_step_stacks"]
+        top = list(sampled["collapsed"].items())[:20]
+        items = "".join(
+            f"<li>{count} / {sampled['samples']}: <code>{html.escape(stack.split(';')[-1])}</code>"
+            f"<br><small>{html.escape(stack)}</small></li>"
+            for stack, count in top
+        )
+        stacks = f"<h2>Sampled stacks of {html.escape(sampled['step'])}</h2><ol>{items}</ol>"
+
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Step profile</title>"
+        "<style>body{font-family:sans-serif}td,th{padding:4px 8px;border-bottom:1px solid #ddd;"
+        "text-align:left;vertical-align:top}td:last-child{width:200px}</style></head><body>"
+        f"<h1>Step profile</h1><p>Slowest step: <b>{html.escape(str(report.get('slowest_step')))}</b></p>"
+        f"<table><tr>{header}</tr>{''.join(rows)}</table>{stacks}</body></html>"
+    )
+
+
+# Process-wide profiler used by the profile_step decorator
+PROFILER = StepProfiler()
+
+
+def profile_step(func: Callable) -> Callable:
+    """
+    Decorator instrumenting a step function with the process-wide StepProfiler. Apply it below
+    @step so that ZenML wraps the instrumented function.
+    """
+    return PROFILER.profile(func)
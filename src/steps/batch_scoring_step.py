@@ -0,0 +1,42 @@
+from typing import Annotated
+
+from src.batch_scoring import BatchScorer
+from src.model_signature import ModelSignature
+from src.step_profiler import profile_step
+from zenml import step
+
+
+@step(enable_cache=False)
+@profile_step
+def batch_scoring_step(
+    signature: dict,
+    input_path: str,
+    output_path: str,
+    model_uri: str = "deployed",
+    chunksize: int = 100_000,
+    n_workers: int = None,
+    passthrough_columns: list = None,
+) -> Annotated[dict, "batch_scoring_report"]:
+    """
+    Scores a whole file with the model and writes the predictions to a Parquet file.
+
+    Parameters:
+    signature (dict): The model signature emitted by model_building_step.
+    input_path (str): The .csv or .parquet file to score.
+    output_path (str): The Parquet file receiving row, passthrough columns and prediction.
+    model_uri (str): Model to score with; 'deployed' uses the model currently served.
+    chunksize (int): Rows per chunk.
+    n_workers (int): Scoring processes.
+    passthrough_columns (list): Input columns copied to the output.
+
+    Returns:
+    dict: Rows scored, chunks, elapsed seconds and rows per second.
+    """
+    scorer = BatchScorer(
+        model_uri,
+        ModelSignature.from_dict(signature),
+        chunksize=chunksize,
+        n_workers=n_workers,
+        passthrough_columns=passthrough_columns,
+    )
+    return scorer.score(input_path, output_path)
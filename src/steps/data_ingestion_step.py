@@ -1,7 +1,10 @@
 import pandas as pd
 from src.ingest_data import DataIngestorFactory
+from src.materializers.dataframe_materializer import DataFrameMaterializer
+from src.step_profiler import profile_step
 from zenml import step
-@step
+@step(output_materializers=DataFrameMaterializer)
+@profile_step
 def data_ingestion_step(file_path : str, ext : str) -> pd.DataFrame :
     data_ingestor = DataIngestorFactory.get_data_ingestor(ext)
     df = data_ingestor.ingest(file_path)
@@ -1,20 +1,33 @@
    # Handles train-test splitting
    # Returns X_train, X_test, y_train, y_test 
-from src.data_splitter import DataSplitterContext , SimpleTrainTestSplit
+from src.data_splitter import DataSplitterContext , SimpleTrainTestSplit, HashTrainTestSplit, GroupResamplingSplit
 import pandas as pd
+from src.materializers.dataframe_materializer import DataFrameMaterializer
+from src.step_profiler import profile_step
 from zenml import step
 from typing import Tuple
 from sklearn.base import TransformerMixin
 
-@step
+@step(output_materializers=DataFrameMaterializer)
+@profile_step
 def data_splitter_step(
     df: pd.DataFrame,
     target_column: str,
-    strategy: str = "simple_train_test"
+    strategy: str = "simple_train_test",
+    key_column: str = None,
+    resampling_method: str = "under",
+    target_ratio: float = 1.0,
+    n_bins: int = None
 ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series]:
 
     if strategy == "simple_train_test":
         splitter = SimpleTrainTestSplit()
+    elif strategy == "hash_train_test":
+        splitter = HashTrainTestSplit(key_column=key_column)
+    elif strategy == "group_resampling":
+        splitter = GroupResamplingSplit(
+            method=resampling_method, target_ratio=target_ratio, n_bins=n_bins
+        )
     else:
         raise ValueError(f"Unknown splitting strategy: {strategy}")
     
@@ -1,17 +1,28 @@
-import pandas as pd
-from zenml import step
+import os
 
+from src.batch_scoring import iter_file_chunks
+from src.csv_row_index import CSVRowIndex, reservoir_sample
+from src.payload_codec import encode_payload
+from src.step_profiler import profile_step
+from zenml import step
 
-@step
-def dynamic_importer() -> str:
-    """Dynamically imports a random row of data from the housing dataset."""
-    # Load the housing.csv dataset
-    df = pd.read_csv(r"src\Data\Housing.csv")
+DEFAULT_DATA_PATH = os.path.join("src", "Data", "Housing.csv")
 
-    # Select a random row from the DataFrame
-    random_row = df.sample(n=1)
 
-    # Convert the random row to a JSON string
-    json_data = random_row.to_json(orient="split")
+@step
+@profile_step
+def dynamic_importer(
+    data_path: str = DEFAULT_DATA_PATH,
+    n_rows: int = 1,
+    payload_format: str = "binary",
+) -> bytes:
+    """Dynamically imports random rows of data from the housing dataset."""
+    if data_path.endswith(".csv"):
+        # Seek to random rows through the byte-offset index instead of parsing the whole file
+        rows = CSVRowIndex(data_path).sample(n=n_rows)
+    else:
+        # Sources that cannot be indexed are sampled in one streaming pass
+        rows = reservoir_sample(iter_file_chunks(data_path, chunksize=100_000), n=n_rows)
 
-    return json_data
+    # Encode the rows as a columnar payload ('binary', 'arrow' or 'json')
+    return encode_payload(rows, payload_format)
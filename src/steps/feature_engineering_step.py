@@ -1,15 +1,12 @@
 import pandas as pd
-from src.feature_engineering import (
-    FeatureEngineer,
-    LogTransformation,
-    MinMaxScaling,
-    OneHotEncoding,
-    StandardScaling,
-)
+from src.feature_engineering import FeatureEngineer, make_feature_strategy
+from src.materializers.dataframe_materializer import DataFrameMaterializer
+from src.step_profiler import profile_step
 from zenml import step
 
 
-@step
+@step(output_materializers=DataFrameMaterializer)
+@profile_step
 def feature_engineering_step(
     df: pd.DataFrame, strategy: str = "log", features: list = None
 ) -> pd.DataFrame:
@@ -19,16 +16,6 @@ def feature_engineering_step(
     if features is None:
         features = []  # or raise an error if features are required
 
-    if strategy == "log":
-        engineer = FeatureEngineer(LogTransformation(features))
-    elif strategy == "standard_scaling":
-        engineer = FeatureEngineer(StandardScaling(features))
-    elif strategy == "minmax_scaling":
-        engineer = FeatureEngineer(MinMaxScaling(features))
-    elif strategy == "onehot_encoding":
-        engineer = FeatureEngineer(OneHotEncoding(features))
-    else:
-        raise ValueError(f"Unsupported feature engineering strategy: {strategy}")
-
+    engineer = FeatureEngineer(make_feature_strategy(strategy, features))
     transformed_df = engineer.apply_feature_engineering(df)
     return transformed_df
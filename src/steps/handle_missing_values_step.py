@@ -1,15 +1,11 @@
 import pandas as pd
+from src.materializers.dataframe_materializer import DataFrameMaterializer
+from src.step_profiler import profile_step
 from zenml import step
-from src.handle_missing_values import MissingValueHandler, DropMissingValues, FillMissingValues
+from src.handle_missing_values import MissingValueHandler, make_missing_value_strategy
 
-@step
-def handle_missing_values_step(df : pd.DataFrame, strategy : str = 'drop' , axis : int = 0, fill_value = None, thresh = None):
-   if strategy == 'drop':
-      handler = MissingValueHandler(DropMissingValues(axis, thresh))
-   elif strategy in ['mean', 'median', 'mode', 'constant']:
-      handler = MissingValueHandler(FillMissingValues(strategy,fill_value))
-   else :
-      raise ValueError("unsupported strategy")
-   
+@step(output_materializers=DataFrameMaterializer)
+@profile_step
+def handle_missing_values_step(df : pd.DataFrame, strategy : str = 'drop' , axis : int = 0, fill_value = None, thresh = None) -> pd.DataFrame:
+   handler = MissingValueHandler(make_missing_value_strategy(strategy, axis, fill_value, thresh))
    return handler.handle_missing_value(df)
-    
\ No newline at end of file
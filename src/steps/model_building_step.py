@@ -1,7 +1,7 @@
+import copy
 import logging
-from typing import Annotated
+from typing import Annotated, Tuple
 
-import mlflow
 import pandas as pd
 from sklearn.base import RegressorMixin
 from sklearn.compose import ColumnTransformer
@@ -9,35 +9,95 @@ from sklearn.impute import SimpleImputer
 from sklearn.linear_model import LinearRegression
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import OneHotEncoder
+from src.incremental_learning import iter_xy_chunks
+from src.ingest_data import ChunkedCSVDataIngestor
+from src.model_building import MODEL_STRATEGIES, ModelBuilder
+from src.model_signature import ModelSignature
+from src.model_store import load_model
+from src.preprocessing_cache import PreprocessingCache
+from src.preprocessing_compiler import STEP_NAME, compile_preprocessing
+from src.step_profiler import profile_step
+from src.steps.step_options import PRICES_PREDICTOR
 from zenml import ArtifactConfig, step
-from zenml.client import Client
 
-# Get the active experiment tracker from ZenML
-experiment_tracker = Client().active_stack.experiment_tracker
-from zenml import Model
 
-model = Model(
-    name="prices_predictor",
-    version=None,
-    license="Apache 2.0",
-    description="Price prediction model for houses.",
-)
+def _step_preprocessed_chunks(chunks, step_preprocessing):
+    """Applies the fitted step preprocessing, row filter included, to a stream of (X, y) chunks."""
+    for X_chunk, y_chunk in chunks:
+        if step_preprocessing is not None:
+            keep = step_preprocessing.training_row_mask(X_chunk)
+            X_chunk, y_chunk = step_preprocessing.transform(X_chunk[keep]), y_chunk[keep]
+        if len(X_chunk):
+            yield X_chunk, y_chunk
 
 
-@step(enable_cache=False, experiment_tracker=experiment_tracker.name, model=model)
+# The experiment tracker is set when the pipeline is built:
+# model_building_step.with_options(experiment_tracker=experiment_tracker_name())
+@step(enable_cache=False, model=PRICES_PREDICTOR)
+@profile_step
 def model_building_step(
-    X_train: pd.DataFrame, y_train: pd.Series
-) -> Annotated[Pipeline, ArtifactConfig(name="sklearn_pipeline", is_model_artifact=True)]:
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    preprocessing_cache_dir: str = None,
+    strategy: str = "linear_regression",
+    strategy_params: dict = None,
+    warm_start_model_uri: str = None,
+    new_data_path: str = None,
+    missing_values: dict = None,
+    feature_engineering: list = None,
+) -> Tuple[
+    Annotated[Pipeline, ArtifactConfig(name="sklearn_pipeline", is_model_artifact=True)],
+    Annotated[dict, ArtifactConfig(name="model_signature")],
+]:
 
     # Ensure the inputs are of the correct type
     if not isinstance(X_train, pd.DataFrame):
         raise TypeError("X_train must be a pandas DataFrame.")
     if not isinstance(y_train, pd.Series):
         raise TypeError("y_train must be a pandas Series.")
+    # 'linear_regression' keeps the imputing pipeline below, other names come from MODEL_STRATEGIES
+    if strategy != "linear_regression" and strategy not in MODEL_STRATEGIES:
+        raise ValueError(f"Unknown model building strategy: {strategy}")
+    # Only incremental strategies (partial_fit_chunks) can continue training a model
+    incremental = hasattr(MODEL_STRATEGIES.get(strategy), "partial_fit_chunks")
+    if warm_start_model_uri and not incremental:
+        raise ValueError(f"warm_start_model_uri requires an incremental strategy, got '{strategy}'.")
+    # new_data_path: a CSV of rows the warm-started model has not seen yet; only these are
+    # streamed into it, chunk by chunk, instead of the whole X_train
+    if new_data_path and not warm_start_model_uri:
+        raise ValueError("new_data_path requires warm_start_model_uri.")
+
+    warm_start_model = None
+    if warm_start_model_uri:
+        # Continue training the given (or currently deployed) incremental model
+        # (a copy, since training mutates it and load_model caches per process)
+        warm_start_model = copy.deepcopy(load_model(warm_start_model_uri))
+
+    # Step-level preprocessing (the handle_missing_values_step / feature_engineering_step
+    # configurations) is fitted once here and prepended to the model, so inference replays it
+    step_preprocessing = None
+    if warm_start_model is not None and warm_start_model.steps[0][0] == STEP_NAME:
+        # Continued training keeps the transform the deployed model was fitted with
+        step_preprocessing = warm_start_model[0]
+        warm_start_model = Pipeline(warm_start_model.steps[1:])
+    elif missing_values or feature_engineering:
+        step_preprocessing = compile_preprocessing(missing_values, feature_engineering)
+
+    X_model = X_train
+    if step_preprocessing is not None:
+        # Row filters (the 'drop' strategy) apply to the training data only
+        keep = step_preprocessing.training_row_mask(X_train)
+        if not keep.all():
+            logging.info(f"Dropping {int((~keep).sum())} training rows with missing values.")
+            X_train, y_train = X_train[keep], y_train[keep]
+        if hasattr(step_preprocessing, "stages_"):
+            X_model = step_preprocessing.transform(X_train)
+        else:
+            X_model = step_preprocessing.fit_transform(X_train)
 
     # Identify categorical and numerical columns
-    categorical_cols = X_train.select_dtypes(include=["object", "category"]).columns
-    numerical_cols = X_train.select_dtypes(exclude=["object", "category"]).columns
+    categorical_cols = X_model.select_dtypes(include=["object", "category"]).columns
+    numerical_cols = X_model.select_dtypes(exclude=["object", "category"]).columns
 
     logging.info(f"Categorical columns: {categorical_cols.tolist()}")
     logging.info(f"Numerical columns: {numerical_cols.tolist()}")
@@ -62,6 +122,8 @@ def model_building_step(
     # Define the model training pipeline
     pipeline = Pipeline(steps=[("preprocessor", preprocessor), ("model", LinearRegression())])
 
+    import mlflow
+
     # Start an MLflow run to log the model training process
     if not mlflow.active_run():
         mlflow.start_run()  # Start a new MLflow run if there isn't one active
@@ -70,19 +132,49 @@ def model_building_step(
         # Enable autologging for scikit-learn to automatically capture model metrics, parameters, and artifacts
         mlflow.sklearn.autolog()
 
-        logging.info("Building and training the Linear Regression model.")
-        pipeline.fit(X_train, y_train)
+        cache = PreprocessingCache(cache_dir=preprocessing_cache_dir) if preprocessing_cache_dir else None
+
+        if strategy != "linear_regression":
+            logging.info(f"Building and training the model with the '{strategy}' strategy.")
+            strategy_kwargs = dict(strategy_params or {})
+            if warm_start_model is not None:
+                strategy_kwargs["warm_start_model"] = warm_start_model
+            model_strategy = MODEL_STRATEGIES[strategy](cache=cache, **strategy_kwargs)
+            if new_data_path:
+                logging.info(f"Continuing training on the new rows of {new_data_path} only.")
+                chunks = iter_xy_chunks(
+                    ChunkedCSVDataIngestor(model_strategy.chunksize).ingest(new_data_path), y_train.name
+                )
+                pipeline = model_strategy.partial_fit_chunks(_step_preprocessed_chunks(chunks, step_preprocessing))
+            else:
+                pipeline = ModelBuilder(model_strategy).build_model(X_model, y_train)
+
+            # Record the time spent on every tuning trial
+            trials = getattr(model_strategy, "trials_", None)
+            if trials is not None:
+                mlflow.log_text(trials.to_json(orient="records"), "tuning_trials.json")
+                mlflow.log_metric("tuning_fit_time_s", float(trials["fit_time_s"].sum()))
+        elif cache is not None:
+            logging.info("Building and training the Linear Regression model.")
+            # Reuse the imputed and encoded matrix from earlier runs on identical data
+            fitted_preprocessor, X_train_processed = cache.fit_transform(preprocessor, X_model)
+            regressor = LinearRegression().fit(X_train_processed, y_train)
+            pipeline = Pipeline(steps=[("preprocessor", fitted_preprocessor), ("model", regressor)])
+        else:
+            logging.info("Building and training the Linear Regression model.")
+            pipeline.fit(X_model, y_train)
         logging.info("Model training completed.")
 
-        # Log the columns that the model expects
-        onehot_encoder = (
-            pipeline.named_steps["preprocessor"].transformers_[1][1].named_steps["onehot"]
-        )
-        onehot_encoder.fit(X_train[categorical_cols])
-        expected_columns = numerical_cols.tolist() + list(
-            onehot_encoder.get_feature_names_out(categorical_cols)
-        )
-        logging.info(f"Model expects the following columns: {expected_columns}")
+        if step_preprocessing is not None:
+            pipeline = Pipeline(steps=[(STEP_NAME, step_preprocessing)] + pipeline.steps)
+
+        # Emit the signature (column order, dtypes, vocabularies, imputation constants) from the
+        # fitted preprocessing, so serving never re-fits encoders or reads the training CSV
+        # X_train is what the pipeline accepts: raw rows when the step preprocessing is fused in,
+        # already feature-engineered rows (e.g. log1p('area')) when it ran as separate steps
+        signature = ModelSignature.from_training_data(X_train, pipeline)
+        mlflow.log_dict(signature.to_dict(), "model_signature.json")
+        logging.info(f"Model expects the following columns: {signature.columns}")
 
     except Exception as e:
         logging.error(f"Error during model training: {e}")
@@ -92,5 +184,5 @@ def model_building_step(
         # End the MLflow run
         mlflow.end_run()
 
-    return pipeline
+    return pipeline, signature.to_dict()
 
@@ -4,10 +4,12 @@ from typing import Tuple
 import pandas as pd
 from sklearn.pipeline import Pipeline
 from src.model_evaluator import ModelEvaluator, RegressionModelEvaluationStrategy
+from src.step_profiler import profile_step
 from zenml import step
 
 
 @step(enable_cache=False)
+@profile_step
 def model_evaluator_step(
     trained_model: Pipeline, X_test: pd.DataFrame, y_test: pd.Series
 ) -> Tuple[dict, float]:
@@ -30,15 +32,16 @@ def model_evaluator_step(
 
     logging.info("Applying the same preprocessing to the test data.")
 
-    # Apply the preprocessing and model prediction
-    X_test_processed = trained_model.named_steps["preprocessor"].transform(X_test)
+    # Apply the preprocessing (every step before the model, including the fused step
+    # preprocessing when present) and model prediction
+    X_test_processed = trained_model[:-1].transform(X_test)
 
     # Initialize the evaluator with the regression strategy
     evaluator = ModelEvaluator(strategy=RegressionModelEvaluationStrategy())
 
     # Perform the evaluation
     evaluation_metrics = evaluator.evaluate(
-        trained_model.named_steps["model"], X_test_processed, y_test
+        trained_model[-1], X_test_processed, y_test
     )
 
     # Ensure that the evaluation metrics are returned as a dictionary
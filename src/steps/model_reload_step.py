@@ -0,0 +1,30 @@
+import logging
+
+import requests
+from src.step_profiler import profile_step
+from zenml import step
+from zenml.integrations.mlflow.services import MLFlowDeploymentService
+
+
+@step(enable_cache=False)
+@profile_step
+def model_reload_step(service: MLFlowDeploymentService, server_url: str, timeout: float = 10.0) -> str:
+    """
+    Asks a running src.prediction_server to hot-reload the model just deployed.
+
+    The server loads and warms up the new version in the background and swaps it in once ready,
+    so requests keep being served by the previous version meanwhile.
+
+    Parameters:
+    service (MLFlowDeploymentService): The service returned by mlflow_model_deployer_step.
+    server_url (str): Base URL of the prediction server, e.g. http://127.0.0.1:8000.
+    timeout (float): HTTP timeout in seconds.
+
+    Returns:
+    str: The model URI sent to the server.
+    """
+    model_uri = service.config.model_uri
+    response = requests.post(f"{server_url.rstrip('/')}/reload", json={"model_uri": model_uri}, timeout=timeout)
+    response.raise_for_status()
+    logging.info(f"Prediction server at {server_url} is loading {model_uri}: {response.json()}")
+    return model_uri
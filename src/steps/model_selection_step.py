@@ -0,0 +1,55 @@
+import logging
+from typing import Annotated, Tuple
+
+import pandas as pd
+from sklearn.pipeline import Pipeline
+from src.model_building import MODEL_STRATEGIES
+from src.model_selection import ParallelModelTrainer
+from src.step_profiler import profile_step
+from zenml import step
+
+
+@step(enable_cache=False)
+@profile_step
+def model_selection_step(
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    X_val: pd.DataFrame,
+    y_val: pd.Series,
+    strategies: list = None,
+    max_workers: int = None,
+) -> Tuple[
+    Annotated[pd.DataFrame, "model_leaderboard"],
+    Annotated[Pipeline, "best_model"],
+]:
+    """
+    Trains several model building strategies in parallel and ranks them.
+
+    Parameters:
+    X_train (pd.DataFrame), y_train (pd.Series): The training data.
+    X_val (pd.DataFrame), y_val (pd.Series): The data the leaderboard is scored on.
+    strategies (list): Names from MODEL_STRATEGIES, defaults to all of them.
+    max_workers (int): Number of worker processes.
+
+    Returns:
+    tuple: The leaderboard (tuning and fit time, predict latency, model size and validation
+    metrics per strategy) and the best pipeline by validation MSE.
+    """
+    if not isinstance(X_train, pd.DataFrame) or not isinstance(X_val, pd.DataFrame):
+        raise TypeError("X_train and X_val must be pandas DataFrames.")
+    if not isinstance(y_train, pd.Series) or not isinstance(y_val, pd.Series):
+        raise TypeError("y_train and y_val must be pandas Series.")
+
+    names = strategies or list(MODEL_STRATEGIES)
+    unknown = [name for name in names if name not in MODEL_STRATEGIES]
+    if unknown:
+        raise ValueError(f"Unknown model building strategies: {unknown}")
+
+    trainer = ParallelModelTrainer(
+        {name: MODEL_STRATEGIES[name]() for name in names}, max_workers=max_workers
+    )
+    leaderboard, models = trainer.train(X_train, y_train, X_val, y_val)
+
+    best = leaderboard.loc[0, "strategy"]
+    logging.info(f"Best strategy on validation data: {best}")
+    return leaderboard, models[best]
@@ -0,0 +1,10 @@
+from src.step_profiler import profile_step
+from zenml import step
+from zenml.client import Client
+
+
+@step(enable_cache=False)
+@profile_step
+def model_signature_loader(artifact_name: str = "model_signature") -> dict:
+    """Load the signature emitted by the latest training run of the model."""
+    return Client().get_artifact_version(artifact_name).load()
@@ -0,0 +1,72 @@
+import logging
+from typing import Annotated, Tuple
+
+from sklearn.pipeline import Pipeline
+from src.out_of_core import OutOfCoreTrainer
+from src.step_profiler import profile_step
+from src.steps.step_options import PRICES_PREDICTOR
+from zenml import ArtifactConfig, step
+
+
+# The experiment tracker is set when the pipeline is built (see out_of_core_pipeline)
+@step(enable_cache=False, model=PRICES_PREDICTOR)
+@profile_step
+def out_of_core_training_step(
+    file_path: str,
+    target_column: str = "price",
+    memory_limit_mb: float = 512,
+    missing_values: dict = None,
+    feature_engineering: list = None,
+    n_epochs: int = 1,
+    test_size: float = 0.2,
+) -> Tuple[
+    Annotated[Pipeline, ArtifactConfig(name="sklearn_pipeline", is_model_artifact=True)],
+    Annotated[dict, ArtifactConfig(name="model_signature")],
+    Annotated[dict, "evaluation_metrics"],
+]:
+    """
+    Trains and evaluates on a CSV streamed in chunks (src.out_of_core.OutOfCoreTrainer), for
+    datasets that do not fit in memory. Only the file path crosses the step boundary: no
+    DataFrame artifact of the full dataset is ever materialized.
+
+    Parameters:
+    file_path (str): The training CSV.
+    target_column (str): Column to predict.
+    memory_limit_mb (float): Memory the data may take at once; sets the chunk size.
+    missing_values (dict), feature_engineering (list): Step preprocessing configurations.
+    n_epochs (int): Training passes over the file.
+    test_size (float): Fraction of rows held out for evaluation.
+
+    Returns:
+    tuple: The trained pipeline, its signature and the evaluation metrics.
+    """
+    import mlflow
+
+    if not mlflow.active_run():
+        mlflow.start_run()
+
+    try:
+        trainer = OutOfCoreTrainer(
+            file_path,
+            target_column=target_column,
+            memory_limit_mb=memory_limit_mb,
+            missing_values=missing_values,
+            feature_engineering=feature_engineering,
+            test_size=test_size,
+            n_epochs=n_epochs,
+        ).fit()
+
+        mlflow.log_params({"memory_limit_mb": memory_limit_mb, "n_epochs": n_epochs})
+        mlflow.log_metrics({name.lower().replace(" ", "_").replace("-", "_"): value for name, value in trainer.metrics_.items()})
+        mlflow.log_dict({"passes": trainer.passes_}, "out_of_core_passes.json")
+        mlflow.log_dict(trainer.signature_.to_dict(), "model_signature.json")
+        logging.info(f"Model expects the following columns: {trainer.signature_.columns}")
+
+    except Exception as e:
+        logging.error(f"Error during out-of-core training: {e}")
+        raise e
+
+    finally:
+        mlflow.end_run()
+
+    return trainer.pipeline_, trainer.signature_.to_dict(), trainer.metrics_
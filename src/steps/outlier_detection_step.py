@@ -1,13 +1,26 @@
 import logging
 
+import numpy as np
 import pandas as pd
 from src.outlier_detection import OutlierDetector, ZScoreOutlierDetection
+from src.materializers.dataframe_materializer import DataFrameMaterializer
+from src.step_profiler import profile_step
 from zenml import step
 
 
-@step
-def outlier_detection_step(df: pd.DataFrame) -> pd.DataFrame:
-    """Detects and removes outliers using OutlierDetector."""
+@step(output_materializers=DataFrameMaterializer)
+@profile_step
+def outlier_detection_step(
+    df: pd.DataFrame, missing_values: dict = None, feature_engineering: list = None
+) -> pd.DataFrame:
+    """
+    Detects and removes outliers using OutlierDetector.
+
+    missing_values / feature_engineering: the step-level preprocessing the model applies itself
+    (fused preprocessing). Outliers are then judged on the values the model will see, e.g. on
+    log1p('area') rather than 'area', as when the preprocessing runs as steps before this one,
+    while the rows are removed from df unchanged.
+    """
     logging.info(f"Starting outlier detection step with DataFrame of shape: {df.shape}")
 
     if df is None:
@@ -23,9 +36,21 @@ def outlier_detection_step(df: pd.DataFrame) -> pd.DataFrame:
 #        raise ValueError(f"Column '{column_name}' does not exist in the DataFrame.")
         # Ensure only numeric columns are passed
     #df_numeric = df.select_dtypes(include=[int, float])
+    outlier_detector = OutlierDetector(ZScoreOutlierDetection(threshold=3))
+    if missing_values or feature_engineering:
+        from src.preprocessing_compiler import compile_preprocessing
+
+        preprocessing = compile_preprocessing(missing_values, feature_engineering)
+        # Rows the model step drops anyway do not count, as when the missing values step ran first
+        df_detect = preprocessing.fit_transform(df[preprocessing.training_row_mask(df)])
+        numeric_cols = df_detect.select_dtypes(include=[int, float]).columns
+        outliers = outlier_detector.detect_outliers(df_detect, numeric_cols)
+        outlier_rows = pd.Series(np.asarray(outliers).any(axis=1), index=df_detect.index)
+        logging.info("Removing outliers from the dataset.")
+        return df[~outlier_rows.reindex(df.index, fill_value=False)]
+
     numeric_cols = df.select_dtypes(include=[int, float]).columns
 
-    outlier_detector = OutlierDetector(ZScoreOutlierDetection(threshold=3))
    # outliers = outlier_detector.detect_outliers(df, numeric_cols)
     df_cleaned = outlier_detector.handle_outliers(df,numeric_cols, method="remove")
     return df_cleaned
@@ -1,49 +1,45 @@
-import json
-
 import numpy as np
-import pandas as pd
+from src import inference_client
+from src.model_signature import ModelSignature
+from src.payload_codec import decode_payload
+from src.step_profiler import profile_step
 from zenml import step
 from zenml.integrations.mlflow.services import MLFlowDeploymentService
 
 
 @step(enable_cache=False)
+@profile_step
 def predictor(
     service: MLFlowDeploymentService,
-    input_data: str,
+    input_data: bytes,
+    signature: dict,
+    max_concurrency: int = 8,
+    max_batch_rows: int = 1024,
 ) -> np.ndarray:
     """Run an inference request against a prediction service.
 
     Args:
         service (MLFlowDeploymentService): The deployed MLFlow service for prediction.
-        input_data (str): The input data as a JSON string.
+        input_data (bytes): The input rows, as a binary columnar, Arrow IPC or JSON payload.
+        signature (dict): The model signature emitted by model_building_step.
+        max_concurrency (int): Requests sent to the service at once.
+        max_batch_rows (int): Maximum rows per request.
 
     Returns:
         np.ndarray: The model's prediction.
     """
 
-    # Start the service (should be a NOP if already started)
-    service.start(timeout=10)
-
-    # Load the input data from JSON string
-    data = json.loads(input_data)
-
-    # Extract the actual data and expected columns
-    data.pop("columns", None)  # Remove 'columns' if it's present
-    data.pop("index", None)  # Remove 'index' if it's present
-
-    df = pd.read_csv(r"src\Data\Housing.csv")
-
-    # Define the columns the model expects
-    expected_columns = df.columns.tolist()
-
-    # Convert the data into a DataFrame with the correct columns
-    df = pd.DataFrame(data["data"], columns=expected_columns)
+    # Start the service only if it is not running yet
+    if not service.is_running:
+        service.start(timeout=10)
 
-    # Convert DataFrame to JSON list for prediction
-    json_list = json.loads(json.dumps(list(df.T.to_dict().values())))
-    data_array = np.array(json_list)
+    # Decode the payload (numeric columns of binary payloads are views, not copies), then
+    # validate and coerce it to the training schema (order, dtypes, imputation)
+    df = ModelSignature.from_dict(signature).coerce(decode_payload(input_data))
 
-    # Run the prediction
-    prediction = service.predict(data_array)
+    # Score through the pooled async client: concurrent, evenly sized requests with retries
+    prediction = inference_client.predict(
+        service.prediction_url, df, max_concurrency=max_concurrency, max_batch_rows=max_batch_rows
+    )
 
     return prediction
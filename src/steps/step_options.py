@@ -0,0 +1,24 @@
+from typing import Optional
+
+from zenml import Model
+
+# The model every training step registers its pipeline as a version of
+PRICES_PREDICTOR = Model(
+    name="prices_predictor",
+    version=None,
+    license="Apache 2.0",
+    description="Price prediction model for houses.",
+)
+
+
+def experiment_tracker_name() -> Optional[str]:
+    """
+    Name of the active stack's experiment tracker, or None if the stack has none.
+
+    Called when a pipeline is built (step.with_options(experiment_tracker=...)), so importing a
+    step module neither connects to the ZenML stack nor imports the tracker's integration.
+    """
+    from zenml.client import Client
+
+    experiment_tracker = Client().active_stack.experiment_tracker
+    return experiment_tracker.name if experiment_tracker else None
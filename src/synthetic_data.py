@@ -0,0 +1,137 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# Schema of src/Data/Housing.csv
+YES_NO_COLUMNS = [
+    "mainroad",
+    "guestroom",
+    "basement",
+    "hotwaterheating",
+    "airconditioning",
+    "prefarea",
+]
+FURNISHING_STATUSES = ["furnished", "semi-furnished", "unfurnished"]
+
+
+def generate_housing_data(n_rows: int, random_state: int = 42) -> pd.DataFrame:
+    """
+    Generates a synthetic frame with the Housing.csv schema.
+
+    Feature ranges follow the real dataset and the price is a noisy linear function of the
+    features, so models have a signal to learn.
+
+    Parameters:
+    n_rows (int): Number of rows to generate.
+    random_state (int): Seed of the generator.
+
+    Returns:
+    pd.DataFrame: Columns price, area, bedrooms, bathrooms, stories, the yes/no amenities,
+    parking and furnishingstatus.
+    """
+    rng = np.random.default_rng(random_state)
+    df = pd.DataFrame(
+        {
+            "area": rng.lognormal(mean=8.4, sigma=0.35, size=n_rows).clip(1650, 16200).round().astype(np.int64),
+            "bedrooms": rng.choice([1, 2, 3, 4, 5, 6], size=n_rows, p=[0.01, 0.25, 0.55, 0.17, 0.015, 0.005]),
+            "bathrooms": rng.choice([1, 2, 3, 4], size=n_rows, p=[0.73, 0.25, 0.018, 0.002]),
+            "stories": rng.choice([1, 2, 3, 4], size=n_rows, p=[0.42, 0.44, 0.07, 0.07]),
+        }
+    )
+    for column, p_yes in zip(YES_NO_COLUMNS, [0.86, 0.18, 0.35, 0.05, 0.32, 0.23]):
+        df[column] = np.where(rng.random(n_rows) < p_yes, "yes", "no")
+    df["parking"] = rng.choice([0, 1, 2, 3], size=n_rows, p=[0.55, 0.23, 0.2, 0.02])
+    df["furnishingstatus"] = rng.choice(FURNISHING_STATUSES, size=n_rows, p=[0.26, 0.42, 0.32])
+
+    amenities = sum((df[column] == "yes").to_numpy() * weight for column, weight in zip(
+        YES_NO_COLUMNS, [400_000, 300_000, 350_000, 800_000, 850_000, 650_000]
+    ))
+    furnishing = df["furnishingstatus"].map({"furnished": 300_000, "semi-furnished": 100_000, "unfurnished": 0})
+    price = (
+        250 * df["area"]
+        + 120_000 * df["bedrooms"]
+        + 1_000_000 * df["bathrooms"]
+        + 400_000 * df["stories"]
+        + 250_000 * df["parking"]
+        + amenities
+        + furnishing.to_numpy()
+        + rng.normal(0, 900_000, size=n_rows)
+    )
+    df.insert(0, "price", price.clip(1_750_000).round().astype(np.int64))
+    return df
+
+
+# Distribution-fitted synthesizer
+# -------------------------------
+# Learns the empirical marginal of every column and their rank correlations (a Gaussian copula),
+# then samples new rows by drawing correlated normals and mapping each through the inverse
+# marginal. Generated rows stay within the observed values and keep relationships such as
+# larger areas having more bedrooms, so they make realistic inference requests.
+class HousingSynthesizer:
+    def __init__(self, n_quantiles: int = 1000):
+        """
+        Parameters:
+        n_quantiles (int): Resolution of the stored marginal of continuous columns.
+        """
+        self.n_quantiles = n_quantiles
+
+    def fit(self, df: pd.DataFrame) -> "HousingSynthesizer":
+        from scipy.special import ndtri
+
+        self.columns_ = df.columns.tolist()
+        self.dtypes_ = df.dtypes.to_dict()
+        self.marginals_ = {}
+        normal_scores = np.empty((len(df), len(self.columns_)))
+        for i, column in enumerate(self.columns_):
+            values = df[column].dropna()
+            if values.dtype.kind in "biuf" and values.nunique() > 20:
+                # Continuous: interpolated empirical quantiles
+                levels = np.linspace(0, 1, self.n_quantiles)
+                self.marginals_[column] = ("continuous", np.quantile(values.to_numpy(dtype=np.float64), levels))
+            else:
+                # Discrete: observed values and their cumulative frequencies
+                frequencies = values.value_counts(normalize=True).sort_index()
+                self.marginals_[column] = ("discrete", frequencies.index.to_numpy(), np.cumsum(frequencies.to_numpy()))
+            # Mid-ranks handle ties; missing values take the median score
+            ranks = df[column].rank(method="average", pct=True).to_numpy()
+            ranks = (ranks * len(df) - 0.5) / len(df)
+            normal_scores[:, i] = np.where(np.isnan(ranks), 0.0, ndtri(np.clip(ranks, 1e-6, 1 - 1e-6)))
+
+        correlation = np.corrcoef(normal_scores, rowvar=False)
+        correlation = np.nan_to_num(correlation, nan=0.0)
+        np.fill_diagonal(correlation, 1.0)
+        # Nearest positive semi-definite matrix, for constant columns and rounding
+        eigenvalues, eigenvectors = np.linalg.eigh(correlation)
+        self.correlation_ = (eigenvectors * np.clip(eigenvalues, 1e-9, None)) @ eigenvectors.T
+        return self
+
+    def sample(self, n_rows: int, random_state: int = None) -> pd.DataFrame:
+        """
+        Draws n_rows synthetic rows with the fitted columns and dtypes.
+        """
+        from scipy.special import ndtr
+
+        rng = np.random.default_rng(random_state)
+        uniforms = ndtr(rng.multivariate_normal(np.zeros(len(self.columns_)), self.correlation_, size=n_rows,
+                                                method="eigh"))
+        data = {}
+        for i, column in enumerate(self.columns_):
+            marginal = self.marginals_[column]
+            if marginal[0] == "continuous":
+                quantiles = marginal[1]
+                values = np.interp(uniforms[:, i], np.linspace(0, 1, len(quantiles)), quantiles)
+                if self.dtypes_[column].kind in "iu":
+                    values = values.round()
+            else:
+                categories, cumulative = marginal[1], marginal[2]
+                values = categories[np.minimum(np.searchsorted(cumulative, uniforms[:, i]), len(categories) - 1)]
+            data[column] = values
+        df = pd.DataFrame(data)
+        for column, dtype in self.dtypes_.items():
+            if dtype.kind in "biuf":
+                df[column] = df[column].astype(dtype)
+        return df
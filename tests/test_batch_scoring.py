@@ -0,0 +1,46 @@
+import joblib
+import numpy as np
+import pytest
+
+from src.batch_scoring import BatchScorer
+from src.model_building import RidgeStrategy
+from src.model_signature import ModelSignature
+from src.synthetic_data import generate_housing_data
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture(scope="module")
+def scoring_setup(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("batch_scoring")
+    df = generate_housing_data(1200, random_state=0)
+    X, y = df.drop(columns=["price"]), df["price"]
+    pipeline = RidgeStrategy().build_and_train_model(X, y)
+    model_path = directory / "model.joblib"
+    joblib.dump(pipeline, model_path)
+    input_path = directory / "listings.csv"
+    X.assign(listing_id=np.arange(len(X)) + 1000).to_csv(input_path, index=False)
+    return pipeline, ModelSignature.from_training_data(X, pipeline), X, str(model_path), str(input_path), directory
+
+
+def test_batch_scores_match_the_pipeline_in_input_order(scoring_setup):
+    pipeline, signature, X, model_path, input_path, directory = scoring_setup
+    output_path = str(directory / "predictions.parquet")
+    report = BatchScorer(model_path, signature, chunksize=250, n_workers=2, passthrough_columns=["listing_id"]).score(
+        input_path, output_path
+    )
+    assert (report["rows"], report["chunks"]) == (len(X), 5)
+
+    output = pq.read_table(output_path).to_pandas()
+    assert output.columns.tolist() == ["row", "listing_id", "prediction"]
+    np.testing.assert_array_equal(output["row"], np.arange(len(X)))
+    np.testing.assert_array_equal(output["listing_id"], np.arange(len(X)) + 1000)
+    np.testing.assert_allclose(output["prediction"], pipeline.predict(signature.coerce(X)), rtol=1e-9)
+
+
+def test_invalid_rows_fail_the_run(scoring_setup):
+    _, signature, X, model_path, _, directory = scoring_setup
+    broken = directory / "broken.csv"
+    X.drop(columns=[signature.columns[0]]).to_csv(broken, index=False)
+    with pytest.raises(ValueError):
+        BatchScorer(model_path, signature, chunksize=500, n_workers=1).score(str(broken), str(directory / "out.parquet"))
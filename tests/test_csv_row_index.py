@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.csv_row_index import CSVRowIndex, reservoir_sample
+from src.synthetic_data import generate_housing_data
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "houses.csv"
+    generate_housing_data(200, random_state=0).to_csv(path, index=False)
+    return str(path)
+
+
+def test_read_rows_matches_a_full_parse(csv_path):
+    index = CSVRowIndex(csv_path)
+    full = pd.read_csv(csv_path)
+    rows = [0, 57, 3, 199]
+
+    assert len(index) == len(full)
+    pd.testing.assert_frame_equal(index.read_rows(rows), full.loc[rows])
+
+
+def test_index_is_reused_until_the_file_changes(csv_path, monkeypatch):
+    CSVRowIndex(csv_path)
+    built = []
+    monkeypatch.setattr(CSVRowIndex, "_build", lambda self, state: built.append(state) or (b"", np.zeros(0)))
+    assert len(CSVRowIndex(csv_path)) == 200 and not built
+
+    with open(csv_path, "a") as f:
+        f.write(pd.read_csv(csv_path).iloc[[0]].to_csv(index=False, header=False))
+    CSVRowIndex(csv_path)
+    assert len(built) == 1
+
+
+def test_trailing_blank_lines_are_not_rows(tmp_path):
+    path = tmp_path / "small.csv"
+    path.write_bytes(b"a,b\r\n1,x\r\n2,y\r\n\r\n")
+    index = CSVRowIndex(str(path))
+
+    assert len(index) == 2
+    assert index.read_rows([1]).to_dict("records") == [{"a": 2, "b": "y"}]
+
+
+def test_sample_draws_distinct_rows(csv_path):
+    index = CSVRowIndex(csv_path)
+    sample = index.sample(50, random_state=1)
+
+    assert sample.index.is_unique and len(sample) == 50
+    pd.testing.assert_frame_equal(sample, pd.read_csv(csv_path).loc[sample.index])
+    with pytest.raises(ValueError):
+        index.sample(201)
+
+
+def _chunks(n_rows, chunk_size):
+    df = pd.DataFrame({"row": np.arange(n_rows)})
+    return (df.iloc[start:start + chunk_size] for start in range(0, n_rows, chunk_size))
+
+
+def test_reservoir_sample_is_uniform_across_the_stream():
+    n_rows, n, trials = 40, 10, 800
+    rng = np.random.default_rng(0)
+    counts = np.zeros(n_rows)
+    for _ in range(trials):
+        sample = reservoir_sample(_chunks(n_rows, 7), n=n, random_state=rng)
+        assert len(sample) == n and sample["row"].is_unique
+        counts[sample["row"]] += 1
+
+    # Every row is kept with probability n / n_rows, wherever it sits in the stream
+    expected = trials * n / n_rows
+    assert np.abs(counts - expected).max() < 5 * np.sqrt(expected)
+
+
+def test_reservoir_sample_of_a_short_stream_keeps_every_row():
+    assert sorted(reservoir_sample(_chunks(5, 2), n=10)["row"]) == [0, 1, 2, 3, 4]
+    assert reservoir_sample(iter([]), n=3).empty
@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_splitter import GroupResamplingSplit, HashTrainTestSplit
+
+
+def _frame(n_rows, start=0):
+    keys = np.arange(start, start + n_rows)
+    return pd.DataFrame({"order": keys, "area": keys * 10.0, "price": keys * 2.0})
+
+
+def test_hash_split_is_deterministic():
+    df = _frame(1000)
+    first = HashTrainTestSplit(key_column="order").test_mask(df)
+    second = HashTrainTestSplit(key_column="order").test_mask(df)
+    np.testing.assert_array_equal(first, second)
+
+
+def test_hash_split_keeps_existing_rows_when_rows_are_appended():
+    splitter = HashTrainTestSplit(test_size=0.3, key_column="order")
+    old = _frame(2000)
+    grown = pd.concat([old, _frame(500, start=2000)], ignore_index=True)
+    np.testing.assert_array_equal(splitter.test_mask(grown)[: len(old)], splitter.test_mask(old))
+
+
+def test_hash_split_does_not_depend_on_row_order():
+    splitter = HashTrainTestSplit(key_column="order")
+    df = _frame(1000)
+    shuffled = df.sample(frac=1, random_state=0)
+    expected = pd.Series(splitter.test_mask(df), index=df.index)
+    np.testing.assert_array_equal(splitter.test_mask(shuffled), expected[shuffled.index].to_numpy())
+
+
+def test_hash_split_puts_duplicated_keys_on_the_same_side():
+    df = pd.DataFrame({"order": np.repeat(np.arange(300), 3), "price": 1.0})
+    mask = HashTrainTestSplit(key_column="order").test_mask(df)
+    assert (mask.reshape(-1, 3) == mask.reshape(-1, 3)[:, :1]).all()
+
+
+def test_hash_split_test_fraction_and_partition():
+    df = _frame(20000)
+    X_train, X_test, y_train, y_test = HashTrainTestSplit(test_size=0.2, key_column="order").split_data(df, "price")
+    assert len(X_test) / len(df) == pytest.approx(0.2, abs=0.01)
+    assert len(X_train) + len(X_test) == len(df)
+    assert set(X_train["order"]).isdisjoint(X_test["order"])
+    assert "price" not in X_train.columns
+    assert y_train.index.equals(X_train.index) and y_test.index.equals(X_test.index)
+
+
+def test_hash_split_salt_draws_another_split():
+    df = _frame(1000)
+    default = HashTrainTestSplit(key_column="order").test_mask(df)
+    salted = HashTrainTestSplit(key_column="order", salt="another_16_bytes").test_mask(df)
+    assert (default != salted).any()
+
+
+def test_hash_split_rejects_invalid_parameters():
+    with pytest.raises(ValueError):
+        HashTrainTestSplit(test_size=1.0)
+    with pytest.raises(ValueError):
+        HashTrainTestSplit(salt="short")
+
+
+def _imbalanced_frame(sizes, seed=0):
+    labels = np.repeat(np.arange(len(sizes)), sizes)
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({"row": np.arange(len(labels)), "noise": rng.random(len(labels)), "label": labels})
+
+
+def test_group_undersampling_balances_training_groups_and_keeps_test_distribution():
+    df = _imbalanced_frame([1000, 300, 60])
+    X_train, X_test, y_train, y_test = GroupResamplingSplit(test_size=0.25, method="under").split_data(df, "label")
+    counts = y_train.value_counts()
+    assert len(counts) == 3 and counts.nunique() == 1
+    # Undersampling never repeats a row, and training and test rows never overlap
+    assert X_train["row"].is_unique
+    assert set(X_train["row"]).isdisjoint(X_test["row"])
+    assert len(X_test) == int(np.ceil(len(df) * 0.25))
+    assert y_test.value_counts()[0] > y_test.value_counts()[2]
+
+
+def test_group_oversampling_keeps_every_training_row():
+    df = _imbalanced_frame([500, 100, 20])
+    X_train, X_test, y_train, _ = GroupResamplingSplit(test_size=0.2, method="over").split_data(df, "label")
+    training_rows = set(df["row"]) - set(X_test["row"])
+    largest = int((df.loc[df["row"].isin(training_rows), "label"] == 0).sum())
+    assert (y_train.value_counts() == largest).all()
+    assert set(X_train["row"]) == training_rows
+    assert (X_train.index == y_train.index).all()
+
+
+def test_group_resampling_target_ratio():
+    df = _imbalanced_frame([1000, 100])
+    _, _, y_train, _ = GroupResamplingSplit(test_size=0.2, target_ratio=0.5).split_data(df, "label")
+    counts = y_train.value_counts()
+    assert counts[1] / counts[0] == pytest.approx(0.5, abs=0.01)
+
+
+def test_group_resampling_bins_a_continuous_group_column():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({"area": rng.random(2000), "price": rng.lognormal(size=2000)})
+    df.loc[:9, "price"] = np.nan
+    splitter = GroupResamplingSplit(test_size=0.2, group_column="price", n_bins=4)
+    codes = splitter._group_codes(df, "price")
+    # Four quantile bins plus one group for the missing values
+    assert sorted(np.unique(codes)) == [0, 1, 2, 3, 4]
+    assert (codes[:10] == 4).all()
+
+
+def test_group_resampling_is_reproducible():
+    df = _imbalanced_frame([400, 50])
+    first = GroupResamplingSplit(random_state=3).split_data(df, "label")
+    second = GroupResamplingSplit(random_state=3).split_data(df, "label")
+    for a, b in zip(first, second):
+        assert a.index.equals(b.index)
+
+
+def test_group_resampling_rejects_invalid_parameters():
+    with pytest.raises(ValueError):
+        GroupResamplingSplit(method="smote")
+    with pytest.raises(ValueError):
+        GroupResamplingSplit(target_ratio=0)
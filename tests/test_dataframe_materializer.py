@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("zenml")
+
+from src.materializers.dataframe_materializer import (
+    COMPRESSED_DATA_FILENAME,
+    COMPRESSION_ENV,
+    DATA_FILENAME,
+    DataFrameMaterializer,
+    columns_to_frame,
+    frame_to_columns,
+)
+from src.payload_codec import decode_frame, encode_frame
+from src.synthetic_data import generate_housing_data
+
+
+class LocalArtifactStore:
+    """The part of an artifact store the materializer uses, on the local filesystem."""
+
+    def open(self, path, mode="r"):
+        return open(path, mode)
+
+
+def _frames():
+    housing = generate_housing_data(200, random_state=0)
+    yield housing
+    yield housing.iloc[::3]
+    yield housing.set_index(["furnishingstatus", "stories"]).assign(
+        mainroad=lambda df: df["mainroad"].astype("category"),
+        parking=lambda df: df["parking"].astype("Int64").mask(df["parking"] == 0),
+        sold=pd.date_range("2024-01-01", periods=200, freq="D"),
+    )
+    yield housing["price"].rename("target")
+    yield housing.iloc[:0]
+
+
+@pytest.mark.parametrize("data", list(_frames()), ids=["range", "subset", "multi", "series", "empty"])
+def test_columns_round_trip_through_the_codec(data):
+    columns, meta = frame_to_columns(data)
+    restored = columns_to_frame(decode_frame(encode_frame(columns), categorical=True), meta)
+
+    if isinstance(data, pd.Series):
+        pd.testing.assert_series_equal(restored, data)
+    else:
+        pd.testing.assert_frame_equal(restored, data)
+
+
+@pytest.mark.parametrize("compression", ["none", "zlib"])
+def test_save_and_load(tmp_path, monkeypatch, compression):
+    monkeypatch.setenv(COMPRESSION_ENV, compression)
+    data = generate_housing_data(500, random_state=1)
+    materializer = DataFrameMaterializer(str(tmp_path), artifact_store=LocalArtifactStore())
+    materializer.save(data)
+
+    assert (tmp_path / (COMPRESSED_DATA_FILENAME if compression == "zlib" else DATA_FILENAME)).exists()
+    loaded = materializer.load(pd.DataFrame)
+    pd.testing.assert_frame_equal(loaded, data)
+    # Loaded frames are writable and writes never reach the artifact
+    loaded.loc[0, "price"] = -1
+    pd.testing.assert_frame_equal(materializer.load(pd.DataFrame), data)
+
+
+def test_one_column_frame_loads_as_a_series(tmp_path):
+    materializer = DataFrameMaterializer(str(tmp_path), artifact_store=LocalArtifactStore())
+    materializer.save(pd.DataFrame({"price": np.arange(5)}))
+    loaded = materializer.load(pd.Series)
+
+    assert isinstance(loaded, pd.Series) and loaded.tolist() == [0, 1, 2, 3, 4]
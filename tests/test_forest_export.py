@@ -0,0 +1,61 @@
+import json
+
+import numpy as np
+import pytest
+from sklearn.ensemble import ExtraTreesRegressor, RandomForestRegressor
+
+from src.forest_export import MappedForestRegressor, export_forest
+from src.model_building import RandomForestStrategy
+from src.model_store import read_model
+from src.synthetic_data import generate_housing_data
+
+
+@pytest.fixture(scope="module")
+def housing():
+    df = generate_housing_data(1500, random_state=0)
+    return df.drop(columns=["price"]), df["price"]
+
+
+@pytest.mark.parametrize("forest", [RandomForestRegressor, ExtraTreesRegressor])
+def test_mapped_forest_matches_sklearn(tmp_path, forest):
+    rng = np.random.default_rng(0)
+    X = rng.random((500, 6))
+    y = X @ np.arange(6.0) + rng.normal(size=500)
+    model = forest(n_estimators=15, random_state=0).fit(X, y)
+    export_forest(model, str(tmp_path))
+    mapped = MappedForestRegressor(str(tmp_path), batch_size=64)
+    np.testing.assert_allclose(mapped.predict(X), model.predict(X), rtol=1e-5)
+    assert isinstance(mapped.threshold, np.memmap)
+
+
+def test_exported_pipeline_keeps_its_preprocessing(tmp_path, housing):
+    X, y = housing
+    pipeline = RandomForestStrategy(n_estimators=10).build_and_train_model(X, y)
+    meta = export_forest(pipeline, str(tmp_path))
+    assert meta == json.loads((tmp_path / "meta.json").read_text())
+    assert meta["has_preprocessor"] and meta["n_trees"] == 10
+    mapped = MappedForestRegressor(str(tmp_path))
+    np.testing.assert_allclose(mapped.predict(X), pipeline.predict(X), rtol=1e-5)
+
+
+def test_exported_forest_is_smaller_than_the_pickle(tmp_path, housing):
+    import joblib
+
+    X, y = housing
+    pipeline = RandomForestStrategy(n_estimators=10).build_and_train_model(X, y)
+    joblib.dump(pipeline, tmp_path / "model.joblib")
+    export_forest(pipeline, str(tmp_path / "forest"))
+    exported = sum(path.stat().st_size for path in (tmp_path / "forest").iterdir())
+    assert exported < (tmp_path / "model.joblib").stat().st_size
+    assert read_model(str(tmp_path / "model.joblib"))[-1].n_estimators == 10
+
+
+def test_rejects_non_forests_and_wrong_widths(tmp_path):
+    from sklearn.linear_model import LinearRegression
+
+    with pytest.raises(TypeError):
+        export_forest(LinearRegression().fit([[0.0], [1.0]], [0.0, 1.0]), str(tmp_path))
+    model = RandomForestRegressor(n_estimators=2, random_state=0).fit(np.eye(3), [0.0, 1.0, 2.0])
+    export_forest(model, str(tmp_path))
+    with pytest.raises(ValueError):
+        MappedForestRegressor(str(tmp_path)).predict(np.zeros((1, 2)))
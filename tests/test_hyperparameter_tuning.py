@@ -0,0 +1,77 @@
+import multiprocessing
+import time
+
+import numpy as np
+import pytest
+from sklearn.base import BaseEstimator, RegressorMixin
+from sklearn.linear_model import Ridge
+
+from src.hyperparameter_tuning import SuccessiveHalvingSearch
+
+
+def _data(n_rows=600, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.random((n_rows, 5))
+    return X, X @ np.arange(1.0, 6.0) + rng.normal(scale=0.1, size=n_rows)
+
+
+class SlowRegressor(BaseEstimator, RegressorMixin):
+    """Predicts the training mean plus offset; fitting takes 20 ms per unit of n_estimators."""
+
+    def __init__(self, n_estimators=1, offset=0.0):
+        self.n_estimators = n_estimators
+        self.offset = offset
+
+    def fit(self, X, y):
+        time.sleep(0.02 * self.n_estimators)
+        self.mean_ = float(np.mean(y))
+        return self
+
+    def predict(self, X):
+        return np.full(len(X), self.mean_ + self.offset)
+
+
+@pytest.mark.parametrize("n_candidates, eta, n_rounds", [(27, 3, 4), (243, 3, 6), (125, 5, 4), (1000, 10, 4), (8, 3, 2)])
+def test_number_of_rounds_uses_exact_powers(n_candidates, eta, n_rounds):
+    search = SuccessiveHalvingSearch(Ridge(), {}, n_candidates=n_candidates, resource="n_estimators", eta=eta)
+    budgets = search._budgets(10_000)
+    assert len(budgets) == n_rounds
+    assert budgets[-1] == 300 and budgets == sorted(budgets)
+
+
+def test_search_halves_candidates_and_finds_the_best():
+    X, y = _data()
+    search = SuccessiveHalvingSearch(
+        Ridge(), {"alpha": [1e-3, 1e-2, 1e-1, 1, 10, 100, 1e3, 1e4, 1e5]}, n_candidates=9, max_workers=2
+    ).fit(X, y)
+    rounds = search.trials_.groupby("round").size().tolist()
+    # A single candidate is left after the second round, so the last budget is not searched
+    assert rounds == [9, 3]
+    assert search.best_params_["alpha"] <= 1
+    assert search.best_budget_ == search.budgets_[-1]
+    assert (search.trials_["status"] == "completed").all()
+
+
+def test_deadline_stops_running_trials_and_records_the_budget_reached():
+    X, y = _data()
+    # First round: 9 trials of 0.2 s on 2 workers; the second round's 0.6 s trials overrun
+    search = SuccessiveHalvingSearch(
+        SlowRegressor(),
+        {"offset": [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0]},
+        n_candidates=9,
+        resource="n_estimators",
+        min_resource=10,
+        max_resource=1000,
+        time_budget_s=1.5,
+        max_workers=2,
+    ).fit(X, y)
+    assert search.budgets_ == [10, 30, 1000]
+    assert (search.trials_["status"] == "timed_out").any()
+    assert search.best_params_ == {"offset": 0.0}
+    assert search.best_budget_ == 10
+    assert not multiprocessing.active_children()
+
+
+def test_rejects_eta_below_two():
+    with pytest.raises(ValueError):
+        SuccessiveHalvingSearch(Ridge(), {}, eta=1)
@@ -0,0 +1,28 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.bench_import_time import BUDGETS
+
+CHECK = """
+import importlib, json, sys
+try:
+    importlib.import_module(sys.argv[1])
+except ModuleNotFoundError as e:
+    print(json.dumps({"missing": e.name}))
+else:
+    print(json.dumps({"loaded": [m for m in sys.argv[2:] if m in sys.modules]}))
+"""
+
+
+@pytest.mark.parametrize("target", sorted(BUDGETS))
+def test_heavy_modules_stay_lazy(target):
+    lazy = BUDGETS[target][1]
+    # A fresh interpreter: this one has most of them imported already
+    result = subprocess.run([sys.executable, "-c", CHECK, target, *lazy], capture_output=True, text=True, check=True)
+    outcome = json.loads(result.stdout.splitlines()[-1])
+    if "missing" in outcome:
+        pytest.skip(f"{target} needs {outcome['missing']}")
+    assert outcome["loaded"] == []
@@ -0,0 +1,97 @@
+import copy
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import ColumnTransformer
+from sklearn.impute import SimpleImputer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+from src.incremental_learning import IncrementalPreprocessor, iter_frame_chunks
+from src.model_building import IncrementalSGDStrategy
+from src.synthetic_data import generate_housing_data
+
+
+@pytest.fixture(scope="module")
+def housing():
+    df = generate_housing_data(3000, random_state=0)
+    return df.drop(columns=["price"]), df["price"]
+
+
+def test_chunked_preprocessor_matches_a_full_fit():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(
+        {
+            "area": rng.random(1000) * 100,
+            "rooms": rng.integers(1, 6, 1000).astype(float),
+            "zone": pd.Series(rng.choice(["a", "b", "c"], 1000), dtype=object),
+        }
+    )
+    X.loc[::9, "area"] = np.nan
+    X.loc[::11, "zone"] = np.nan
+
+    chunked = IncrementalPreprocessor()
+    for start in range(0, len(X), 128):
+        chunked.partial_fit(X.iloc[start:start + 128])
+
+    reference = ColumnTransformer(
+        [
+            ("num", Pipeline([("imputer", SimpleImputer()), ("scaler", StandardScaler())]), ["area", "rooms"]),
+            (
+                "cat",
+                Pipeline(
+                    [
+                        ("imputer", SimpleImputer(strategy="most_frequent")),
+                        ("onehot", OneHotEncoder(handle_unknown="ignore", sparse_output=False)),
+                    ]
+                ),
+                ["zone"],
+            ),
+        ]
+    ).fit(X)
+    assert chunked.n_rows_seen_ == len(X)
+    # Chunks are scaled after imputing with the running mean of the chunks seen so far
+    np.testing.assert_allclose(chunked.transform(X), reference.transform(X), atol=0.01)
+
+
+def test_unseen_categories_keep_the_encoded_width():
+    first = pd.DataFrame({"area": [1.0, 2.0], "zone": pd.Series(["a", "b"], dtype=object)})
+    later = pd.DataFrame({"area": [3.0], "zone": pd.Series(["z"], dtype=object)})
+    preprocessor = IncrementalPreprocessor().partial_fit(first).partial_fit(later)
+    encoded = preprocessor.transform(later)
+    assert encoded.shape == (1, 3)
+    assert (encoded[:, 1:] == 0).all()
+
+
+def test_strategy_learns_from_an_in_memory_frame(housing):
+    X, y = housing
+    pipeline = IncrementalSGDStrategy(chunksize=500, n_epochs=3).build_and_train_model(X, y)
+    baseline = np.mean((y - y.mean()) ** 2)
+    assert np.mean((pipeline.predict(X) - y) ** 2) < 0.8 * baseline
+
+
+def test_warm_start_continues_training_with_frozen_preprocessing(housing):
+    X, y = housing
+    trained = IncrementalSGDStrategy(chunksize=500).build_and_train_model(X[:2000], y[:2000])
+    statistics = trained.named_steps["preprocessor"].statistics_.copy()
+    coef = trained.named_steps["model"].regressor_.coef_.copy()
+
+    updated = IncrementalSGDStrategy(warm_start_model=copy.deepcopy(trained)).partial_fit_chunks(
+        iter_frame_chunks(X[2000:], y[2000:], 250)
+    )
+    preprocessor = updated.named_steps["preprocessor"]
+    assert preprocessor.n_rows_seen_ == 2000
+    np.testing.assert_array_equal(preprocessor.statistics_, statistics)
+    assert not np.array_equal(updated.named_steps["model"].regressor_.coef_, coef)
+    # Target scaling is kept from the first chunk ever seen
+    assert updated.named_steps["model"].target_mean_ == trained.named_steps["model"].target_mean_
+
+
+def test_warm_start_requires_an_incremental_pipeline(housing):
+    from sklearn.linear_model import LinearRegression
+
+    X, y = housing
+    pipeline = Pipeline([("preprocessor", StandardScaler()), ("model", LinearRegression())])
+    with pytest.raises(ValueError):
+        IncrementalSGDStrategy(warm_start_model=pipeline)
@@ -0,0 +1,71 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from src.inference_client import AsyncInferenceClient, InferenceRequestError, LocalStandInServer
+
+
+class RowSumModel:
+    def predict(self, X):
+        return X.sum(axis=1, numeric_only=True).to_numpy()
+
+
+class FailingModel:
+    def predict(self, X):
+        raise RuntimeError("broken model")
+
+
+def _frame(n_rows):
+    return pd.DataFrame({"a": np.arange(n_rows, dtype=np.float64), "b": np.ones(n_rows), "zone": "RL"})
+
+
+def _predict(model, df, server_kwargs=None, **client_kwargs):
+    async def run():
+        async with LocalStandInServer(model, **(server_kwargs or {})) as server:
+            async with AsyncInferenceClient(server.url, backoff_s=0.001, **client_kwargs) as client:
+                return await client.predict(df), client, server
+
+    return asyncio.run(run())
+
+
+def test_split_respects_the_batch_limit_and_uses_the_concurrency():
+    client = AsyncInferenceClient("http://unused", max_concurrency=4, max_batch_rows=100, min_batch_rows=10)
+
+    sizes = [part.stop - part.start for part in client.split(1000)]
+    assert sum(sizes) == 1000 and max(sizes) <= 100 and max(sizes) - min(sizes) <= 1
+    # Small frames are spread over the concurrency slots, but not below min_batch_rows
+    assert len(client.split(200)) == 4
+    assert len(client.split(25)) == 2
+    assert client.split(0) == []
+
+
+@pytest.mark.parametrize("protocol", ["mlflow", "binary"])
+def test_predictions_come_back_in_row_order(protocol):
+    df = _frame(1000)
+    predictions, client, server = _predict(RowSumModel(), df, protocol=protocol, max_batch_rows=128)
+
+    np.testing.assert_array_equal(predictions, df["a"] + 1)
+    assert server.requests == client.requests_sent == 8
+
+
+def test_transient_failures_are_retried():
+    df = _frame(300)
+    predictions, client, server = _predict(RowSumModel(), df, {"fail_every": 3}, max_batch_rows=50)
+
+    np.testing.assert_array_equal(predictions, df["a"] + 1)
+    assert client.retries_done > 0
+    assert client.requests_sent == 6 + client.retries_done
+
+
+def test_server_errors_are_not_retried():
+    with pytest.raises(InferenceRequestError, match="HTTP 500"):
+        _predict(FailingModel(), _frame(10))
+
+
+def test_retries_are_bounded():
+    with pytest.raises(InferenceRequestError, match="after 3 attempts"):
+        _predict(RowSumModel(), _frame(10), {"fail_every": 1}, retries=2)
@@ -0,0 +1,72 @@
+import threading
+from typing import Tuple
+
+import pytest
+
+pytest.importorskip("zenml")
+
+from zenml import pipeline, step
+
+from src.pipelines.local_runner import LocalPipelineRunner, run_locally
+
+# Both branches wait here until the other one has started, so a sequential run would time out
+branches_started = threading.Barrier(2, timeout=5)
+
+
+@step
+def load(n: int) -> list:
+    return list(range(n))
+
+
+@step
+def split(data: list) -> Tuple[list, list]:
+    return data[::2], data[1::2]
+
+
+@step
+def total(values: list) -> int:
+    branches_started.wait()
+    return sum(values)
+
+
+@step
+def combine(even: int, odd: int, scale: int = 1) -> int:
+    return scale * (even - odd)
+
+
+@pipeline
+def branching_pipeline(n: int = 10):
+    even, odd = split(load(n))
+    return combine(total(even), total(odd), scale=2)
+
+
+@step
+def fail() -> int:
+    raise ValueError("step failed")
+
+
+@pipeline
+def failing_pipeline():
+    return combine(fail(), 1)
+
+
+def test_trace_builds_the_step_graph():
+    runner = LocalPipelineRunner()
+    runner.trace(branching_pipeline, n=4)
+
+    graph = {node.name: [upstream.name for upstream in node.upstream] for node in runner.nodes_}
+    assert graph == {"load": [], "split": ["load"], "total": ["split"], "total_2": ["split"],
+                     "combine": ["total", "total_2"]}
+
+
+def test_independent_steps_run_concurrently():
+    outputs = run_locally(branching_pipeline, max_workers=2, n=10)
+
+    assert outputs["split"] == ([0, 2, 4, 6, 8], [1, 3, 5, 7, 9])
+    assert (outputs["total"], outputs["total_2"]) == (20, 25)
+    assert outputs["return"] == outputs["combine"] == -10
+
+
+def test_the_first_step_failure_propagates():
+    with pytest.raises(ValueError, match="step failed"):
+        run_locally(failing_pipeline)
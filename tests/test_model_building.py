@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from src.model_building import HistGradientBoostingStrategy
+from src.synthetic_data import generate_housing_data
+
+
+@pytest.fixture(scope="module")
+def housing():
+    df = generate_housing_data(2000, random_state=0)
+    return df.drop(columns=["price"]), df["price"]
+
+
+def test_hist_gradient_boosting_preprocessor_encodes_each_categorical_in_one_column(housing):
+    X, _ = housing
+    strategy = HistGradientBoostingStrategy()
+    matrix = strategy.build_preprocessor(X).fit_transform(X)
+    n_categorical = len(X.select_dtypes(include=["object", "category"]).columns)
+    assert matrix.shape == X.shape
+    assert matrix.dtype == np.float64
+    assert strategy.categorical_mask_.sum() == n_categorical
+    assert strategy.categorical_mask_[-n_categorical:].all()
+
+
+def test_hist_gradient_boosting_routes_missing_and_unseen_categories(housing):
+    X, y = housing
+    pipeline = HistGradientBoostingStrategy(max_iter=50).build_and_train_model(X, y)
+    column = X.select_dtypes(include=["object", "category"]).columns[0]
+    rows = X.head(3).astype({column: object})
+    rows.loc[rows.index[0], column] = None
+    rows.loc[rows.index[1], column] = "never seen"
+    encoded = pipeline[:-1].transform(rows)
+    # Numeric columns come first, then the ordinal-encoded categoricals
+    position = len(X.select_dtypes(exclude=["object", "category"]).columns)
+    assert np.isnan(encoded[:2, position]).all()
+    assert np.isfinite(pipeline.predict(rows)).all()
+
+
+def test_hist_gradient_boosting_beats_the_mean(housing):
+    X, y = housing
+    pipeline = HistGradientBoostingStrategy(max_iter=100).build_and_train_model(X[:1500], y[:1500])
+    mse = np.mean((pipeline.predict(X[1500:]) - y[1500:]) ** 2)
+    assert mse < np.mean((y[1500:] - y[:1500].mean()) ** 2)
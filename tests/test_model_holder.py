@@ -0,0 +1,95 @@
+import threading
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from src.model_holder import ModelHolder
+from src.model_signature import ModelSignature
+
+
+class ConstantModel:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def predict(self, X):
+        self.calls += 1
+        return np.full(len(X), self.value)
+
+
+class BlockingModel(ConstantModel):
+    """Blocks in predict until released, to keep a call in flight."""
+
+    def __init__(self, value):
+        super().__init__(value)
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def predict(self, X):
+        self.entered.set()
+        self.release.wait(5)
+        return super().predict(X)
+
+
+def _signature():
+    return ModelSignature(["area", "zone"], {"area": "float64", "zone": "object"}, {"zone": ["RL", "RM"]}, {"area": 1.0, "zone": "RL"})
+
+
+def test_reload_warms_up_and_swaps_in_the_new_model(tmp_path):
+    path = tmp_path / "model.joblib"
+    joblib.dump(ConstantModel(2.0), path)
+    versions = []
+    holder = ModelHolder(ConstantModel(1.0), version="v1", signature=_signature(), warmup_rounds=2)
+    holder.add_listener(versions.append)
+
+    assert holder.reload(str(path)) is True
+    assert holder.version == str(path) and versions == [str(path)]
+    # Two rounds of a batch and a single-row call before serving
+    assert holder.model.calls == 4
+    assert holder.predict(pd.DataFrame({"area": [1.0]})).tolist() == [2.0]
+    assert holder.reload(str(path)) is False
+    assert holder.metrics()["reloads"] == 1
+
+
+def test_calls_in_flight_finish_on_the_old_model():
+    old = BlockingModel(1.0)
+    holder = ModelHolder(old, version="v1", drain_timeout_s=5)
+    results = {}
+    caller = threading.Thread(target=lambda: results.setdefault("old", holder.predict(pd.DataFrame({"a": [0]}))))
+    caller.start()
+    assert old.entered.wait(5)
+
+    swapper = threading.Thread(target=holder.swap, args=(ConstantModel(2.0), "v2"))
+    swapper.start()
+    swapper.join(0.2)
+    # The swap has happened but waits for the running call to drain
+    assert swapper.is_alive()
+    assert holder.predict(pd.DataFrame({"a": [0]})).tolist() == [2.0]
+
+    old.release.set()
+    caller.join(5)
+    swapper.join(5)
+    assert results["old"].tolist() == [1.0]
+    assert not swapper.is_alive()
+
+
+def test_a_failed_reload_keeps_serving_the_current_model(tmp_path):
+    holder = ModelHolder(ConstantModel(1.0), version="v1")
+    holder.reload_async(str(tmp_path / "missing.pkl")).join(30)
+    assert holder.version == "v1"
+    assert holder.predict(pd.DataFrame({"a": [0]})).tolist() == [1.0]
+
+
+def test_watch_reloads_when_the_version_changes(tmp_path):
+    path = tmp_path / "model.joblib"
+    joblib.dump(ConstantModel(3.0), path)
+    holder = ModelHolder(ConstantModel(1.0), version="v1")
+    reloaded = threading.Event()
+    holder.add_listener(lambda version: reloaded.set())
+    holder.watch(lambda: str(path), interval_s=0.01)
+    try:
+        assert reloaded.wait(5)
+    finally:
+        holder.stop_watching()
+    assert holder.predict(pd.DataFrame({"a": [0]})).tolist() == [3.0]
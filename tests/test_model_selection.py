@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from sklearn.metrics import mean_squared_error
+from sklearn.model_selection import train_test_split
+
+from src.model_building import (
+    HistGradientBoostingStrategy,
+    LinearRegressionStrategy,
+    RidgeStrategy,
+    SuccessiveHalvingStrategy,
+)
+from src.model_selection import ParallelModelTrainer
+from src.synthetic_data import generate_housing_data
+
+
+@pytest.fixture(scope="module")
+def split():
+    df = generate_housing_data(1500, random_state=0)
+    return train_test_split(df.drop(columns=["price"]), df["price"], random_state=0)
+
+
+def test_trainer_ranks_every_strategy_on_the_validation_data(split):
+    X_train, X_val, y_train, y_val = split
+    strategies = {
+        "linear_regression": LinearRegressionStrategy(),
+        "ridge": RidgeStrategy(),
+        "hist_gradient_boosting": HistGradientBoostingStrategy(max_iter=50),
+    }
+    leaderboard, models = ParallelModelTrainer(strategies, max_workers=2).train(X_train, y_train, X_val, y_val)
+
+    assert set(leaderboard["strategy"]) == set(strategies) == set(models)
+    assert leaderboard["Mean Squared Error"].is_monotonic_increasing
+    for name, pipeline in models.items():
+        row = leaderboard.set_index("strategy").loc[name]
+        assert mean_squared_error(y_val, pipeline.predict(X_val)) == pytest.approx(row["Mean Squared Error"])
+
+
+def test_strategies_keep_their_own_preprocessing(split):
+    X_train, X_val, y_train, y_val = split
+    strategies = {"ridge": RidgeStrategy(), "hist_gradient_boosting": HistGradientBoostingStrategy(max_iter=20)}
+    _, models = ParallelModelTrainer(strategies, max_workers=2).train(X_train, y_train, X_val, y_val)
+
+    n_categorical = len(X_train.select_dtypes(include=["object", "category"]).columns)
+    gradient_boosting = models["hist_gradient_boosting"][-1]
+    # Native categoricals: one ordinal column per categorical instead of the one-hot expansion
+    assert gradient_boosting.n_features_in_ == X_train.shape[1]
+    assert gradient_boosting.is_categorical_.sum() == n_categorical
+    assert models["ridge"][-1].n_features_in_ > X_train.shape[1]
+
+
+def test_tuning_strategies_are_tuned_in_their_worker(split):
+    X_train, X_val, y_train, y_val = split
+    strategy = SuccessiveHalvingStrategy(n_candidates=3, time_budget_s=60)
+    _, models = ParallelModelTrainer({"random_forest_halving": strategy}).train(X_train, y_train, X_val, y_val)
+    params = models["random_forest_halving"][-1].get_params()
+    assert np.isfinite(models["random_forest_halving"].predict(X_val)).all()
+    # Refitted with a sampled candidate and the largest budget of the search
+    for name, values in SuccessiveHalvingStrategy.DEFAULT_PARAM_DISTRIBUTIONS.items():
+        assert params[name] in values
+    assert params["n_estimators"] == 300
+
+
+def test_trainer_requires_a_strategy():
+    with pytest.raises(ValueError):
+        ParallelModelTrainer({})
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.pipeline import Pipeline
+
+from src.model_building import RidgeStrategy
+from src.model_signature import ModelSignature
+from src.preprocessing_compiler import STEP_NAME, compile_preprocessing
+from src.synthetic_data import generate_housing_data
+
+
+@pytest.fixture(scope="module")
+def trained():
+    df = generate_housing_data(1000, random_state=0)
+    X, y = df.drop(columns=["price"]), df["price"]
+    step_preprocessing = compile_preprocessing(feature_engineering=[{"strategy": "log", "features": ["area"]}])
+    model = RidgeStrategy().build_and_train_model(step_preprocessing.fit_transform(X), y)
+    pipeline = Pipeline([(STEP_NAME, step_preprocessing)] + model.steps)
+    return X, pipeline, ModelSignature.from_training_data(X, pipeline)
+
+
+def test_signature_of_a_fused_pipeline_describes_raw_rows(trained):
+    X, pipeline, signature = trained
+    assert signature.columns == X.columns.tolist()
+    # The imputation constant of 'area' is mapped back from log space to raw values
+    log_mean = np.log1p(X["area"]).mean()
+    assert signature.fill_values["area"] == pytest.approx(np.expm1(log_mean))
+    categorical = X.select_dtypes(include=["object", "category"]).columns
+    for column in categorical:
+        assert set(signature.categories[column]) == set(X[column].dropna())
+
+
+def test_coerce_reorders_parses_and_fills(trained):
+    X, pipeline, signature = trained
+    rows = X.head(3)[X.columns[::-1]].astype(object).assign(price=1.0)
+    rows.loc[rows.index[0], "area"] = None
+    rows.loc[rows.index[1], "area"] = "1200"
+    coerced = signature.coerce(rows)
+    assert coerced.columns.tolist() == signature.columns
+    assert coerced["area"].tolist()[:2] == [signature.fill_values["area"], 1200.0]
+    # Filling at the edge predicts what the model's own imputation would have
+    missing_area = X.head(1).assign(area=np.nan)
+    np.testing.assert_allclose(pipeline.predict(coerced.head(1)), pipeline.predict(missing_area), rtol=1e-6)
+
+
+def test_coerce_rejects_missing_columns_and_unparsable_numbers(trained):
+    X, _, signature = trained
+    with pytest.raises(ValueError, match="missing columns"):
+        signature.coerce(X.drop(columns=["area"]).head())
+    rows = X.head(2).astype({"area": object})
+    rows.loc[rows.index[0], "area"] = "large"
+    with pytest.raises(ValueError, match="Non-numeric"):
+        signature.coerce(rows)
+
+
+def test_coerce_does_not_copy_clean_numeric_columns(trained):
+    X, _, signature = trained
+    coerced = signature.coerce(X)
+    numeric = [c for c in signature.columns if c not in signature.categories][0]
+    assert np.shares_memory(coerced[numeric].to_numpy(), X[numeric].to_numpy())
+
+
+def test_signature_round_trips_through_json(tmp_path, trained):
+    X, pipeline, signature = trained
+    path = tmp_path / "model_signature.json"
+    signature.save(str(path))
+    loaded = ModelSignature.load(str(path))
+    assert loaded.to_dict() == ModelSignature.from_dict(signature.to_dict()).to_dict()
+    assert ModelSignature.load(str(path)) is loaded
+
+
+def test_example_frame_scores(trained):
+    _, pipeline, signature = trained
+    frame = signature.example_frame(16)
+    assert frame.columns.tolist() == signature.columns and len(frame) == 16
+    assert np.isfinite(pipeline.predict(frame)).all()
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from scipy import stats
+from sklearn.metrics import mean_squared_error, r2_score
+
+from src.out_of_core import OutOfCoreTrainer, StreamingRegressionMetrics, StreamingZScoreFilter, estimate_chunksize
+from src.synthetic_data import generate_housing_data
+
+
+@pytest.fixture(scope="module")
+def housing():
+    return generate_housing_data(3000, random_state=0)
+
+
+def test_streaming_zscore_filter_matches_scipy(housing):
+    z_filter = StreamingZScoreFilter(threshold=3)
+    for start in range(0, len(housing), 700):
+        z_filter.update(housing.iloc[start:start + 700])
+
+    numeric = housing.select_dtypes(include=[int, float])
+    expected = ~(np.abs(np.asarray(stats.zscore(numeric))) > 3).any(axis=1)
+    assert (~expected).sum() > 0
+    np.testing.assert_array_equal(z_filter.keep_mask(housing), expected)
+
+
+def test_columns_with_missing_values_flag_nothing(housing):
+    z_filter = StreamingZScoreFilter(threshold=3)
+    z_filter.update(housing[["area"]].assign(area=housing["area"].where(housing.index != 5)))
+    assert z_filter.keep_mask(housing[["area"]].assign(area=1e12)).all()
+
+
+def test_streaming_metrics_match_sklearn():
+    rng = np.random.default_rng(0)
+    y_true, y_pred = rng.normal(5, 2, 1000), rng.normal(5, 2, 1000)
+    metrics = StreamingRegressionMetrics()
+    for start in range(0, 1000, 333):
+        metrics.update(y_true[start:start + 333], y_pred[start:start + 333])
+
+    result = metrics.metrics()
+    assert result["Mean Squared Error"] == pytest.approx(mean_squared_error(y_true, y_pred))
+    assert result["R-Squared"] == pytest.approx(r2_score(y_true, y_pred))
+
+
+def test_trainer_streams_every_stage_of_the_pipeline(tmp_path, housing):
+    path = tmp_path / "housing.csv"
+    housing.to_csv(path, index=False)
+    trainer = OutOfCoreTrainer(
+        str(path),
+        chunksize=500,
+        missing_values={"strategy": "mean"},
+        feature_engineering=[{"strategy": "log", "features": ["area"]}],
+        n_epochs=3,
+    ).fit()
+
+    # The mean fill takes one statistics pass, the log transformation none
+    assert [p["pass"] for p in trainer.passes_] == [
+        "outlier statistics", "step preprocessing statistics", "model preprocessor statistics",
+        "training epoch 1", "training epoch 2", "training epoch 3", "evaluation",
+    ]
+    assert trainer.passes_[0]["rows"] == len(housing)
+    train_rows, test_rows = trainer.passes_[3]["rows"], trainer.passes_[-1]["rows"]
+    assert train_rows + test_rows == trainer.outliers_.keep_mask(housing).sum()
+    assert test_rows == pytest.approx(0.2 * (train_rows + test_rows), rel=0.15)
+
+    assert trainer.metrics_["R-Squared"] > 0.5
+    X = housing.drop(columns="price").iloc[:10]
+    assert trainer.pipeline_.predict(X).shape == (10,)
+    assert trainer.signature_.categories["furnishingstatus"] == sorted(housing["furnishingstatus"].unique())
+
+
+def test_chunksize_follows_the_memory_limit(tmp_path, housing):
+    path = tmp_path / "housing.csv"
+    housing.to_csv(path, index=False)
+    assert estimate_chunksize(str(path), 200) > estimate_chunksize(str(path), 100)
+    with pytest.raises(ValueError):
+        estimate_chunksize(str(path), 0.01)
@@ -0,0 +1,124 @@
+import mmap
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.payload_codec import (
+    MAGIC,
+    decode_frame,
+    decode_json,
+    decode_payload,
+    encode_frame,
+    encode_json,
+    encode_payload,
+)
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {
+            "area": np.array([1200.5, np.nan, 800.0]),
+            "rooms": np.array([3, 4, 2], dtype=np.int32),
+            "listed": np.array([True, False, True]),
+            "zone": pd.Series(["RL", None, "RM"], dtype=object),
+            "street": pd.Series(["Pave", "Grvl", "Pave"], dtype=object),
+        }
+    )
+
+
+def test_binary_round_trip_keeps_values_and_dtypes(frame):
+    decoded = decode_frame(encode_frame(frame))
+    assert decoded.columns.tolist() == frame.columns.tolist()
+    for column in ("area", "rooms", "listed"):
+        pd.testing.assert_series_equal(decoded[column], frame[column])
+    # Text columns come back as object arrays, which pandas may infer as its string dtype
+    for column in ("zone", "street"):
+        assert decoded[column].astype(object).where(decoded[column].notna(), None).tolist() == frame[column].tolist()
+
+
+def test_buffers_are_aligned_and_decoded_without_copy(frame):
+    payload = encode_frame(frame)
+    assert payload[:4] == MAGIC
+    decoded = decode_frame(payload)
+    area = decoded["area"].to_numpy()
+    # A read-only view on the payload buffer, 8-byte aligned
+    assert not area.flags.writeable
+    assert area.ctypes.data % 8 == 0
+
+
+def test_memory_mapped_payload(tmp_path, frame):
+    path = tmp_path / "frame.bin"
+    path.write_bytes(encode_frame(frame))
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        decoded = decode_frame(buffer)
+        np.testing.assert_array_equal(decoded["rooms"], frame["rooms"])
+        del decoded
+
+
+def test_categorical_decoding_keeps_codes(frame):
+    decoded = decode_frame(encode_frame(frame), categorical=True)
+    assert isinstance(decoded["zone"].dtype, pd.CategoricalDtype)
+    assert decoded["zone"].isna().tolist() == [False, True, False]
+    assert decoded["zone"].astype(object).where(decoded["zone"].notna(), None).tolist() == ["RL", None, "RM"]
+
+
+def test_small_vocabularies_use_narrow_codes():
+    wide = pd.DataFrame({"id": pd.Series([f"id{i}" for i in range(300)], dtype=object)})
+    narrow = pd.DataFrame({"id": pd.Series(["a", "b"] * 150, dtype=object)})
+    assert len(encode_frame(narrow)) < len(encode_frame(wide))
+    pd.testing.assert_frame_equal(decode_frame(encode_frame(wide)), wide, check_dtype=False)
+
+
+def test_nullable_extension_dtypes():
+    frame = pd.DataFrame(
+        {
+            "with_missing": pd.array([1, None, 3], dtype="Int64"),
+            "complete": pd.array([1, 2, 3], dtype="Int64"),
+            "flag": pd.array([True, None, False], dtype="boolean"),
+            "flag_complete": pd.array([True, True, False], dtype="boolean"),
+            "ratio": pd.array([0.5, None, 2.0], dtype="Float64"),
+            "small": pd.array([1, 2, 3], dtype="UInt8"),
+            "zone": pd.array(["RL", None, "RM"], dtype="string"),
+        }
+    )
+    decoded = decode_frame(encode_frame(frame))
+    # Complete columns keep their numpy dtype, missing values come back as NaN in float64
+    assert decoded["complete"].dtype == np.int64 and decoded["small"].dtype == np.uint8
+    assert decoded["flag_complete"].dtype == bool
+    np.testing.assert_array_equal(decoded["with_missing"], [1.0, np.nan, 3.0])
+    np.testing.assert_array_equal(decoded["flag"], [1.0, np.nan, 0.0])
+    np.testing.assert_array_equal(decoded["ratio"], [0.5, np.nan, 2.0])
+    assert decoded["zone"].isna().tolist() == [False, True, False]
+
+
+def test_rejects_foreign_and_future_payloads(frame):
+    with pytest.raises(ValueError, match="Not a binary"):
+        decode_frame(b"XXXX" + encode_frame(frame)[4:])
+    payload = bytearray(encode_frame(frame))
+    payload[4] = 99
+    with pytest.raises(ValueError, match="version"):
+        decode_frame(bytes(payload))
+
+
+def test_json_round_trip_and_records(frame):
+    decoded = decode_json(encode_json(frame))
+    assert decoded.columns.tolist() == frame.columns.tolist()
+    assert decoded["zone"].tolist()[0] == "RL" and decoded["rooms"].tolist() == [3, 4, 2]
+    records = decode_json(b'[{"area": 1.0, "zone": "RL"}, {"area": 2.0, "zone": null}]')
+    assert records["area"].tolist() == [1.0, 2.0]
+
+
+@pytest.mark.parametrize("payload_format", ["binary", "json", "arrow"])
+def test_decode_payload_detects_the_format(frame, payload_format):
+    if payload_format == "arrow":
+        pytest.importorskip("pyarrow")
+    decoded = decode_payload(encode_payload(frame, payload_format))
+    assert decoded.columns.tolist() == frame.columns.tolist()
+    np.testing.assert_allclose(decoded["area"].astype(float), frame["area"])
+
+
+def test_unknown_payload_format(frame):
+    with pytest.raises(ValueError):
+        encode_payload(frame, "xml")
@@ -0,0 +1,228 @@
+import pickle
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LinearRegression, Ridge
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder, StandardScaler
+
+from src.model_building import RidgeStrategy, build_preprocessor
+from src.pipeline_compiler import CompiledPipeline, compile_pipeline, compile_preprocessor
+from src.preprocessing_compiler import STEP_NAME, compile_preprocessing
+from src.synthetic_data import generate_housing_data
+
+
+@pytest.fixture(scope="module")
+def housing():
+    df = generate_housing_data(2000, random_state=0)
+    X, y = df.drop(columns=["price"]), df["price"]
+    categorical = X.select_dtypes(include=["object", "category"]).columns
+    X = X.astype({column: object for column in categorical})
+    X.loc[X.index[::13], "area"] = np.nan
+    X.loc[X.index[::17], categorical[0]] = None
+    return X, y
+
+
+def _with_unseen_category(X):
+    X = X.copy()
+    column = X.select_dtypes(include=["object"]).columns[0]
+    X.loc[X.index[:5], column] = "never seen"
+    return X
+
+
+def _model_building_step_pipeline(model):
+    return Pipeline(
+        [
+            (
+                "preprocessor",
+                ColumnTransformer(
+                    [
+                        ("num", SimpleImputer(strategy="mean"), make_numeric_selector()),
+                        (
+                            "cat",
+                            Pipeline(
+                                [
+                                    ("imputer", SimpleImputer(strategy="most_frequent")),
+                                    ("onehot", OneHotEncoder(handle_unknown="ignore")),
+                                ]
+                            ),
+                            make_categorical_selector(),
+                        ),
+                    ]
+                ),
+            ),
+            ("model", model),
+        ]
+    )
+
+
+def make_numeric_selector():
+    from sklearn.compose import make_column_selector
+
+    return make_column_selector(dtype_exclude=object)
+
+
+def make_categorical_selector():
+    from sklearn.compose import make_column_selector
+
+    return make_column_selector(dtype_include=object)
+
+
+@pytest.mark.parametrize("model", [LinearRegression(), RandomForestRegressor(n_estimators=10, random_state=0)])
+def test_compiled_pipeline_matches_sklearn(housing, model):
+    X, y = housing
+    pipeline = _model_building_step_pipeline(model).fit(X, y)
+    X_check = _with_unseen_category(X)
+    compiled = compile_pipeline(pipeline, X_validation=X_check)
+    np.testing.assert_allclose(compiled.predict(X_check), pipeline.predict(X_check), rtol=1e-9)
+
+
+def test_predict_row_matches_sklearn(housing):
+    X, y = housing
+    pipeline = RidgeStrategy().build_and_train_model(X, y)
+    compiled = compile_pipeline(pipeline)
+    X_check = _with_unseen_category(X)
+    for position in (0, 13, 17, 100):
+        row = X_check.iloc[position].to_dict()
+        expected = pipeline.predict(X_check.iloc[[position]])[0]
+        assert compiled.predict_row(row) == pytest.approx(expected, rel=1e-9)
+
+
+def test_compiled_preprocessor_matches_the_dense_matrix(housing):
+    X, _ = housing
+    preprocessor = build_preprocessor(X, dense=True).fit(X)
+    X_check = _with_unseen_category(X)
+    np.testing.assert_allclose(compile_preprocessor(preprocessor).transform(X_check), preprocessor.transform(X_check))
+
+
+def test_fused_step_preprocessing_is_folded_in(housing):
+    X, y = housing
+    step_preprocessing = compile_preprocessing({"strategy": "mean"}, [{"strategy": "log", "features": ["area"]}])
+    X_model = step_preprocessing.fit_transform(X)
+    model_pipeline = RidgeStrategy().build_and_train_model(X_model, y)
+    pipeline = Pipeline([(STEP_NAME, step_preprocessing)] + model_pipeline.steps)
+    compiled = compile_pipeline(pipeline, X_validation=X)
+    row = X.iloc[13].to_dict()
+    assert compiled.predict_row(row) == pytest.approx(pipeline.predict(X.iloc[[13]])[0], rel=1e-9)
+
+
+def test_linear_compiled_pipeline_unpickles_with_numpy_only(housing):
+    X, y = housing
+    compiled = compile_pipeline(RidgeStrategy().build_and_train_model(X, y))
+    restored = pickle.loads(pickle.dumps(compiled))
+    assert restored.model is None
+    np.testing.assert_array_equal(restored.predict(X), compiled.predict(X))
+
+
+def test_imputer_dropped_columns_keep_the_widths_aligned():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(
+        {
+            "a": rng.random(200),
+            "empty": np.nan,
+            "b": rng.random(200),
+            "zone": pd.Series(rng.choice(["x", "y"], 200), dtype=object),
+            "empty_zone": pd.Series([np.nan] * 200, dtype=object),
+        }
+    )
+    y = X["a"] * 3 + (X["zone"] == "x")
+    pipeline = Pipeline(
+        [
+            (
+                "preprocessor",
+                ColumnTransformer(
+                    [
+                        ("num", Pipeline([("imputer", SimpleImputer()), ("scaler", StandardScaler())]), ["a", "empty", "b"]),
+                        (
+                            "cat",
+                            Pipeline(
+                                [
+                                    ("imputer", SimpleImputer(strategy="most_frequent")),
+                                    ("onehot", OneHotEncoder(handle_unknown="ignore")),
+                                ]
+                            ),
+                            ["zone", "empty_zone"],
+                        ),
+                    ]
+                ),
+            ),
+            ("model", Ridge()),
+        ]
+    )
+    with warnings.catch_warnings():
+        # SimpleImputer warns that it skips the all-missing columns
+        warnings.simplefilter("ignore", UserWarning)
+        pipeline.fit(X, y)
+        compiled = compile_pipeline(pipeline, X_validation=X)
+    assert [block["columns"] for block in compiled.blocks] == [["a", "b"], ["zone"]]
+
+
+def test_category_codes_handle_empty_vocabularies_and_mixed_types():
+    empty = {"vocabulary": np.array([], dtype=object), "fill_value": None, "fill_code": -1}
+    values = np.array(["x", None, 3], dtype=object)
+    np.testing.assert_array_equal(CompiledPipeline._codes(empty, values), [-1, -1, -1])
+
+    mixed = {"vocabulary": np.array(["b", 1, 2.5, "a"], dtype=object), "fill_value": "a", "fill_code": 3}
+    values = np.array([1, "a", 2.5, "zz", 7, np.nan], dtype=object)
+    np.testing.assert_array_equal(CompiledPipeline._codes(mixed, values), [1, 3, 2, -1, -1, 3])
+
+
+def test_category_codes_tell_none_from_nan():
+    # OneHotEncoder fitted without an imputer keeps None and NaN as separate trailing categories
+    block = {"vocabulary": np.array(["a", None, np.nan], dtype=object), "fill_value": None, "fill_code": -1}
+    values = np.array([np.nan, None, "a", "b"], dtype=object)
+    np.testing.assert_array_equal(CompiledPipeline._codes(block, values), [2, 1, 0, -1])
+    # A most-frequent imputer fills NaN only; the fused step preprocessing fills None as well
+    block.update({"fill_value": "a", "fill_code": 0})
+    np.testing.assert_array_equal(CompiledPipeline._codes(block, values), [0, 1, 0, -1])
+    block["fills_none"] = True
+    np.testing.assert_array_equal(CompiledPipeline._codes(block, values), [0, 0, 0, -1])
+
+
+def test_none_and_nan_categories_without_an_imputer_match_sklearn():
+    rng = np.random.default_rng(0)
+    zone = pd.Series(rng.choice(np.array(["x", "y", None, np.nan], dtype=object), 300), dtype=object)
+    X = pd.DataFrame({"area": rng.random(300), "zone": zone})
+    y = X["area"] + X["zone"].map({"x": 1.0, "y": 2.0}).fillna(0) + X["zone"].isna() * X["zone"].map(type).eq(float) * 5
+    pipeline = Pipeline(
+        [
+            ("preprocessor", ColumnTransformer([("num", "passthrough", ["area"]), ("cat", OneHotEncoder(handle_unknown="ignore"), ["zone"])])),
+            ("model", LinearRegression()),
+        ]
+    ).fit(X, y)
+    compiled = compile_pipeline(pipeline, X_validation=X)
+    for position in range(12):
+        row = X.iloc[position].to_dict()
+        assert compiled.predict_row(row) == pytest.approx(pipeline.predict(X.iloc[[position]])[0], rel=1e-9)
+
+
+def test_fused_mode_fill_replaces_none_and_nan(housing):
+    X, y = housing
+    X = X.copy()
+    column = X.select_dtypes(include=["object"]).columns[0]
+    X.loc[X.index[1::19], column] = np.nan
+    step_preprocessing = compile_preprocessing({"strategy": "mode"})
+    model_pipeline = RidgeStrategy().build_and_train_model(step_preprocessing.fit_transform(X), y)
+    pipeline = Pipeline([(STEP_NAME, step_preprocessing)] + model_pipeline.steps)
+    compiled = compile_pipeline(pipeline, X_validation=X)
+    for position in (1, 17, 20):
+        row = X.iloc[position].to_dict()
+        assert compiled.predict_row(row) == pytest.approx(pipeline.predict(X.iloc[[position]])[0], rel=1e-9)
+
+
+def test_unsupported_transformers_are_rejected(housing):
+    X, y = housing
+    numeric = X.select_dtypes(exclude=["object"]).columns
+    pipeline = Pipeline(
+        [
+            ("preprocessor", ColumnTransformer([("num", OrdinalEncoder(), numeric)])),
+            ("model", LinearRegression()),
+        ]
+    ).fit(X.fillna(0), y)
+    with pytest.raises(NotImplementedError):
+        compile_pipeline(pipeline)
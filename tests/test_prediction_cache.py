@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.prediction_cache import PredictionCache
+
+
+class CountingModel:
+    def __init__(self, offset=0.0):
+        self.offset = offset
+        self.rows = 0
+
+    def predict(self, df):
+        self.rows += len(df)
+        return df["area"].to_numpy(dtype=np.float64) * 2 + self.offset
+
+
+def _rows(areas, zones=None):
+    zones = zones or ["RL"] * len(areas)
+    return pd.DataFrame({"area": areas, "zone": pd.Series(zones, dtype=object)})
+
+
+def test_only_missed_rows_are_scored():
+    cache, model = PredictionCache(columns=["area", "zone"]), CountingModel()
+    first = cache.predict(_rows([1.0, 2.0]), model.predict)
+    second = cache.predict(_rows([2.0, 3.0, 1.0]), model.predict)
+    np.testing.assert_array_equal(first, [2.0, 4.0])
+    np.testing.assert_array_equal(second, [4.0, 6.0, 2.0])
+    assert model.rows == 3
+    assert (cache.hits, cache.misses) == (2, 3)
+    assert cache.hit_rate == pytest.approx(0.4)
+
+
+def test_equivalent_rows_share_a_key():
+    cache = PredictionCache(columns=["area", "zone"])
+    integers = pd.DataFrame({"zone": pd.Series(["RL", None], dtype=object), "area": [3, 4], "extra": [0, 1]})
+    floats = pd.DataFrame({"area": [3.0, 4.0], "zone": pd.Series(["RL", np.nan], dtype=object)})
+    np.testing.assert_array_equal(cache.keys(integers), cache.keys(floats))
+    assert cache.keys(_rows([3.0], ["RM"]))[0] != cache.keys(floats)[0]
+
+
+def test_least_recently_used_rows_are_evicted():
+    cache, model = PredictionCache(columns=["area", "zone"], max_entries=2), CountingModel()
+    cache.predict(_rows([1.0, 2.0]), model.predict)
+    cache.predict(_rows([1.0]), model.predict)
+    cache.predict(_rows([3.0]), model.predict)
+    assert cache.metrics()["entries"] == 2
+    cache.predict(_rows([2.0]), model.predict)
+    assert cache.misses == 4
+
+
+def test_entries_expire(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("src.prediction_cache.time.monotonic", lambda: clock[0])
+    cache, model = PredictionCache(columns=["area", "zone"], ttl_s=10), CountingModel()
+    cache.predict(_rows([1.0]), model.predict)
+    clock[0] += 5
+    cache.predict(_rows([1.0]), model.predict)
+    clock[0] += 6
+    cache.predict(_rows([1.0]), model.predict)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_a_new_model_version_clears_the_cache():
+    version = ["v1"]
+    cache = PredictionCache(columns=["area", "zone"], version_fn=lambda: version[0], version_check_interval_s=0)
+    cache.predict(_rows([1.0]), CountingModel().predict)
+    version[0] = "v2"
+    predictions = cache.predict(_rows([1.0]), CountingModel(offset=100).predict)
+    np.testing.assert_array_equal(predictions, [102.0])
+    assert cache.invalidations == 1 and cache.metrics()["model_version"] == "v2"
+
+
+def test_results_of_a_swapped_out_model_are_not_stored():
+    cache = PredictionCache(columns=["area", "zone"])
+    cache.set_model_version("v1")
+    keys, _, missing = cache.lookup(_rows([1.0]))
+    cache.set_model_version("v2")
+    cache.store(keys[missing], np.array([2.0]), model_version="v1")
+    assert cache.metrics()["entries"] == 0
+
+
+def test_latency_saved_is_estimated_from_missed_rows():
+    cache = PredictionCache(columns=["area", "zone"])
+    keys, _, _ = cache.lookup(_rows([1.0, 2.0]))
+    cache.store(keys, np.array([2.0, 4.0]), seconds=0.5)
+    cache.lookup(_rows([1.0, 2.0, 1.0]))
+    assert cache.latency_saved_s == pytest.approx(3 * 0.25)
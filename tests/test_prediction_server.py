@@ -0,0 +1,93 @@
+import asyncio
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.prediction_server import Histogram, MicroBatcher
+
+
+class RecordingModel:
+    """Doubles column 'a'; records every batch and rejects negative values."""
+
+    def __init__(self):
+        self.batches = []
+        self.threads = set()
+
+    def predict(self, df: pd.DataFrame) -> np.ndarray:
+        self.batches.append(len(df))
+        self.threads.add(threading.get_ident())
+        if (df["a"] < 0).any():
+            raise ValueError("negative value")
+        return df["a"].to_numpy() * 2.0
+
+
+def _run(coroutine_function, *args):
+    return asyncio.run(coroutine_function(*args))
+
+
+async def _predict_all(batcher, frames):
+    try:
+        return await asyncio.gather(*(batcher.predict(frame) for frame in frames), return_exceptions=True)
+    finally:
+        await batcher.stop()
+
+
+def _frames(values):
+    return [pd.DataFrame({"a": [float(value)]}) for value in values]
+
+
+def test_concurrent_requests_share_one_predict_call():
+    model = RecordingModel()
+    batcher = MicroBatcher(model.predict, max_batch_size=64, max_wait_ms=50)
+    results = _run(_predict_all, batcher, _frames(range(10)))
+    assert [result.tolist() for result in results] == [[2.0 * value] for value in range(10)]
+    assert model.batches == [10]
+    assert batcher.batch_sizes.snapshot()["count"] == 1
+    # The event loop never runs the model itself
+    assert threading.get_ident() not in model.threads
+
+
+def test_batches_are_capped_at_max_batch_size():
+    model = RecordingModel()
+    batcher = MicroBatcher(model.predict, max_batch_size=4, max_wait_ms=50)
+    frames = _frames(range(10)) + [pd.DataFrame({"a": np.arange(6.0)})]
+    results = _run(_predict_all, batcher, frames)
+    assert results[-1].tolist() == (np.arange(6.0) * 2).tolist()
+    # A request larger than the cap is scored alone, never split
+    assert model.batches == [4, 4, 2, 6]
+    assert sum(model.batches) == 16
+
+
+def test_a_failing_request_fails_only_itself():
+    model = RecordingModel()
+    batcher = MicroBatcher(model.predict, max_wait_ms=50)
+    results = _run(_predict_all, batcher, _frames([1, -1, 3]))
+    assert results[0].tolist() == [2.0] and results[2].tolist() == [6.0]
+    assert isinstance(results[1], ValueError)
+
+
+def test_frames_with_other_columns_are_not_mixed():
+    model = RecordingModel()
+    batcher = MicroBatcher(model.predict, max_wait_ms=50)
+    frames = [pd.DataFrame({"a": [1.0]}), pd.DataFrame({"a": [2.0], "b": [0]}), pd.DataFrame({"a": [3.0]})]
+    results = _run(_predict_all, batcher, frames)
+    assert [result.tolist() for result in results] == [[2.0], [4.0], [6.0]]
+    assert sorted(model.batches) == [1, 2]
+
+
+def test_rejects_an_empty_batch_size():
+    with pytest.raises(ValueError):
+        MicroBatcher(lambda df: df, max_batch_size=0)
+
+
+def test_histogram_buckets_and_percentiles():
+    histogram = Histogram([1, 10], window=3)
+    for value in (0.5, 5, 50, 7):
+        histogram.observe(value)
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"1": 1, "10": 2, "inf": 1}
+    assert snapshot["count"] == 4 and snapshot["mean"] == pytest.approx(62.5 / 4)
+    # Percentiles only cover the most recent window
+    assert histogram.percentile(50) == 7
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from src.preprocessing_cache import PreprocessingCache
+
+
+def _frame(seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({"area": rng.random(100), "rooms": rng.integers(1, 8, 100)})
+
+
+def test_fit_transform_hit_returns_the_cached_result():
+    cache = PreprocessingCache()
+    X = _frame()
+    transformer = StandardScaler()
+    fitted, matrix = cache.fit_transform(transformer, X)
+    fitted_again, matrix_again = cache.fit_transform(StandardScaler(), X.copy())
+    assert fitted_again is fitted and matrix_again is matrix
+    assert (cache.hits, cache.misses) == (1, 1)
+    np.testing.assert_allclose(matrix, StandardScaler().fit_transform(X))
+    # The transformer passed in is cloned, never fitted in place
+    assert not hasattr(transformer, "mean_")
+
+
+def test_key_changes_with_data_parameters_and_dtypes():
+    cache = PreprocessingCache()
+    X = _frame()
+    cache.fit_transform(StandardScaler(), X)
+    changed = X.copy()
+    changed.loc[0, "area"] += 1.0
+    cache.fit_transform(StandardScaler(), changed)
+    cache.fit_transform(StandardScaler(with_mean=False), X)
+    cache.fit_transform(StandardScaler(), X.astype({"rooms": "float64"}))
+    assert (cache.hits, cache.misses) == (0, 4)
+
+
+def test_fingerprint_depends_on_the_index():
+    X = _frame()
+    assert PreprocessingCache.fingerprint(X) == PreprocessingCache.fingerprint(X.copy())
+    assert PreprocessingCache.fingerprint(X) != PreprocessingCache.fingerprint(X.set_axis(X.index + 1))
+
+
+def test_transform_is_cached_separately_from_fit_transform():
+    cache = PreprocessingCache()
+    X_train, X_test = _frame(0), _frame(1)
+    fitted, _ = cache.fit_transform(StandardScaler(), X_train)
+    first = cache.transform(fitted, X_test)
+    assert cache.transform(fitted, X_test) is first
+    np.testing.assert_allclose(first, fitted.transform(X_test))
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = PreprocessingCache(max_entries=2)
+    frames = [_frame(seed) for seed in range(3)]
+    cache.fit_transform(StandardScaler(), frames[0])
+    cache.fit_transform(StandardScaler(), frames[1])
+    cache.fit_transform(StandardScaler(), frames[0])
+    cache.fit_transform(StandardScaler(), frames[2])
+    assert cache.misses == 3
+    cache.fit_transform(StandardScaler(), frames[0])
+    assert cache.hits == 2
+    cache.fit_transform(StandardScaler(), frames[1])
+    assert cache.misses == 4
+
+
+def test_cache_dir_is_shared_across_instances(tmp_path):
+    X = _frame()
+    _, matrix = PreprocessingCache(cache_dir=str(tmp_path)).fit_transform(StandardScaler(), X)
+    other = PreprocessingCache(cache_dir=str(tmp_path))
+    fitted, cached = other.fit_transform(StandardScaler(), X)
+    assert other.hits == 1
+    np.testing.assert_array_equal(cached, matrix)
+    np.testing.assert_allclose(fitted.mean_, X.mean().to_numpy())
+    assert not list(tmp_path.glob("*.tmp"))
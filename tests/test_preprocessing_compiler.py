@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.feature_engineering import make_feature_strategy
+from src.handle_missing_values import make_missing_value_strategy
+from src.preprocessing_compiler import compile_preprocessing
+from src.synthetic_data import generate_housing_data
+
+FEATURE_ENGINEERING = [
+    {"strategy": "log", "features": ["area"]},
+    {"strategy": "standard_scaling", "features": ["bedrooms", "bathrooms"]},
+    {"strategy": "minmax_scaling", "features": ["parking"]},
+    {"strategy": "onehot_encoding", "features": ["furnishingstatus", "mainroad"]},
+]
+
+
+@pytest.fixture
+def X():
+    X = generate_housing_data(500, random_state=0).drop(columns="price")
+    rng = np.random.default_rng(0)
+    for column in ("area", "bedrooms"):
+        X[column] = X[column].mask(rng.random(len(X)) < 0.05)
+    return X
+
+
+def _run_steps(X, missing_values, feature_engineering):
+    """What handle_missing_values_step and the feature_engineering_steps do, one after another."""
+    X = make_missing_value_strategy(**missing_values).handle(X)
+    for params in feature_engineering:
+        X = make_feature_strategy(**params).apply_transformation(X)
+    return X
+
+
+@pytest.mark.parametrize("method", ["mean", "median", "mode"])
+def test_fused_transform_matches_the_pipeline_steps(X, method):
+    missing_values = {"strategy": method}
+    fused = compile_preprocessing(missing_values, FEATURE_ENGINEERING).fit_transform(X)
+    expected = _run_steps(X, missing_values, FEATURE_ENGINEERING)
+
+    pd.testing.assert_frame_equal(fused.reset_index(drop=True), expected, check_dtype=False)
+
+
+def test_transform_replays_the_fitted_constants(X):
+    preprocessor = compile_preprocessing({"strategy": "mean"}, FEATURE_ENGINEERING).fit(X)
+    rows = X.iloc[:2].assign(area=np.nan, furnishingstatus=["unseen", None])
+    out = preprocessor.transform(rows)
+
+    assert out.columns.tolist() == preprocessor.get_feature_names_out().tolist()
+    assert out["area"].tolist() == pytest.approx([np.log1p(X["area"].mean())] * 2)
+    # Unknown and missing categories encode as all zeros
+    assert not out.filter(like="furnishingstatus_").to_numpy().any()
+
+
+def test_training_row_mask_matches_dropna(X):
+    assert X[compile_preprocessing({"strategy": "drop"}).training_row_mask(X)].index.equals(X.dropna().index)
+    mask = compile_preprocessing({"strategy": "drop", "thresh": 11}).training_row_mask(X)
+    assert X[mask].index.equals(X.dropna(thresh=11).index)
+
+
+def test_column_drops_are_fitted_once(X):
+    preprocessor = compile_preprocessing({"strategy": "drop", "axis": 1}).fit(X)
+    kept = X.dropna(axis=1).columns.tolist()
+
+    assert preprocessor.get_feature_names_out().tolist() == kept
+    # Columns that happen to be complete at inference are dropped all the same
+    assert preprocessor.transform(X.dropna().iloc[:5]).columns.tolist() == kept
+
+
+@pytest.mark.parametrize("missing_values", [{"strategy": "mean"}, {"strategy": "median"}, {"strategy": "mode"},
+                                            {"strategy": "drop", "axis": 1, "thresh": 490}])
+def test_fit_chunks_matches_fit_on_the_whole_frame(X, missing_values):
+    def chunks():
+        return (X.iloc[start:start + 64] for start in range(0, len(X), 64))
+
+    # The column drop removes area and bedrooms, so they are not transformed afterwards
+    feature_engineering = FEATURE_ENGINEERING if missing_values["strategy"] != "drop" else FEATURE_ENGINEERING[2:]
+    streamed = compile_preprocessing(missing_values, feature_engineering).fit_chunks(chunks, sample_size=len(X))
+    fitted = compile_preprocessing(missing_values, feature_engineering).fit(X)
+
+    pd.testing.assert_frame_equal(streamed.transform(X), fitted.transform(X), rtol=1e-9)
+
+
+def test_transforms_of_missing_features_are_rejected(X):
+    with pytest.raises(ValueError, match="not model inputs"):
+        compile_preprocessing(feature_engineering={"strategy": "log", "features": ["price"]}).fit(X)
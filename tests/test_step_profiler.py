@@ -0,0 +1,94 @@
+import inspect
+import json
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.step_profiler import StepProfiler
+
+
+def load_step(rows: int = 10) -> pd.DataFrame:
+    return pd.DataFrame({"a": np.arange(rows)})
+
+
+def allocating_step(n: int) -> int:
+    blocks = [bytearray(1_000) for _ in range(n)]
+    return len(blocks)
+
+
+def test_disabled_profiler_only_calls_the_step():
+    profiler = StepProfiler(enabled=False)
+    wrapped = profiler.profile(load_step)
+
+    assert len(wrapped(rows=3)) == 3
+    assert profiler.records == []
+    # ZenML reads the step's signature through the wrapper
+    assert inspect.signature(wrapped) == inspect.signature(load_step)
+
+
+def test_record_describes_the_step_run():
+    profiler = StepProfiler(enabled=True, trace_allocations=True)
+    profiler.profile(load_step)(25)
+    profiler.profile(allocating_step)(n=2_000)
+
+    load, allocate = profiler.records
+    assert load["step"] == "load_step" and load["wall_s"] >= 0 and load["cpu_s"] >= 0
+    assert load["inputs"] == {"rows": {"type": "int"}}
+    assert load["output"] == {"type": "DataFrame", "shape": [25, 1]}
+    assert allocate["python_alloc_peak_bytes"] >= 2_000_000
+    assert allocate["concurrent_steps"] == []
+
+
+def test_overlapping_steps_report_each_other_and_no_allocation_peak():
+    profiler = StepProfiler(enabled=True, trace_allocations=True)
+    first_started, second_done = threading.Event(), threading.Event()
+
+    def first():
+        first_started.set()
+        second_done.wait(5)
+
+    def second():
+        first_started.wait(5)
+        second_done.set()
+
+    threads = [threading.Thread(target=profiler.profile(step)) for step in (first, second)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    records = {record["step"]: record for record in profiler.records}
+    assert records["first"]["concurrent_steps"] == ["second"]
+    assert records["second"]["concurrent_steps"] == ["first"]
+    assert records["first"]["python_alloc_peak_bytes"] is None
+    assert records["second"]["python_alloc_peak_bytes"] is None
+
+
+def test_stacks_of_the_slowest_step_are_kept():
+    profiler = StepProfiler(enabled=True, sample_stacks=True, sample_interval_s=0.001)
+
+    def slow_step():
+        time.sleep(0.1)
+
+    profiler.profile(load_step)()
+    profiler.profile(slow_step)()
+
+    stacks = profiler.report()["slowest_step_stacks"]
+    assert profiler.report()["slowest_step"] == "slow_step"
+    assert stacks["step"] == "slow_step" and stacks["samples"] > 0
+    assert any(stack.split(";")[-1].startswith("test_step_profiler.py:slow_step") for stack in stacks["collapsed"])
+
+
+def test_reports_from_several_processes_are_merged(tmp_path):
+    # One profiler per step process, all writing to the same report directory
+    for step in (load_step, allocating_step):
+        profiler = StepProfiler(enabled=True, report_dir=str(tmp_path))
+        profiler.profile(step)(10)
+
+    with open(tmp_path / "step_profile.json") as f:
+        report = json.load(f)
+    assert [record["step"] for record in report["records"]] == ["load_step", "allocating_step"]
+    html = (tmp_path / "step_profile.html").read_text()
+    assert "load_step" in html and "allocating_step" in html
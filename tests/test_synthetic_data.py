@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.synthetic_data import HousingSynthesizer, generate_housing_data
+
+
+@pytest.fixture(scope="module")
+def housing():
+    return generate_housing_data(3000, random_state=0)
+
+
+@pytest.fixture(scope="module")
+def synthetic(housing):
+    return HousingSynthesizer().fit(housing).sample(20_000, random_state=0)
+
+
+def test_samples_keep_columns_dtypes_and_ranges(housing, synthetic):
+    assert synthetic.columns.tolist() == housing.columns.tolist()
+    assert synthetic.dtypes.to_dict() == housing.dtypes.to_dict()
+    for column in housing.select_dtypes(include="number"):
+        assert housing[column].min() <= synthetic[column].min()
+        assert synthetic[column].max() <= housing[column].max()
+    assert set(synthetic["furnishingstatus"]) <= set(housing["furnishingstatus"])
+
+
+def test_samples_follow_the_marginals(housing, synthetic):
+    frequencies = housing["furnishingstatus"].value_counts(normalize=True)
+    sampled = synthetic["furnishingstatus"].value_counts(normalize=True)
+    np.testing.assert_allclose(sampled[frequencies.index], frequencies, atol=0.02)
+    assert synthetic["area"].median() == pytest.approx(housing["area"].median(), rel=0.03)
+
+
+def test_samples_keep_the_rank_correlations(housing, synthetic):
+    for a, b in (("area", "price"), ("bedrooms", "price")):
+        expected = housing[a].corr(housing[b], method="spearman")
+        assert synthetic[a].corr(synthetic[b], method="spearman") == pytest.approx(expected, abs=0.05)
+
+
+def test_sampling_is_seeded(housing):
+    synthesizer = HousingSynthesizer().fit(housing)
+    pd.testing.assert_frame_equal(synthesizer.sample(100, random_state=3), synthesizer.sample(100, random_state=3))